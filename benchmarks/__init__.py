@@ -0,0 +1,4 @@
+__author__ = "Nicolas Alejandro Diaz Acosta"
+__license__ = "GPL"
+__version__ = "1.0.0"
+__email__ = "nicolas.diazacost@campusucc.edu.co"
@@ -0,0 +1,53 @@
+__author__ = "Nicolas Alejandro Diaz Acosta"
+__license__ = "GPL"
+__version__ = "1.0.0"
+__email__ = "nicolas.diazacost@campusucc.edu.co"
+
+"""
+Mide el costo por jugada de JuegoAhorcado con alfabetos de distinto tamaño: español (27 letras),
+inglés (26), ruso (33) y uno propio de 40 letras. Cada partida juega todas las letras del
+alfabeto en orden sobre palabras aleatorias de ese alfabeto.
+Uso: python -m benchmarks.bench_alfabeto [cantidad de palabras]
+"""
+
+import random
+import sys
+import time
+
+from src.Alfabeto import Alfabeto, ESPANOL, INGLES
+from src.Diccionario import Diccionario
+from src.JuegoAhorcado import JuegoAhorcado
+
+RUSO = Alfabeto("ruso", "абвгдеёжзийклмнопрстуфхцчшщъыьэюя")
+PROPIO = Alfabeto("propio", RUSO.simbolos + "ǆǉǌǳșțæ")
+
+
+def medir(p_alfabeto: Alfabeto, p_cantidad: int) -> float:
+    """
+    :return: Microsegundos por jugada.
+    """
+    generador = random.Random(3)
+    diccionario = Diccionario(["".join(generador.choice(p_alfabeto.simbolos) for _ in range(8))
+                               for _ in range(p_cantidad)])
+    juego = JuegoAhorcado(diccionario, alfabeto=p_alfabeto)
+    # Se quitan los intentos para que todas las partidas jueguen el alfabeto completo
+    juego.MAX_INTENTOS = len(p_alfabeto) + 1
+    jugadas = 0
+    inicio = time.perf_counter()
+    for posicion in range(len(diccionario)):
+        juego.iniciar_con_posicion(posicion)
+        for letra in p_alfabeto.letras:
+            juego.jugar_letra(letra)
+        jugadas += len(juego.dar_jugadas())
+    return (time.perf_counter() - inicio) / jugadas * 1e6
+
+
+def main():
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    print(f"{'alfabeto':>10} {'letras':>7} {'us/jugada':>10}")
+    for alfabeto in (ESPANOL, INGLES, RUSO, PROPIO):
+        print(f"{alfabeto.nombre:>10} {len(alfabeto):>7} {medir(alfabeto, cantidad):>10.3f}")
+
+
+if __name__ == "__main__":
+    main()
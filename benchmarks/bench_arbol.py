@@ -0,0 +1,68 @@
+__author__ = "Nicolas Alejandro Diaz Acosta"
+__license__ = "GPL"
+__version__ = "1.0.0"
+__email__ = "nicolas.diazacost@campusucc.edu.co"
+
+"""
+Compara el tiempo por jugada de calcular la letra con el solucionador contra consultarla
+en el árbol de decisión precalculado, sobre los mismos estados del juego.
+Uso: python -m benchmarks.bench_arbol [cantidad de palabras]
+"""
+
+import os
+import sys
+import tempfile
+import time
+
+from benchmarks.bench_corpus import generar_lista
+from src.ArbolDecision import ArbolDecision, construir
+from src.CacheDiccionario import cargar_diccionario
+from src.JuegoAhorcado import JuegoAhorcado, Estado
+from src.Letra import Letra
+from src.Solucionador import Solucionador
+
+
+def main():
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    with tempfile.TemporaryDirectory() as carpeta:
+        ruta = os.path.join(carpeta, "palabras.txt")
+        generar_lista(ruta, cantidad)
+        diccionario = cargar_diccionario(ruta)
+
+        inicio = time.perf_counter()
+        arbol = ArbolDecision(construir(ruta), diccionario)
+        segundos_construir = time.perf_counter() - inicio
+
+        # Estados que recorren las partidas de todas las palabras
+        estados = []
+        juego = JuegoAhorcado(diccionario)
+        for posicion in range(len(diccionario)):
+            juego.iniciar_con_posicion(posicion)
+            while juego.dar_estado() == Estado.JUGANDO:
+                jugadas = [letra.dar_letra() for letra in juego.dar_jugadas()]
+                ultimo = juego.dar_intentos_disponibles() == 1
+                estados.append((list(juego.dar_ocurrencias()), jugadas, ultimo))
+                juego.jugar_letra(Letra(arbol.mejor_letra(juego.dar_ocurrencias(), jugadas, ultimo)))
+
+        # Un solucionador nuevo, sin decisiones recordadas, calcula cada estado en línea
+        solucionador = Solucionador(diccionario)
+        inicio = time.perf_counter()
+        for patron, jugadas, ultimo in estados:
+            solucionador.mejor_letra(patron, jugadas, ultimo)
+        segundos_solucionador = time.perf_counter() - inicio
+
+        inicio = time.perf_counter()
+        for patron, jugadas, ultimo in estados:
+            arbol.mejor_letra(patron, jugadas, ultimo)
+        segundos_arbol = time.perf_counter() - inicio
+        arbol.cerrar()
+
+    print(f"{len(diccionario)} palabras, {len(estados)} jugadas, {arbol.cantidad} estados distintos")
+    print(f"construcción del árbol: {segundos_construir:.1f} s")
+    print(f"solucionador: {segundos_solucionador / len(estados) * 1e6:>10.1f} µs/jugada")
+    print(f"árbol:        {segundos_arbol / len(estados) * 1e6:>10.1f} µs/jugada")
+    print(f"aceleración: {segundos_solucionador / segundos_arbol:.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+__author__ = "Nicolas Alejandro Diaz Acosta"
+__license__ = "GPL"
+__version__ = "1.0.0"
+__email__ = "nicolas.diazacost@campusucc.edu.co"
+
+"""
+Mide el tiempo de arranque con una lista de palabras grande: en frío (sin diccionario
+compilado, hay que procesar la lista) y en caliente (se mapea la caché).
+Cada arranque se hace en un proceso nuevo, como ocurre al lanzar src/main.py.
+Uso: python -m benchmarks.bench_arranque [cantidad de palabras]
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import time
+
+from benchmarks.bench_corpus import generar_lista
+from src.CacheDiccionario import cargar_diccionario
+
+
+def medir(p_ruta: str):
+    """
+    Carga el diccionario con caché, inicia un juego e imprime los segundos que tardó.
+    :param p_ruta: Lista de palabras.
+    """
+    from src.JuegoAhorcado import JuegoAhorcado
+
+    inicio = time.perf_counter()
+    JuegoAhorcado(cargar_diccionario(p_ruta)).iniciar_juego()
+    print(f"{time.perf_counter() - inicio:.4f}")
+
+
+def arrancar(p_ruta: str) -> float:
+    salida = subprocess.run(
+        [sys.executable, "-m", "benchmarks.bench_arranque", "--medir", p_ruta],
+        capture_output=True, text=True, check=True,
+    )
+    return float(salida.stdout)
+
+
+def main():
+    if len(sys.argv) == 3 and sys.argv[1] == "--medir":
+        medir(sys.argv[2])
+        return
+
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    with tempfile.TemporaryDirectory() as carpeta:
+        ruta = os.path.join(carpeta, "palabras.txt")
+        generar_lista(ruta, cantidad)
+
+        # El primer arranque no encuentra caché y la construye; los siguientes la reutilizan
+        frio = arrancar(ruta)
+        caliente = min(arrancar(ruta) for _ in range(3))
+
+        print(f"{cantidad} palabras")
+        print(f"arranque en frío:     {frio:.4f} s")
+        print(f"arranque en caliente: {caliente:.4f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,78 @@
+__author__ = "Nicolas Alejandro Diaz Acosta"
+__license__ = "GPL"
+__version__ = "1.0.0"
+__email__ = "nicolas.diazacost@campusucc.edu.co"
+
+"""
+Mide lo que cuesta registrar las partidas en una bitácora: el tiempo por jugada sin bitácora,
+con bitácora sin fsync y con fsync por grupo (de MAX_PENDIENTES registros o de 64), y la
+velocidad con la que se repite y se compacta la bitácora resultante.
+Uso: python -m benchmarks.bench_bitacora [partidas]
+"""
+
+import os
+import sys
+import tempfile
+import time
+from typing import Optional
+
+from src.Bitacora import Bitacora, compactar, repetir
+from src.Diccionario import Diccionario
+from src.JuegoAhorcado import JuegoAhorcado, Estado
+from src.Letra import Letra
+
+# Orden de letras fijo, parecido al de frecuencia del español
+LETRAS = [Letra(letra) for letra in "eaosrnidlctumpbgvyqhfzjñxkw"]
+
+
+def jugar(p_partidas: int, p_bitacora: Optional[Bitacora]) -> float:
+    """
+    Juega partidas en sesiones de 4 partidas cada una.
+    :return: Microsegundos por evento (inicios y jugadas).
+    """
+    diccionario = Diccionario.predeterminado()
+    eventos = 0
+    inicio = time.perf_counter()
+    for numero in range(p_partidas):
+        if numero % 4 == 0:
+            juego = JuegoAhorcado(diccionario, semilla=numero, bitacora=p_bitacora, sesion=numero // 4 + 1)
+        juego.iniciar_juego()
+        for letra in LETRAS:
+            juego.jugar_letra(letra)
+            if juego.estado is not Estado.JUGANDO:
+                break
+        eventos += len(juego.jugadas) + 1
+    if p_bitacora is not None:
+        p_bitacora.confirmar()
+    return (time.perf_counter() - inicio) / eventos * 1e6
+
+
+def main():
+    partidas = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    with tempfile.TemporaryDirectory() as carpeta:
+        ruta = os.path.join(carpeta, "bitacora.bin")
+        base = jugar(partidas, None)
+        print(f"{'configuración':>26} {'us/evento':>10} {'sobrecosto':>11}")
+        print(f"{'sin bitácora':>26} {base:>10.3f} {'':>11}")
+        for nombre, sincronizar, pendientes in (("sin fsync", False, 4096), ("fsync cada 4096", True, 4096),
+                                                 ("fsync cada 64", True, 64)):
+            if os.path.exists(ruta):
+                os.unlink(ruta)
+            bitacora = Bitacora(ruta, sincronizar, pendientes)
+            costo = jugar(partidas, bitacora)
+            bitacora.cerrar()
+            print(f"{nombre:>26} {costo:>10.3f} {(costo - base) / base:>10.0%}")
+
+        inicio = time.perf_counter()
+        estado = repetir(ruta)
+        segundos = time.perf_counter() - inicio
+        print(f"repetir: {estado.eventos} eventos, {len(estado)} sesiones en {segundos:.3f} s "
+              f"({estado.eventos / segundos:,.0f} eventos/s)")
+        antes = os.path.getsize(ruta)
+        inicio = time.perf_counter()
+        compactar(ruta)
+        print(f"compactar: {antes} -> {os.path.getsize(ruta)} bytes en {time.perf_counter() - inicio:.3f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,102 @@
+__author__ = "Nicolas Alejandro Diaz Acosta"
+__license__ = "GPL"
+__version__ = "1.0.0"
+__email__ = "nicolas.diazacost@campusucc.edu.co"
+
+"""
+Prueba de carga del juego compartido: muchos hilos (o tareas de asyncio) juegan letras al azar
+sobre la misma partida; el que ve la partida terminada pide otra palabra. Informa las jugadas
+por segundo, cuántas de ellas cambiaron la partida (las demás eran letras ya jugadas) y cuántas
+palabras se jugaron.
+Uso: python -m benchmarks.bench_compartido [jugadas por jugador]
+"""
+
+import asyncio
+import random
+import sys
+import threading
+import time
+
+from src.Diccionario import Diccionario
+from src.JuegoAhorcado import JuegoAhorcado, Estado
+from src.JuegoCompartido import JuegoCompartido
+from src.Letra import Letra
+
+LETRAS = [Letra(letra) for letra in "abcdefghijklmnñopqrstuvwxyz"]
+JUGADORES = [1, 16, 256]
+
+
+def jugar_varias(p_partida: JuegoCompartido, p_numero: int, p_jugadas: int) -> int:
+    """
+    :return: Cantidad de jugadas que cambiaron la partida.
+    """
+    generador = random.Random(p_numero)
+    nuevas = 0
+    for _ in range(p_jugadas):
+        resultado = p_partida.jugar(p_numero, generador.choice(LETRAS))
+        nuevas += resultado.nueva
+        if resultado.vista.estado != Estado.JUGANDO:
+            p_partida.iniciar_juego(p_version=resultado.vista.version)
+    return nuevas
+
+
+def medir_hilos(p_jugadores: int, p_jugadas: int):
+    partida = JuegoCompartido(JuegoAhorcado(Diccionario.predeterminado(), semilla=1))
+    partida.iniciar_juego()
+    primera = partida.vista.version
+    nuevas = [0] * p_jugadores
+    inicio_comun = threading.Barrier(p_jugadores + 1)
+
+    def jugador(p_numero):
+        inicio_comun.wait()
+        nuevas[p_numero] = jugar_varias(partida, p_numero, p_jugadas)
+
+    hilos = [threading.Thread(target=jugador, args=(numero,)) for numero in range(p_jugadores)]
+    for hilo in hilos:
+        hilo.start()
+    inicio_comun.wait()
+    inicio = time.perf_counter()
+    for hilo in hilos:
+        hilo.join()
+    return time.perf_counter() - inicio, sum(nuevas), partida.vista.version - primera
+
+
+def medir_tareas(p_jugadores: int, p_jugadas: int):
+    partida = JuegoCompartido(JuegoAhorcado(Diccionario.predeterminado(), semilla=1))
+    partida.iniciar_juego()
+    primera = partida.vista.version
+
+    async def jugador(p_numero):
+        generador = random.Random(p_numero)
+        nuevas = 0
+        for numero in range(p_jugadas):
+            resultado = partida.jugar(p_numero, generador.choice(LETRAS))
+            nuevas += resultado.nueva
+            if resultado.vista.estado != Estado.JUGANDO:
+                partida.iniciar_juego(p_version=resultado.vista.version)
+            if numero % 16 == 0:
+                # Cede el turno de vez en cuando, como lo haría un jugador que espera la red
+                await asyncio.sleep(0)
+        return nuevas
+
+    async def correr():
+        return await asyncio.gather(*(jugador(numero) for numero in range(p_jugadores)))
+
+    inicio = time.perf_counter()
+    nuevas = asyncio.run(correr())
+    return time.perf_counter() - inicio, sum(nuevas), partida.vista.version - primera
+
+
+def main():
+    jugadas = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    print(f"{'modo':>8} {'jugadores':>10} {'jugadas/s':>12} {'nuevas/s':>10} {'versiones':>10}")
+    for nombre, medir in (("hilos", medir_hilos), ("asyncio", medir_tareas)):
+        for jugadores in JUGADORES:
+            por_jugador = max(jugadas // jugadores, 200)
+            segundos, nuevas, versiones = medir(jugadores, por_jugador)
+            total = por_jugador * jugadores
+            print(f"{nombre:>8} {jugadores:>10} {total / segundos:>12,.0f} {nuevas / segundos:>10,.0f} {versiones:>10}")
+
+
+if __name__ == "__main__":
+    main()
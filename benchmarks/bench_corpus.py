@@ -0,0 +1,84 @@
+__author__ = "Nicolas Alejandro Diaz Acosta"
+__license__ = "GPL"
+__version__ = "1.0.0"
+__email__ = "nicolas.diazacost@campusucc.edu.co"
+
+"""
+Compara el tiempo de carga y la memoria (RSS máxima) de tres formas de tener el diccionario:
+una lista de objetos Palabra (el diseño original), el Diccionario cargado desde texto
+y el corpus empaquetado abierto con mmap.
+Cada medición se hace en un proceso aparte para que la memoria de una no afecte a la otra.
+Uso: python -m benchmarks.bench_corpus [cantidad de palabras]
+"""
+
+import os
+import random
+import resource
+import string
+import subprocess
+import sys
+import tempfile
+import time
+
+from src.Diccionario import Diccionario
+
+
+def generar_lista(p_ruta: str, p_cantidad: int):
+    """
+    Escribe una lista de palabras aleatorias, una por línea.
+    :param p_ruta: Archivo de salida.
+    :param p_cantidad: Número de palabras.
+    """
+    generador = random.Random(7)
+    with open(p_ruta, "w", encoding="utf-8") as archivo:
+        for _ in range(p_cantidad):
+            longitud = generador.randint(4, 12)
+            archivo.write("".join(generador.choice(string.ascii_lowercase) for _ in range(longitud)) + "\n")
+
+
+def medir(p_modo: str, p_ruta: str):
+    """
+    Carga el diccionario de la forma indicada e imprime el tiempo y la RSS máxima del proceso.
+    :param p_modo: "palabras", "texto" o "corpus".
+    :param p_ruta: Archivo a cargar.
+    """
+    # Se importa aquí para que la medición incluya solo lo que usa cada modo
+    from src.Palabra import Palabra
+
+    inicio = time.perf_counter()
+    if p_modo == "palabras":
+        with open(p_ruta, encoding="utf-8") as archivo:
+            cargado = [Palabra(linea.strip()) for linea in archivo]
+    else:
+        cargado = Diccionario.desde_archivo(p_ruta)
+    # Se lee una palabra para confirmar que el diccionario es utilizable
+    cargado[len(cargado) // 2]
+    segundos = time.perf_counter() - inicio
+    memoria = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(f"{segundos:.3f} {memoria:.1f}")
+
+
+def main():
+    if len(sys.argv) == 4 and sys.argv[1] == "--medir":
+        medir(sys.argv[2], sys.argv[3])
+        return
+
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 200000
+    with tempfile.TemporaryDirectory() as carpeta:
+        ruta_texto = os.path.join(carpeta, "palabras.txt")
+        ruta_corpus = os.path.join(carpeta, "palabras.corpus")
+        generar_lista(ruta_texto, cantidad)
+        Diccionario.desde_archivo(ruta_texto).corpus.guardar(ruta_corpus)
+
+        print(f"{cantidad} palabras")
+        print(f"{'modo':>10} {'carga (s)':>10} {'RSS (MB)':>10}")
+        for modo, ruta in (("palabras", ruta_texto), ("texto", ruta_texto), ("corpus", ruta_corpus)):
+            salida = subprocess.run(
+                [sys.executable, "-m", "benchmarks.bench_corpus", "--medir", modo, ruta],
+                capture_output=True, text=True, check=True,
+            ).stdout.split()
+            print(f"{modo:>10} {float(salida[0]):>10.3f} {float(salida[1]):>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+__author__ = "Nicolas Alejandro Diaz Acosta"
+__license__ = "GPL"
+__version__ = "1.0.0"
+__email__ = "nicolas.diazacost@campusucc.edu.co"
+
+"""
+Mide el costo de una jugada a medida que crece la longitud de la palabra.
+Se compara el estado incremental de JuegoAhorcado con recalcular el patrón
+y la condición de victoria desde cero en cada jugada.
+Uso: python -m benchmarks.bench_jugar_letra
+"""
+
+import string
+import time
+
+from src.JuegoAhorcado import JuegoAhorcado
+from src.Letra import Letra
+from src.Palabra import Palabra
+
+LONGITUDES = [32, 256, 2048, 16384]
+REPETICIONES = 200
+
+
+def construir_palabra(longitud: int) -> Palabra:
+    """
+    Construye una palabra de la longitud pedida en la que cada letra de la 'b' a la 'z'
+    aparece una sola vez y el resto se rellena con 'a'. Así cada jugada destapa una
+    única posición y solo cambia la longitud de la palabra.
+    :param longitud: Número de caracteres de la palabra.
+    :return: La palabra construida.
+    """
+    letras = string.ascii_lowercase[1:]
+    return Palabra("a" * (longitud - len(letras)) + letras)
+
+
+def medir_incremental(palabra: Palabra, jugadas) -> float:
+    juego = JuegoAhorcado()
+    inicio = time.perf_counter()
+    for _ in range(REPETICIONES):
+        juego.iniciar_con_palabra(palabra)
+        for letra in jugadas:
+            juego.jugar_letra(letra)
+            juego.dar_ocurrencias()
+    return (time.perf_counter() - inicio) / (REPETICIONES * len(jugadas))
+
+
+def medir_recalculando(palabra: Palabra, jugadas) -> float:
+    inicio = time.perf_counter()
+    for _ in range(REPETICIONES):
+        jugadas_hechas = []
+        for letra in jugadas:
+            jugadas_hechas.append(letra)
+            palabra.esta_completa(jugadas_hechas)
+            palabra.dar_ocurrencias(jugadas_hechas)
+    return (time.perf_counter() - inicio) / (REPETICIONES * len(jugadas))
+
+
+def main():
+    jugadas = [Letra(caracter) for caracter in string.ascii_lowercase[1:]]
+    print(f"{'longitud':>10} {'incremental (us)':>18} {'recalculando (us)':>18}")
+    for longitud in LONGITUDES:
+        palabra = construir_palabra(longitud)
+        incremental = medir_incremental(palabra, jugadas) * 1e6
+        recalculando = medir_recalculando(palabra, jugadas) * 1e6
+        print(f"{longitud:>10} {incremental:>18.2f} {recalculando:>18.2f}")
+
+
+if __name__ == "__main__":
+    main()
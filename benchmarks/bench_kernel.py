@@ -0,0 +1,60 @@
+__author__ = "Nicolas Alejandro Diaz Acosta"
+__license__ = "GPL"
+__version__ = "1.0.0"
+__email__ = "nicolas.diazacost@campusucc.edu.co"
+
+"""
+Compara el rendimiento del lote vectorizado con recorrer objetos JuegoAhorcado uno por uno.
+Ambos juegan las mismas partidas con las letras en orden de frecuencia.
+Uso: python -m benchmarks.bench_kernel [cantidad de partidas]
+"""
+
+import sys
+import time
+
+from src.Calendario import generar_calendario
+from src.Diccionario import Diccionario
+from src.JuegoAhorcado import JuegoAhorcado, Estado
+from src.KernelVectorizado import LoteJuegos
+from src.Letra import Letra
+from src.Simulacion import LETRAS_POR_FRECUENCIA
+
+
+def main():
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 20000
+    diccionario = Diccionario.predeterminado()
+    _, posiciones = generar_calendario(cantidad, 1, len(diccionario))
+
+    # Un objeto JuegoAhorcado por partida, jugando cada letra en todos ellos
+    juegos = []
+    for posicion in posiciones:
+        juego = JuegoAhorcado(diccionario)
+        juego.iniciar_con_posicion(posicion)
+        juegos.append(juego)
+    letras = [Letra(caracter) for caracter in LETRAS_POR_FRECUENCIA]
+    inicio = time.perf_counter()
+    jugadas_objetos = 0
+    for letra in letras:
+        for juego in juegos:
+            if juego.dar_estado() == Estado.JUGANDO:
+                juego.jugar_letra(letra)
+                jugadas_objetos += 1
+    segundos_objetos = time.perf_counter() - inicio
+
+    # Las mismas partidas en un lote
+    lote = LoteJuegos.desde_diccionario(diccionario, posiciones)
+    inicio = time.perf_counter()
+    jugadas_lote = 0
+    for caracter in LETRAS_POR_FRECUENCIA:
+        jugadas_lote += lote.en_juego()
+        lote.jugar(caracter)
+    segundos_lote = time.perf_counter() - inicio
+
+    print(f"{cantidad} partidas")
+    print(f"objetos: {jugadas_objetos / segundos_objetos:>14,.0f} jugadas/s")
+    print(f"lote:    {jugadas_lote / segundos_lote:>14,.0f} jugadas/s")
+    print(f"aceleración: {segundos_objetos / segundos_lote:.0f}x")
+
+
+if __name__ == "__main__":
+    main()
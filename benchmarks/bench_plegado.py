@@ -0,0 +1,78 @@
+__author__ = "Nicolas Alejandro Diaz Acosta"
+__license__ = "GPL"
+__version__ = "1.0.0"
+__email__ = "nicolas.diazacost@campusucc.edu.co"
+
+"""
+Compara el costo de comparar letras sin distinguir mayúsculas: llamando a lower() en cada
+comparación (el diseño original de es_igual) contra los identificadores de la tabla de plegado.
+También mide el costo de crear (obtener) la letra de un carácter.
+Uso: python -m benchmarks.bench_plegado [cantidad de comparaciones]
+"""
+
+import random
+import sys
+import time
+
+from src.Letra import Letra
+from src.Plegado import PLEGADO_MAYUSCULAS, PLEGADO_TILDES
+
+
+class LetraAnterior:
+    """
+    Las letras como se creaban antes de la tabla de plegado: un registro indexado por el
+    símbolo en minúscula, así que cada creación llamaba a lower().
+    """
+
+    _instancias = {}
+
+    def __new__(cls, p_letra: str):
+        simbolo = p_letra.lower()
+        instancia = cls._instancias.get(simbolo)
+        if instancia is None:
+            instancia = cls._instancias[simbolo] = super().__new__(cls)
+            instancia.letra = simbolo
+        return instancia
+
+    def __init__(self, p_letra: str):
+        pass
+
+    def es_igual(self, otra_letra: 'LetraAnterior') -> bool:
+        # es_igual original: pasaba a minúscula las dos letras en cada comparación
+        return self.letra.lower() == otra_letra.letra.lower()
+
+
+def medir(p_funcion, p_pares) -> float:
+    """
+    :return: Nanosegundos por llamada de p_funcion sobre cada par.
+    """
+    inicio = time.perf_counter()
+    for primero, segundo in p_pares:
+        p_funcion(primero, segundo)
+    return (time.perf_counter() - inicio) / len(p_pares) * 1e9
+
+
+def main():
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 1000000
+    generador = random.Random(1)
+    caracteres = "abcdefghijklmnñopqrstuvwxyzABCDEFGHIJKLMNÑOPQRSTUVWXYZáéíóúÁÉÍÓÚ"
+    pares = [(generador.choice(caracteres), generador.choice(caracteres)) for _ in range(cantidad)]
+    pares_letras = [(Letra(primero), Letra(segundo)) for primero, segundo in pares]
+    pares_anteriores = [(LetraAnterior(primero), LetraAnterior(segundo)) for primero, segundo in pares]
+
+    filas = [
+        ("caracteres con lower()", medir(lambda a, b: a.lower() == b.lower(), pares)),
+        ("caracteres con la tabla", medir(PLEGADO_MAYUSCULAS.son_iguales, pares)),
+        ("caracteres con la tabla y tildes", medir(PLEGADO_TILDES.son_iguales, pares)),
+        ("es_igual con lower()", medir(LetraAnterior.es_igual, pares_anteriores)),
+        ("es_igual con índices", medir(Letra.es_igual, pares_letras)),
+        ("crear letra con lower()", medir(lambda a, b: LetraAnterior(a), pares)),
+        ("crear letra con la tabla", medir(lambda a, b: Letra(a), pares)),
+    ]
+    print(f"{cantidad} pares de caracteres")
+    for nombre, nanosegundos in filas:
+        print(f"{nombre:<32} {nanosegundos:>8.1f} ns")
+
+
+if __name__ == "__main__":
+    main()
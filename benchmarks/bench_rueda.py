@@ -0,0 +1,101 @@
+__author__ = "Nicolas Alejandro Diaz Acosta"
+__license__ = "GPL"
+__version__ = "1.0.0"
+__email__ = "nicolas.diazacost@campusucc.edu.co"
+
+"""
+Mide la rueda de temporizadores con muchos vencimientos pendientes: el costo de programar,
+reprogramar (lo que hace cada jugada) y cancelar, comparado con un montículo (heapq) en el que
+cancelar obliga a buscar el elemento, y el costo de cobrar los vencimientos en lote.
+Uso: python -m benchmarks.bench_rueda
+"""
+
+import heapq
+import random
+import time
+
+from src.RuedaTemporizadores import RuedaTemporizadores
+
+PENDIENTES = [10000, 100000, 1000000]
+OPERACIONES = 100000
+
+
+class Reloj:
+    def __init__(self):
+        self.ahora = 0.0
+
+    def __call__(self):
+        return self.ahora
+
+
+def medir_rueda(p_pendientes: int):
+    """
+    :return: Microsegundos por programar, por reprogramar, por cancelar y por vencimiento cobrado.
+    """
+    generador = random.Random(1)
+    reloj = Reloj()
+    rueda = RuedaTemporizadores(0.01, reloj)
+    temporizadores = [rueda.programar(generador.uniform(1, 30)) for _ in range(p_pendientes)]
+
+    inicio = time.perf_counter()
+    nuevos = [rueda.programar(generador.uniform(1, 30)) for _ in range(OPERACIONES)]
+    programar = (time.perf_counter() - inicio) / OPERACIONES * 1e6
+
+    movidos = temporizadores[:OPERACIONES]
+    inicio = time.perf_counter()
+    for temporizador in movidos:
+        rueda.reprogramar(temporizador, 20.0)
+    reprogramar = (time.perf_counter() - inicio) / len(movidos) * 1e6
+
+    inicio = time.perf_counter()
+    for temporizador in nuevos:
+        rueda.cancelar(temporizador)
+    cancelar = (time.perf_counter() - inicio) / OPERACIONES * 1e6
+
+    # Se avanza tick a tick durante 31 segundos, como lo haría el servidor
+    pendientes = len(rueda)
+    inicio = time.perf_counter()
+    for _ in range(3100):
+        reloj.ahora += 0.01
+        rueda.avanzar()
+    vencer = (time.perf_counter() - inicio) / pendientes * 1e6
+    return programar, reprogramar, cancelar, vencer
+
+
+def medir_monticulo(p_pendientes: int):
+    """
+    :return: Microsegundos por programar y por cancelar (buscando el elemento) en un heapq.
+    """
+    generador = random.Random(1)
+    monticulo = [(generador.uniform(1, 30), numero) for numero in range(p_pendientes)]
+    heapq.heapify(monticulo)
+    inicio = time.perf_counter()
+    for numero in range(OPERACIONES):
+        heapq.heappush(monticulo, (generador.uniform(1, 30), p_pendientes + numero))
+    programar = (time.perf_counter() - inicio) / OPERACIONES * 1e6
+    # Cancelar en un montículo es buscar el elemento y volver a ordenar: con pocas cancelaciones
+    # basta para ver que crece con la cantidad de pendientes
+    cancelaciones = 50
+    inicio = time.perf_counter()
+    for _ in range(cancelaciones):
+        buscado = generador.randrange(p_pendientes)
+        indice = next(indice for indice, (_, numero) in enumerate(monticulo) if numero == buscado)
+        monticulo[indice] = monticulo[-1]
+        monticulo.pop()
+        heapq.heapify(monticulo)
+    cancelar = (time.perf_counter() - inicio) / cancelaciones * 1e6
+    return programar, cancelar
+
+
+def main():
+    print(f"{'pendientes':>10} {'programar':>10} {'reprogramar':>12} {'cancelar':>9} {'vencer':>7}"
+          f" | {'heap prog.':>10} {'heap canc.':>11}   (us/operación)")
+    for pendientes in PENDIENTES:
+        programar, reprogramar, cancelar, vencer = medir_rueda(pendientes)
+        programar_heap, cancelar_heap = medir_monticulo(pendientes)
+        print(f"{pendientes:>10} {programar:>10.3f} {reprogramar:>12.3f} {cancelar:>9.3f} {vencer:>7.3f}"
+              f" | {programar_heap:>10.3f} {cancelar_heap:>11.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+__author__ = "Nicolas Alejandro Diaz Acosta"
+__license__ = "GPL"
+__version__ = "1.0.0"
+__email__ = "nicolas.diazacost@campusucc.edu.co"
+
+"""
+Prueba de carga del servidor: lo levanta en otro proceso, abre varias conexiones, crea miles de
+sesiones repartidas entre ellas y juega todas las partidas a la vez, enviando una ronda de jugadas
+(una por sesión) por conexión y esperando sus respuestas. Informa sesiones y jugadas por segundo
+y la memoria residente del servidor.
+Uso: python -m benchmarks.bench_servidor [sesiones] [conexiones] [diccionario]
+"""
+
+import asyncio
+import subprocess
+import sys
+import time
+
+from src.Servidor import ClienteAhorcado
+
+LETRAS = "eaosrnidlctumpbgvyqhfzjñxkw"
+
+
+def memoria_residente(p_pid: int) -> int:
+    """
+    :return: Memoria residente del proceso, en KB (solo Linux).
+    """
+    with open(f"/proc/{p_pid}/status") as archivo:
+        for linea in archivo:
+            if linea.startswith("VmRSS:"):
+                return int(linea.split()[1])
+    return 0
+
+
+async def jugar_conexion(p_cliente: ClienteAhorcado, p_sesiones: int) -> int:
+    """
+    Crea las sesiones de una conexión y juega sus partidas por rondas hasta que todas terminen.
+    :return: Cantidad de jugadas enviadas.
+    """
+    respuestas = await p_cliente.enviar_lote([{"cmd": "start"}] * p_sesiones)
+    activas = [respuesta["sesion"] for respuesta in respuestas]
+    jugadas = 0
+    for letra in LETRAS:
+        if not activas:
+            break
+        respuestas = await p_cliente.enviar_lote([{"cmd": "guess", "sesion": sesion, "letra": letra} for sesion in activas])
+        jugadas += len(activas)
+        activas = [sesion for sesion, respuesta in zip(activas, respuestas) if respuesta.get("estado") == "JUGANDO"]
+    return jugadas
+
+
+async def medir(p_puerto: int, p_sesiones: int, p_conexiones: int):
+    clientes = [await ClienteAhorcado.conectar("127.0.0.1", p_puerto) for _ in range(p_conexiones)]
+    por_conexion = p_sesiones // p_conexiones
+    inicio = time.perf_counter()
+    jugadas = await asyncio.gather(*(jugar_conexion(cliente, por_conexion) for cliente in clientes))
+    segundos = time.perf_counter() - inicio
+    for cliente in clientes:
+        await cliente.cerrar()
+    return por_conexion * p_conexiones, sum(jugadas), segundos
+
+
+def main():
+    sesiones = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    conexiones = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    comando = [sys.executable, "-m", "src.Servidor", "--puerto", "0"]
+    if len(sys.argv) > 3:
+        comando += ["--diccionario", sys.argv[3]]
+    servidor = subprocess.Popen(comando, stdout=subprocess.PIPE, text=True)
+    try:
+        # La primera línea del servidor indica el puerto en el que quedó escuchando
+        puerto = int(servidor.stdout.readline().split(" en ")[1].split()[0].rsplit(":", 1)[1])
+        memoria_inicial = memoria_residente(servidor.pid)
+        creadas, jugadas, segundos = asyncio.run(medir(puerto, sesiones, conexiones))
+        memoria_final = memoria_residente(servidor.pid)
+    finally:
+        servidor.terminate()
+        servidor.wait()
+    print(f"sesiones simultáneas: {creadas} en {conexiones} conexiones")
+    print(f"jugadas: {jugadas} en {segundos:.2f} s ({jugadas / segundos:,.0f} jugadas/s, "
+          f"{(creadas + jugadas) / segundos:,.0f} mensajes/s)")
+    print(f"memoria del servidor: {memoria_inicial / 1024:.1f} MB -> {memoria_final / 1024:.1f} MB "
+          f"({(memoria_final - memoria_inicial) / creadas:.2f} KB por sesión)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+__author__ = "Nicolas Alejandro Diaz Acosta"
+__license__ = "GPL"
+__version__ = "1.0.0"
+__email__ = "nicolas.diazacost@campusucc.edu.co"
+
+"""
+Prueba de resistencia del almacén de sesiones: crea millones de sesiones, juega una letra en
+cada una y de vez en cuando vuelve a una sesión vieja (que ya está en disco). Con el máximo de
+sesiones en memoria fijo, la memoria residente del proceso debe quedarse plana.
+Uso: python -m benchmarks.bench_sesiones [sesiones] [máximo en memoria]
+"""
+
+import random
+import sys
+import time
+
+from src.Diccionario import Diccionario
+from src.JuegoAhorcado import JuegoAhorcado
+from src.Letra import Letra
+from src.Sesiones import AlmacenSesiones
+
+
+def memoria_residente() -> int:
+    """
+    :return: Memoria residente de este proceso, en KB (solo Linux).
+    """
+    with open("/proc/self/status") as archivo:
+        for linea in archivo:
+            if linea.startswith("VmRSS:"):
+                return int(linea.split()[1])
+    return 0
+
+
+def main():
+    cantidad = int(sys.argv[1]) if len(sys.argv) > 1 else 2000000
+    maximo = int(sys.argv[2]) if len(sys.argv) > 2 else 10000
+    diccionario = Diccionario.predeterminado()
+    almacen = AlmacenSesiones(lambda sesion: JuegoAhorcado(diccionario, semilla=sesion), maximo)
+    generador = random.Random(5)
+    letra = Letra("a")
+    reporte = max(cantidad // 10, 1)
+    inicio = time.perf_counter()
+    print(f"{'sesiones':>10} {'en memoria':>11} {'RSS (MB)':>9} {'sesiones/s':>11}")
+    try:
+        for numero in range(1, cantidad + 1):
+            sesion, juego = almacen.crear()
+            juego.iniciar_juego()
+            juego.jugar_letra(letra)
+            if numero % 16 == 0:
+                # Una de cada 16 vuelve a una sesión anterior, casi siempre desalojada
+                almacen.obtener(generador.randrange(1, sesion + 1)).jugar_letra(Letra("e"))
+            if numero % reporte == 0:
+                print(f"{numero:>10} {almacen.en_memoria():>11} {memoria_residente() / 1024:>9.1f} "
+                      f"{numero / (time.perf_counter() - inicio):>11,.0f}")
+        print(f"desalojadas: {almacen.desalojadas}, restauradas: {almacen.restauradas}")
+    finally:
+        almacen.cerrar()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,128 @@
+__author__ = "Nicolas Alejandro Diaz Acosta"
+__license__ = "GPL"
+__version__ = "1.0.0"
+__email__ = "nicolas.diazacost@campusucc.edu.co"
+
+from typing import Dict, List, Optional
+
+from src.Letra import Letra
+from src.Plegado import PLEGADO_MAYUSCULAS, PLEGADO_TILDES, TablaPlegado
+
+# Con hasta 64 símbolos las letras jugadas de una partida caben en un entero de 64 bits
+MAX_SIMBOLOS = 64
+
+
+class Alfabeto:
+    """
+    Clase que define las letras con las que se juega. Cada símbolo recibe un código denso
+    (0, 1, 2, ...), así el conjunto de letras jugadas de una partida es una máscara de bits
+    que cabe en una palabra de máquina, sea cual sea el idioma.
+    Los códigos de todas las Letra se calculan al construir el alfabeto: traducir una letra
+    a su código es una sola lectura de una lista, con el mismo costo en cualquier alfabeto.
+    """
+
+    def __init__(self, p_nombre: str, p_simbolos: str, p_plegado: TablaPlegado = PLEGADO_MAYUSCULAS):
+        """
+        Construye un alfabeto.
+        :param p_nombre: Nombre del alfabeto.
+        :param p_simbolos: Letras del alfabeto, en el orden del teclado.
+        :param p_plegado: Tabla que decide qué caracteres son la misma letra (por ejemplo,
+        PLEGADO_TILDES para que 'á' cuente como 'a').
+        :raise ValueError: Si hay letras repetidas o más de MAX_SIMBOLOS.
+        """
+        self.nombre = p_nombre
+        self.plegado = p_plegado
+        self.simbolos = "".join(p_plegado.dar_simbolo(p_plegado.dar_id(simbolo)) for simbolo in p_simbolos)
+        if len(set(self.simbolos)) != len(self.simbolos):
+            raise ValueError(f"El alfabeto {p_nombre} tiene letras repetidas")
+        if not 0 < len(self.simbolos) <= MAX_SIMBOLOS:
+            raise ValueError(f"Un alfabeto debe tener entre 1 y {MAX_SIMBOLOS} letras")
+
+        # Identificador del plegado -> código del alfabeto
+        self._codigos: Dict[int, int] = {p_plegado.dar_id(simbolo): codigo
+                                         for codigo, simbolo in enumerate(self.simbolos)}
+        # Letra de cada código, la forma canónica con la que se registran las jugadas
+        self.letras: List[Letra] = [Letra(simbolo) for simbolo in self.simbolos]
+        # Índice de Letra -> bit de su código (0 si la letra no es del alfabeto)
+        self._bits: List[int] = []
+        self._registrar(len(PLEGADO_MAYUSCULAS.simbolos) - 1)
+        self.mascara_completa = (1 << len(self.simbolos)) - 1
+
+    def _registrar(self, p_indice: int) -> int:
+        # Se calculan todos los índices que faltan hasta el pedido, no solo ese: una Letra creada
+        # antes pero consultada después también necesita su bit. La lista se reemplaza entera,
+        # así un hilo que consulta a la vez nunca la ve a medio llenar
+        bits = self._bits
+        if p_indice >= len(bits):
+            nuevos = []
+            for indice in range(len(bits), p_indice + 1):
+                codigo = self._codigos.get(self.plegado.dar_id(PLEGADO_MAYUSCULAS.dar_simbolo(indice)))
+                nuevos.append(1 << codigo if codigo is not None else 0)
+            bits = self._bits = bits + nuevos
+        return bits[p_indice]
+
+    def __len__(self) -> int:
+        return len(self.simbolos)
+
+    def __repr__(self) -> str:
+        return f"Alfabeto({self.nombre!r}, {self.simbolos!r})"
+
+    def bit_de(self, p_letra: Letra) -> int:
+        """
+        Devuelve el bit que representa una letra en las máscaras de este alfabeto.
+        :param p_letra: Letra a consultar.
+        :return: 1 << código de la letra, o 0 si la letra no es del alfabeto.
+        """
+        indice = p_letra.indice
+        if indice < len(self._bits):
+            return self._bits[indice]
+        # Letra creada después que el alfabeto (por ejemplo, de otro idioma)
+        return self._registrar(indice)
+
+    def codigo(self, p_caracter: str) -> Optional[int]:
+        """
+        Devuelve el código de un carácter.
+        :param p_caracter: Un carácter, en mayúscula o minúscula.
+        :return: El código de la letra, o None si no es del alfabeto.
+        """
+        return self._codigos.get(self.plegado.dar_id(p_caracter))
+
+    def es_valida(self, p_entrada: str) -> bool:
+        """
+        Indica si una entrada del usuario es exactamente una letra del alfabeto.
+        :param p_entrada: Texto ingresado.
+        :return: True si es una sola letra del alfabeto.
+        """
+        return len(p_entrada) == 1 and self.codigo(p_entrada) is not None
+
+    def dar_letra(self, p_codigo: int) -> Letra:
+        """
+        :param p_codigo: Código de una letra del alfabeto.
+        :return: La letra canónica de ese código.
+        """
+        return self.letras[p_codigo]
+
+    def dar_letras_de_mascara(self, p_mascara: int) -> List[Letra]:
+        """
+        Convierte una máscara de bits en la lista de sus letras.
+        :param p_mascara: Máscara con un bit por código.
+        :return: Letras cuyos bits están encendidos, en el orden del alfabeto.
+        """
+        return [letra for codigo, letra in enumerate(self.letras) if p_mascara >> codigo & 1]
+
+    def teclado(self) -> str:
+        """
+        Devuelve las letras en mayúscula, en el orden en que se muestran en el teclado.
+        :return: Texto con una letra por tecla.
+        """
+        return self.simbolos.upper()
+
+
+# Alfabetos predefinidos. En el español las vocales con tilde y la ü cuentan como la vocal sin marca.
+ESPANOL = Alfabeto("español", "abcdefghijklmnñopqrstuvwxyz", PLEGADO_TILDES)
+INGLES = Alfabeto("inglés", "abcdefghijklmnopqrstuvwxyz")
+
+ALFABETOS: Dict[str, Alfabeto] = {
+    "es": ESPANOL,
+    "en": INGLES,
+}
@@ -0,0 +1,296 @@
+__author__ = "Nicolas Alejandro Diaz Acosta"
+__license__ = "GPL"
+__version__ = "1.0.0"
+__email__ = "nicolas.diazacost@campusucc.edu.co"
+
+import argparse
+import hashlib
+import mmap
+import os
+import struct
+import sys
+import tempfile
+import time
+from array import array
+from typing import Dict, Iterable, Optional, Sequence
+
+from src.Alfabeto import Alfabeto, ESPANOL
+from src.CacheDiccionario import CARPETA_CACHE, cargar_diccionario, ruta_cache
+from src.Diccionario import Diccionario
+from src.JuegoAhorcado import JuegoAhorcado, Estado
+from src.Letra import Letra
+from src.Solucionador import Solucionador
+
+# Formato del archivo (little-endian):
+#   encabezado: firma, versión, reservado, capacidad de la tabla, estados guardados, huella del diccionario
+#               y huella del alfabeto con el que se jugó
+#   claves: capacidad enteros de 64 bits (0 = casilla vacía)
+#   letras: capacidad enteros de 32 bits con el código Unicode de la letra sugerida
+# La tabla usa direccionamiento abierto con sondeo lineal y capacidad potencia de 2.
+FIRMA = b"AHAD"
+# Versión 2: las letras se sugieren plegadas con el alfabeto (antes se podía sugerir una "í" ya jugada como "i")
+# Versión 3: la clave incluye si queda un solo intento y el encabezado guarda el alfabeto
+VERSION = 3
+ENCABEZADO = struct.Struct("<4sHHII32s32s")
+
+
+def huella_diccionario(p_diccionario: Diccionario) -> bytes:
+    """
+    Calcula una huella del contenido de un diccionario, para saber si un árbol fue
+    construido con él.
+    :param p_diccionario: Diccionario a resumir.
+    :return: Los 32 bytes del SHA-256 de sus palabras y su tabla de desplazamientos.
+    """
+    resumen = hashlib.sha256()
+    resumen.update(p_diccionario.corpus.datos)
+    resumen.update(array("I", p_diccionario.corpus.desplazamientos).tobytes())
+    return resumen.digest()
+
+
+def huella_alfabeto(p_alfabeto: Alfabeto) -> bytes:
+    """
+    Calcula una huella de un alfabeto: sus letras y si se juega sin tildes.
+    :param p_alfabeto: Alfabeto a resumir.
+    :return: Los 32 bytes del SHA-256.
+    """
+    texto = p_alfabeto.simbolos + "|" + ("1" if p_alfabeto.plegado.quitar_tildes else "0")
+    return hashlib.sha256(texto.encode("utf-8")).digest()
+
+
+def clave_estado(p_patron: Sequence[str], p_jugadas: Iterable[str], p_ultimo_intento: bool = False) -> int:
+    """
+    Calcula la clave de 64 bits de un estado del juego. La letra del solucionador depende del
+    patrón, de las letras jugadas y de si queda un solo intento; esto último no se deduce de las
+    jugadas, porque los turnos vencidos gastan intentos sin jugar letras.
+    :param p_patron: Ocurrencias, con "_" en las posiciones ocultas.
+    :param p_jugadas: Letras ya jugadas.
+    :param p_ultimo_intento: Si solo queda un intento.
+    :return: Clave distinta de 0.
+    """
+    texto = ("".join(p_patron) + "|" + "".join(sorted(simbolo.lower() for simbolo in p_jugadas))
+             + ("|1" if p_ultimo_intento else "")).encode("utf-8")
+    clave = int.from_bytes(hashlib.blake2b(texto, digest_size=8).digest(), "little")
+    return clave or 1
+
+
+def ruta_arbol(p_ruta_origen: str) -> str:
+    """
+    Devuelve la ruta del árbol de decisión de una lista de palabras, junto a su caché.
+    :param p_ruta_origen: Ruta de la lista de palabras.
+    :return: Ruta del archivo del árbol.
+    """
+    return ruta_cache(p_ruta_origen)[:-len(".corpus")] + ".arbol"
+
+
+def calcular_decisiones(p_diccionario: Diccionario, p_solucionador: Optional[Solucionador] = None,
+                        p_alfabeto: Alfabeto = ESPANOL) -> Dict[int, str]:
+    """
+    Recorre todos los estados a los que llega el solucionador jugando cada palabra del
+    diccionario y anota la letra que sugiere en cada uno. Como los turnos vencidos pueden dejar
+    cualquier estado con un solo intento, de cada estado se anota también esa variante.
+    :param p_diccionario: Diccionario completo.
+    :param p_solucionador: Solucionador a usar (por defecto, uno nuevo para el diccionario); manda su alfabeto.
+    :param p_alfabeto: Alfabeto con el que se juega, si no se da el solucionador.
+    :return: Diccionario clave de estado -> letra sugerida.
+    """
+    solucionador = p_solucionador if p_solucionador is not None else Solucionador(p_diccionario, p_alfabeto=p_alfabeto)
+    decisiones: Dict[int, str] = {}
+    juego = JuegoAhorcado(p_diccionario, alfabeto=solucionador.alfabeto)
+    for posicion in range(len(p_diccionario)):
+        juego.iniciar_con_posicion(posicion)
+        while juego.dar_estado() == Estado.JUGANDO:
+            patron = juego.dar_ocurrencias()
+            jugadas = [letra.dar_letra() for letra in juego.dar_jugadas()]
+            ultimo_intento = juego.dar_intentos_disponibles() == 1
+            for ultimo in (ultimo_intento, True):
+                clave = clave_estado(patron, jugadas, ultimo)
+                if clave not in decisiones:
+                    simbolo = solucionador.mejor_letra(patron, jugadas, ultimo)
+                    if simbolo is not None:
+                        decisiones[clave] = simbolo
+            simbolo = decisiones.get(clave_estado(patron, jugadas, ultimo_intento))
+            if simbolo is None:
+                break
+            juego.jugar_letra(Letra(simbolo))
+    return decisiones
+
+
+def escribir_arbol(p_ruta: str, p_decisiones: Dict[int, str], p_huella: bytes, p_alfabeto: Alfabeto = ESPANOL):
+    """
+    Guarda las decisiones como tabla hash en disco, de forma atómica.
+    :param p_ruta: Archivo a crear.
+    :param p_decisiones: Clave de estado -> letra sugerida.
+    :param p_huella: Huella del diccionario con el que se calcularon.
+    :param p_alfabeto: Alfabeto con el que se calcularon.
+    """
+    capacidad = 1 << max(4, (2 * len(p_decisiones)).bit_length())
+    claves = array("Q", bytes(8 * capacidad))
+    letras = array("I", bytes(4 * capacidad))
+    for clave, simbolo in p_decisiones.items():
+        casilla = clave & (capacidad - 1)
+        while claves[casilla]:
+            casilla = (casilla + 1) & (capacidad - 1)
+        claves[casilla] = clave
+        letras[casilla] = ord(simbolo)
+    if sys.byteorder != "little":
+        claves.byteswap()
+        letras.byteswap()
+
+    carpeta = os.path.dirname(os.path.abspath(p_ruta))
+    os.makedirs(carpeta, exist_ok=True)
+    descriptor, temporal = tempfile.mkstemp(dir=carpeta, suffix=".tmp")
+    try:
+        with os.fdopen(descriptor, "wb") as archivo:
+            archivo.write(ENCABEZADO.pack(FIRMA, VERSION, 0, capacidad, len(p_decisiones), p_huella,
+                                            huella_alfabeto(p_alfabeto)))
+            archivo.write(claves.tobytes())
+            archivo.write(letras.tobytes())
+            archivo.flush()
+            os.fsync(archivo.fileno())
+        os.replace(temporal, p_ruta)
+    except BaseException:
+        os.unlink(temporal)
+        raise
+
+
+class ArbolDecision:
+    """
+    Clase que consulta un árbol de decisión precalculado: la letra del solucionador para
+    cada estado alcanzable, guardada en una tabla hash mapeada en memoria.
+    Cada consulta es un hash del estado y unas pocas lecturas de la tabla.
+    """
+
+    def __init__(self, p_ruta: str, p_diccionario: Optional[Diccionario] = None, p_alfabeto: Optional[Alfabeto] = None):
+        """
+        Abre un árbol guardado en disco.
+        :param p_ruta: Ruta del archivo del árbol.
+        :param p_diccionario: Si se indica, se verifica que el árbol corresponda a él.
+        :param p_alfabeto: Si se indica, se verifica que el árbol se haya construido con él.
+        :raise ValueError: Si el archivo no es válido o fue construido con otro diccionario u otro alfabeto.
+        """
+        with open(p_ruta, "rb") as archivo:
+            self._mapa = mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._mapa) < ENCABEZADO.size:
+            self._mapa.close()
+            raise ValueError(f"{p_ruta} no es un árbol de decisión válido")
+        firma, version, _, capacidad, cantidad, huella, alfabeto = ENCABEZADO.unpack_from(self._mapa, 0)
+        if firma != FIRMA or version != VERSION or len(self._mapa) < ENCABEZADO.size + 12 * capacidad:
+            self._mapa.close()
+            raise ValueError(f"{p_ruta} no es un árbol de decisión válido o es de otra versión")
+        if p_diccionario is not None and huella != huella_diccionario(p_diccionario):
+            self._mapa.close()
+            raise ValueError(f"{p_ruta} fue construido con otro diccionario; hay que reconstruirlo")
+        if p_alfabeto is not None and alfabeto != huella_alfabeto(p_alfabeto):
+            self._mapa.close()
+            raise ValueError(f"{p_ruta} fue construido con otro alfabeto; hay que reconstruirlo")
+
+        self.capacidad = capacidad
+        self.cantidad = cantidad
+        self.huella = huella
+        self.huella_alfabeto = alfabeto
+        # Último alfabeto que se comprobó en sugerir, para no recalcular su huella en cada jugada
+        self._alfabeto_verificado: Optional[Alfabeto] = p_alfabeto
+        vista = memoryview(self._mapa)
+        inicio_letras = ENCABEZADO.size + 8 * capacidad
+        if sys.byteorder == "little":
+            self.claves = vista[ENCABEZADO.size:inicio_letras].cast("Q")
+            self.letras = vista[inicio_letras:inicio_letras + 4 * capacidad].cast("I")
+        else:
+            self.claves = array("Q", vista[ENCABEZADO.size:inicio_letras].tobytes())
+            self.letras = array("I", vista[inicio_letras:inicio_letras + 4 * capacidad].tobytes())
+            self.claves.byteswap()
+            self.letras.byteswap()
+
+    def mejor_letra(self, p_patron: Sequence[str], p_jugadas: Iterable[str],
+                    p_ultimo_intento: bool = False) -> Optional[str]:
+        """
+        Busca la letra precalculada para un estado.
+        :param p_patron: Ocurrencias, con "_" en las posiciones ocultas.
+        :param p_jugadas: Letras ya jugadas.
+        :param p_ultimo_intento: Si solo queda un intento.
+        :return: La letra sugerida, o None si el estado no está en el árbol.
+        """
+        clave = clave_estado(p_patron, p_jugadas, p_ultimo_intento)
+        mascara = self.capacidad - 1
+        casilla = clave & mascara
+        while True:
+            guardada = self.claves[casilla]
+            if guardada == clave:
+                return chr(self.letras[casilla])
+            if guardada == 0:
+                return None
+            casilla = (casilla + 1) & mascara
+
+    def sugerir(self, p_juego: JuegoAhorcado) -> Optional[Letra]:
+        """
+        Sugiere la siguiente letra para un juego en curso usando solo sus datos públicos.
+        :param p_juego: Juego en curso.
+        :return: La letra sugerida, o None si el estado no está en el árbol.
+        :raise ValueError: Si el juego usa otro alfabeto que el del árbol.
+        """
+        if p_juego.alfabeto is not self._alfabeto_verificado:
+            if huella_alfabeto(p_juego.alfabeto) != self.huella_alfabeto:
+                raise ValueError(f"El árbol no se construyó con el alfabeto {p_juego.alfabeto.nombre}")
+            self._alfabeto_verificado = p_juego.alfabeto
+        simbolo = self.mejor_letra(p_juego.dar_ocurrencias(), [letra.dar_letra() for letra in p_juego.dar_jugadas()],
+                                   p_juego.dar_intentos_disponibles() == 1)
+        return Letra(simbolo) if simbolo is not None else None
+
+    def cerrar(self):
+        """
+        Libera el mapa de memoria.
+        """
+        if isinstance(self.claves, memoryview):
+            self.claves.release()
+            self.letras.release()
+        self._mapa.close()
+
+
+def construir(p_ruta_origen: str, p_ruta_destino: Optional[str] = None, p_alfabeto: Alfabeto = ESPANOL) -> str:
+    """
+    Construye el árbol de decisión de una lista de palabras y lo guarda junto a su caché.
+    :param p_ruta_origen: Lista de palabras (texto plano o .gz).
+    :param p_ruta_destino: Archivo de salida; por defecto, junto al diccionario compilado.
+    :param p_alfabeto: Alfabeto con el que se juega.
+    :return: Ruta del árbol construido.
+    """
+    diccionario = cargar_diccionario(p_ruta_origen)
+    destino = p_ruta_destino if p_ruta_destino is not None else ruta_arbol(p_ruta_origen)
+    escribir_arbol(destino, calcular_decisiones(diccionario, p_alfabeto=p_alfabeto), huella_diccionario(diccionario),
+                   p_alfabeto)
+    return destino
+
+
+def abrir(p_ruta_origen: str, p_alfabeto: Alfabeto = ESPANOL) -> ArbolDecision:
+    """
+    Abre el árbol de una lista de palabras, reconstruyéndolo si falta o si cambió el diccionario o el alfabeto.
+    :param p_ruta_origen: Lista de palabras (texto plano o .gz).
+    :param p_alfabeto: Alfabeto con el que se juega.
+    :return: El árbol listo para consultar.
+    """
+    diccionario = cargar_diccionario(p_ruta_origen)
+    try:
+        return ArbolDecision(ruta_arbol(p_ruta_origen), diccionario, p_alfabeto)
+    except (OSError, ValueError):
+        return ArbolDecision(construir(p_ruta_origen, p_alfabeto=p_alfabeto), diccionario, p_alfabeto)
+
+
+def main():
+    """
+    Reconstruye el árbol de decisión de una lista de palabras.
+    Uso: python -m src.ArbolDecision palabras.txt [--salida archivo.arbol]
+    """
+    analizador = argparse.ArgumentParser(description="Construye el árbol de decisión del solucionador")
+    analizador.add_argument("lista", help="Lista de palabras (texto plano o .gz)")
+    analizador.add_argument("--salida", help=f"Archivo de salida (por defecto, en {CARPETA_CACHE})")
+    argumentos = analizador.parse_args()
+
+    inicio = time.perf_counter()
+    destino = construir(argumentos.lista, argumentos.salida)
+    arbol = ArbolDecision(destino)
+    print(f"{arbol.cantidad} estados guardados en {destino} ({time.perf_counter() - inicio:.1f} s)")
+    arbol.cerrar()
+
+
+if __name__ == "__main__":
+    main()
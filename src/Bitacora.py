@@ -0,0 +1,371 @@
+__author__ = "Nicolas Alejandro Diaz Acosta"
+__license__ = "GPL"
+__version__ = "1.0.0"
+__email__ = "nicolas.diazacost@campusucc.edu.co"
+
+import argparse
+import os
+import struct
+import sys
+import tempfile
+import time
+from typing import Callable, Optional
+
+import numpy as np
+
+from src.JuegoAhorcado import JuegoAhorcado, Estado
+
+# Formato del archivo: un encabezado y luego registros de tamaño fijo, solo agregados al final.
+#   Encabezado (16 bytes): firma, versión, tamaño de registro, semilla maestra (u64) de las sesiones,
+#                          para que al recuperarlas sigan sorteando las mismas palabras
+#   Registro (16 bytes):   sesión (u32), secuencia (u32), tipo (u8), símbolo (u8), resultado (u8),
+#                          estado (u8), valor (u32)
+# Significado de los campos según el tipo de registro:
+#   INICIO:  secuencia = partidas iniciadas por la sesión, resultado = intentos, valor = posición de la palabra
+#   JUGADA:  secuencia = número de jugada en la partida, símbolo = código de la letra en el alfabeto,
+#            resultado = 1 si acertó, valor = intentos que quedan
+#   RESUMEN: secuencia y valor = mitades baja y alta de la máscara de letras jugadas,
+#            resultado = intentos que quedan (lo escribe la compactación después del INICIO de una
+#            partida terminada, en lugar de sus jugadas)
+#   CIERRE:  la sesión se eliminó
+#   VENCIMIENTO: se acabó el tiempo de una jugada; secuencia = jugadas hechas, valor = intentos que quedan
+# En todos los registros, estado es el valor de Estado después del evento.
+FIRMA = b"AHBT"
+VERSION = 2
+ENCABEZADO = struct.Struct("<4sHHQ")
+REGISTRO = struct.Struct("<IIBBBBI")
+TIPO_REGISTRO = np.dtype([("sesion", "<u4"), ("secuencia", "<u4"), ("tipo", "u1"), ("simbolo", "u1"),
+                          ("resultado", "u1"), ("estado", "u1"), ("valor", "<u4")])
+
+INICIO = 1
+JUGADA = 2
+RESUMEN = 3
+CIERRE = 4
+VENCIMIENTO = 5
+
+# Posición con la que se registra una partida cuya palabra no viene del diccionario
+SIN_PALABRA = 0xFFFFFFFF
+# Registros que se acumulan en memoria antes de escribirlos aunque nadie llame a confirmar()
+MAX_PENDIENTES = 4096
+
+
+class Bitacora:
+    """
+    Clase que registra los eventos de las partidas en un archivo de solo agregado.
+    Los registros se acumulan en memoria y se escriben en grupo: confirmar() los escribe todos
+    con una sola llamada al sistema y un solo fsync, así el costo de sincronizar el disco se
+    reparte entre todas las jugadas del grupo. Quien necesite que una jugada sea durable antes de
+    responder (por ejemplo el servidor) debe llamar a confirmar() antes de responderla.
+    """
+
+    def __init__(self, p_ruta: str, p_sincronizar: bool = True, p_max_pendientes: int = MAX_PENDIENTES,
+                 p_semilla: int = 0):
+        """
+        Abre una bitácora para agregarle eventos, creándola si no existe. Si el archivo termina
+        en un registro incompleto (por una caída a mitad de una escritura), se descarta.
+        :param p_ruta: Ruta del archivo.
+        :param p_sincronizar: Si confirmar() hace fsync; sin él los datos quedan en la caché del sistema.
+        :param p_max_pendientes: Registros que se acumulan antes de escribirlos solos.
+        :param p_semilla: Semilla maestra que se guarda en el encabezado si la bitácora es nueva; si ya
+        existía, se conserva la suya (queda en el atributo semilla).
+        :raise ValueError: Si el archivo existe y no es una bitácora válida.
+        """
+        self.ruta = p_ruta
+        self.sincronizar = p_sincronizar
+        self._descriptor = os.open(p_ruta, os.O_RDWR | os.O_CREAT, 0o644)
+        try:
+            tamano = os.fstat(self._descriptor).st_size
+            if tamano == 0:
+                os.write(self._descriptor, ENCABEZADO.pack(FIRMA, VERSION, REGISTRO.size, p_semilla))
+                self.semilla = p_semilla
+            else:
+                self.semilla = validar_encabezado(os.pread(self._descriptor, ENCABEZADO.size, 0), p_ruta)
+                sobrante = (tamano - ENCABEZADO.size) % REGISTRO.size
+                if sobrante:
+                    os.ftruncate(self._descriptor, tamano - sobrante)
+            os.lseek(self._descriptor, 0, os.SEEK_END)
+        except BaseException:
+            os.close(self._descriptor)
+            raise
+        self._pendientes = bytearray(REGISTRO.size * p_max_pendientes)
+        self._usados = 0
+        self.registros = 0                            # Registros agregados desde que se abrió
+        self.confirmaciones = 0                       # Grupos escritos
+
+    def registrar(self, p_sesion: int, p_secuencia: int, p_tipo: int, p_simbolo: int, p_resultado: int,
+                  p_estado: int, p_valor: int):
+        """
+        Agrega un registro al grupo pendiente.
+        """
+        REGISTRO.pack_into(self._pendientes, self._usados, p_sesion, p_secuencia, p_tipo, p_simbolo, p_resultado,
+                           p_estado, p_valor)
+        self._usados += REGISTRO.size
+        self.registros += 1
+        if self._usados == len(self._pendientes):
+            self.confirmar()
+
+    def registrar_inicio(self, p_sesion: int, p_juego: JuegoAhorcado):
+        posicion = p_juego.dar_posicion_actual()
+        self.registrar(p_sesion, p_juego.partidas, INICIO, 0, p_juego.dar_intentos_disponibles(),
+                       p_juego.estado._value_, SIN_PALABRA if posicion is None else posicion)
+
+    def registrar_jugada(self, p_sesion: int, p_juego: JuegoAhorcado, p_bit: int, p_acierto: bool):
+        # Es el camino de cada jugada: se empaqueta directamente, sin pasar por registrar(), y el
+        # estado se lee de _value_ (Estado.value es una propiedad, varias veces más lenta)
+        REGISTRO.pack_into(self._pendientes, self._usados, p_sesion, len(p_juego.jugadas), JUGADA,
+                           p_bit.bit_length() - 1, p_acierto, p_juego.estado._value_,
+                           p_juego.intentos_disponibles)
+        self._usados += REGISTRO.size
+        self.registros += 1
+        if self._usados == len(self._pendientes):
+            self.confirmar()
+
+    def registrar_vencimiento(self, p_sesion: int, p_juego: JuegoAhorcado):
+        self.registrar(p_sesion, len(p_juego.jugadas), VENCIMIENTO, 0, 0, p_juego.estado._value_,
+                       p_juego.intentos_disponibles)
+
+    def registrar_cierre(self, p_sesion: int):
+        self.registrar(p_sesion, 0, CIERRE, 0, 0, 0, 0)
+
+    def confirmar(self):
+        """
+        Escribe los registros pendientes y, si se pidió, los sincroniza con el disco.
+        """
+        if self._usados == 0:
+            return
+        vista = memoryview(self._pendientes)[:self._usados]
+        while vista:
+            vista = vista[os.write(self._descriptor, vista):]
+        if self.sincronizar:
+            os.fsync(self._descriptor)
+        self._usados = 0
+        self.confirmaciones += 1
+
+    def cerrar(self):
+        if self._descriptor is not None:
+            try:
+                self.confirmar()
+            finally:
+                os.close(self._descriptor)
+                self._descriptor = None
+
+
+def validar_encabezado(p_datos: bytes, p_ruta: str) -> int:
+    """
+    Verifica el encabezado de una bitácora.
+    :return: La semilla maestra guardada en él.
+    :raise ValueError: Si no es una bitácora de esta versión.
+    """
+    if len(p_datos) < ENCABEZADO.size:
+        raise ValueError(f"{p_ruta} no es una bitácora: encabezado incompleto")
+    firma, version, tamano_registro, semilla = ENCABEZADO.unpack_from(p_datos)
+    if firma != FIRMA or version != VERSION or tamano_registro != REGISTRO.size:
+        raise ValueError(f"{p_ruta} no es una bitácora de la versión {VERSION}")
+    return semilla
+
+
+def leer_semilla(p_ruta: str) -> int:
+    """
+    :param p_ruta: Ruta de una bitácora.
+    :return: La semilla maestra de sus sesiones.
+    :raise ValueError: Si el archivo no es una bitácora válida.
+    """
+    with open(p_ruta, "rb") as archivo:
+        return validar_encabezado(archivo.read(ENCABEZADO.size), p_ruta)
+
+
+def leer_registros(p_ruta: str) -> np.ndarray:
+    """
+    Lee todos los registros completos de una bitácora.
+    :param p_ruta: Ruta del archivo.
+    :return: Arreglo estructurado con TIPO_REGISTRO, en el orden en que se agregaron.
+    :raise ValueError: Si el archivo no es una bitácora válida.
+    """
+    with open(p_ruta, "rb") as archivo:
+        tamano = os.fstat(archivo.fileno()).st_size
+        validar_encabezado(archivo.read(ENCABEZADO.size), p_ruta)
+        cantidad = (tamano - ENCABEZADO.size) // REGISTRO.size
+        # Un registro incompleto al final (escritura interrumpida) no se lee
+        return np.fromfile(archivo, dtype=TIPO_REGISTRO, count=cantidad)
+
+
+class EstadoRepetido:
+    """
+    Clase con el estado final de todas las sesiones de una bitácora, en arreglos paralelos
+    ordenados por sesión. Las sesiones cerradas no aparecen.
+    """
+
+    def __init__(self, p_registros: np.ndarray):
+        """
+        Repite los eventos. No hay un ciclo por evento: los registros se agrupan por sesión con un
+        ordenamiento estable y cada campo del estado se obtiene con una operación sobre arreglos:
+        la partida vigente empieza en el último INICIO, su máscara es el O de las letras jugadas
+        desde ahí y los intentos y el estado son los del último registro.
+        :param p_registros: Registros leídos con leer_registros.
+        """
+        self.eventos = len(p_registros)
+        # Mayor sesión registrada, incluidas las cerradas
+        self.mayor_sesion = int(p_registros["sesion"].max()) if len(p_registros) else 0
+        # Registros agrupados por sesión; dentro de cada sesión quedan en el orden en que se agregaron
+        self.registros = p_registros[np.argsort(p_registros["sesion"], kind="stable")]
+        cantidad = len(self.registros)
+        sesiones = self.registros["sesion"]
+        tipos = self.registros["tipo"]
+        # Límites del tramo de cada sesión y sesión (como número de grupo) de cada registro
+        cortes = np.flatnonzero(sesiones[1:] != sesiones[:-1]) + 1
+        primeros = np.concatenate(([0], cortes)).astype(np.intp) if cantidad else np.zeros(0, dtype=np.intp)
+        ultimos = np.concatenate((cortes, [cantidad])).astype(np.intp) - 1 if cantidad else primeros
+        self.grupo = np.repeat(np.arange(len(primeros)), ultimos - primeros + 1)
+
+        # Último INICIO de cada sesión; queda antes del principio de su tramo si no tiene ninguno
+        indices = np.arange(cantidad)
+        ultimo_inicio = np.maximum.accumulate(np.where(tipos == INICIO, indices, -1))[ultimos] if cantidad else \
+            primeros
+        # Registros de la partida vigente de su sesión
+        self.vigente = indices >= ultimo_inicio[self.grupo]
+
+        # Bits de la partida vigente: uno por jugada, o la máscara completa de un RESUMEN
+        bits = np.where(tipos == JUGADA, np.uint64(1) << self.registros["simbolo"].astype(np.uint64), np.uint64(0))
+        resumen = tipos == RESUMEN
+        bits[resumen] = self.registros["secuencia"][resumen].astype(np.uint64) | \
+            (self.registros["valor"][resumen].astype(np.uint64) << np.uint64(32))
+        bits[~self.vigente] = 0
+        mascaras = np.bitwise_or.reduceat(bits, primeros) if cantidad else np.zeros(0, dtype=np.uint64)
+
+        # El último registro dice si la sesión sigue viva, cuántos intentos le quedan y su estado
+        finales = self.registros[ultimos]
+        self.vivas = (finales["tipo"] != CIERRE) & (ultimo_inicio >= primeros)
+        intentos = np.where((finales["tipo"] == JUGADA) | (finales["tipo"] == VENCIMIENTO), finales["valor"],
+                            finales["resultado"])
+        inicios = self.registros[ultimo_inicio[self.vivas]]
+
+        self.sesiones = sesiones[ultimos][self.vivas]
+        self.posiciones = inicios["valor"]
+        self.partidas = inicios["secuencia"]
+        self.mascaras = mascaras[self.vivas]
+        self.intentos = intentos[self.vivas].astype(np.uint8)
+        self.estados = finales["estado"][self.vivas]
+
+    def __len__(self) -> int:
+        return len(self.sesiones)
+
+    def buscar(self, p_sesion: int) -> Optional[int]:
+        """
+        :return: Índice de la sesión en los arreglos, o None si no está.
+        """
+        indice = int(np.searchsorted(self.sesiones, p_sesion))
+        if indice < len(self.sesiones) and self.sesiones[indice] == p_sesion:
+            return indice
+        return None
+
+    def reconstruir(self, p_sesion: int, p_fabrica: Callable[[int], JuegoAhorcado]) -> Optional[JuegoAhorcado]:
+        """
+        Reconstruye el juego de una sesión.
+        :param p_sesion: Identificador de la sesión.
+        :param p_fabrica: Función que crea el juego de la sesión (misma semilla y alfabeto que el original).
+        :return: El juego en el estado del último evento, o None si la sesión no está.
+        """
+        indice = self.buscar(p_sesion)
+        if indice is None:
+            return None
+        juego = p_fabrica(p_sesion)
+        juego.partidas = int(self.partidas[indice])
+        if self.posiciones[indice] != SIN_PALABRA:
+            juego.restaurar_partida(int(self.posiciones[indice]), int(self.mascaras[indice]),
+                                    int(self.intentos[indice]), Estado(int(self.estados[indice])))
+        return juego
+
+
+def repetir(p_ruta: str) -> EstadoRepetido:
+    """
+    Repite una bitácora completa.
+    :param p_ruta: Ruta del archivo.
+    :return: El estado final de cada sesión.
+    """
+    return EstadoRepetido(leer_registros(p_ruta))
+
+
+def compactar(p_origen: str, p_destino: Optional[str] = None) -> int:
+    """
+    Reescribe una bitácora dejando solo lo necesario para repetirla: de cada sesión viva se
+    conserva su partida vigente, y si esa partida ya terminó, sus jugadas se reemplazan por un
+    RESUMEN. Las partidas anteriores y las sesiones cerradas desaparecen. No se debe compactar
+    una bitácora que alguien tiene abierta para escribir.
+    :param p_origen: Bitácora a compactar.
+    :param p_destino: Archivo de salida; por defecto se reemplaza el origen.
+    :return: Cantidad de registros de la bitácora compactada.
+    """
+    semilla = leer_semilla(p_origen)
+    estado = repetir(p_origen)
+    registros = estado.registros
+    # Partidas terminadas, por grupo (todas las sesiones) y por sesión viva
+    terminadas = (estado.estados == Estado.GANADOR.value) | (estado.estados == Estado.AHORCADO.value)
+    terminada_grupo = np.zeros(len(estado.vivas), dtype=bool)
+    terminada_grupo[estado.vivas] = terminadas
+    # De las sesiones vivas se conserva la partida vigente; de las terminadas, solo su INICIO
+    conservar = estado.vigente & estado.vivas[estado.grupo] & \
+        ((registros["tipo"] == INICIO) | ~terminada_grupo[estado.grupo])
+
+    # Un RESUMEN por cada partida terminada
+    resumenes = np.zeros(int(terminadas.sum()), dtype=TIPO_REGISTRO)
+    resumenes["sesion"] = estado.sesiones[terminadas]
+    resumenes["tipo"] = RESUMEN
+    resumenes["secuencia"] = (estado.mascaras[terminadas] & np.uint64(0xFFFFFFFF)).astype(np.uint32)
+    resumenes["valor"] = (estado.mascaras[terminadas] >> np.uint64(32)).astype(np.uint32)
+    resumenes["resultado"] = estado.intentos[terminadas]
+    resumenes["estado"] = estado.estados[terminadas]
+    # Con un orden estable por sesión, cada RESUMEN queda justo después del INICIO de su partida
+    salida = np.concatenate((registros[conservar], resumenes))
+    salida = salida[np.argsort(salida["sesion"], kind="stable")]
+
+    destino = p_destino if p_destino is not None else p_origen
+    carpeta = os.path.dirname(os.path.abspath(destino))
+    descriptor, temporal = tempfile.mkstemp(dir=carpeta, prefix=".bitacora-", suffix=".tmp")
+    try:
+        with os.fdopen(descriptor, "wb") as archivo:
+            archivo.write(ENCABEZADO.pack(FIRMA, VERSION, REGISTRO.size, semilla))
+            archivo.write(salida.tobytes())
+            archivo.flush()
+            os.fsync(archivo.fileno())
+        os.replace(temporal, destino)
+    except BaseException:
+        if os.path.exists(temporal):
+            os.unlink(temporal)
+        raise
+    return len(salida)
+
+
+def main():
+    """
+    Herramientas de la bitácora desde la línea de comandos.
+    Uso: python -m src.Bitacora repetir bitacora.bin
+         python -m src.Bitacora compactar bitacora.bin [--destino otra.bin]
+    """
+    analizador = argparse.ArgumentParser(description="Repite o compacta una bitácora de partidas")
+    subcomandos = analizador.add_subparsers(dest="comando", required=True)
+    repeticion = subcomandos.add_parser("repetir", help="Reconstruye el estado de todas las sesiones")
+    repeticion.add_argument("ruta")
+    compactacion = subcomandos.add_parser("compactar", help="Resume las partidas terminadas")
+    compactacion.add_argument("ruta")
+    compactacion.add_argument("--destino")
+    argumentos = analizador.parse_args()
+    try:
+        inicio = time.perf_counter()
+        if argumentos.comando == "repetir":
+            estado = repetir(argumentos.ruta)
+            segundos = time.perf_counter() - inicio
+            jugando = int((estado.estados == Estado.JUGANDO.value).sum())
+            print(f"{estado.eventos} eventos, {len(estado)} sesiones ({jugando} jugando) en {segundos:.3f} s "
+                  f"({estado.eventos / max(segundos, 1e-9):,.0f} eventos/s)")
+        else:
+            antes = os.path.getsize(argumentos.ruta)
+            cantidad = compactar(argumentos.ruta, argumentos.destino)
+            despues = os.path.getsize(argumentos.destino or argumentos.ruta)
+            print(f"{cantidad} registros, {antes} -> {despues} bytes en {time.perf_counter() - inicio:.3f} s")
+    except (OSError, ValueError) as error:
+        print(f"Error: {error}", file=sys.stderr)
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
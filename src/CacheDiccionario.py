@@ -0,0 +1,150 @@
+__author__ = "Nicolas Alejandro Diaz Acosta"
+__license__ = "GPL"
+__version__ = "1.0.0"
+__email__ = "nicolas.diazacost@campusucc.edu.co"
+
+import hashlib
+import os
+import struct
+import tempfile
+from array import array
+from typing import Optional, Tuple
+
+from src.Corpus import FIRMA as FIRMA_CORPUS, Corpus
+from src.Diccionario import Diccionario, abrir_lista, palabras_validas
+
+# Carpeta que se crea junto a la lista de palabras, al estilo de __pycache__
+CARPETA_CACHE = "__dictcache__"
+
+# Encabezado del archivo de caché: firma, versión, tamaño y mtime (ns) del origen y su SHA-256.
+# A continuación va el corpus ya normalizado y sin repetidos, con su tabla de desplazamientos: el
+# único índice que necesita el juego para arrancar (acceso a cada palabra por su posición).
+# Los índices que dependen del alfabeto no van aquí: la tabla de dificultad (.dificultad) y el
+# árbol de decisión (.arbol) tienen sus propios archivos en esta misma carpeta, validados con la
+# huella del diccionario, y el índice de patrones del solucionador se arma en memoria al usarlo.
+FIRMA = b"AHDC"
+VERSION = 1
+CLAVE = struct.Struct("<4sHxxQQ32s")
+
+
+def ruta_cache(p_ruta_origen: str) -> str:
+    """
+    Devuelve la ruta del archivo de caché que corresponde a una lista de palabras.
+    :param p_ruta_origen: Ruta de la lista de palabras.
+    :return: Ruta del diccionario compilado.
+    """
+    carpeta, nombre = os.path.split(os.path.abspath(p_ruta_origen))
+    return os.path.join(carpeta, CARPETA_CACHE, nombre + ".corpus")
+
+
+def calcular_hash(p_ruta: str) -> bytes:
+    """
+    Calcula el SHA-256 del contenido de un archivo, leyéndolo por bloques.
+    :param p_ruta: Archivo a resumir.
+    :return: Los 32 bytes del resumen.
+    """
+    resumen = hashlib.sha256()
+    with open(p_ruta, "rb") as archivo:
+        for bloque in iter(lambda: archivo.read(1 << 20), b""):
+            resumen.update(bloque)
+    return resumen.digest()
+
+
+def leer_clave(p_ruta_cache: str) -> Optional[Tuple[int, int, bytes]]:
+    """
+    Lee la clave guardada en un archivo de caché.
+    :param p_ruta_cache: Ruta del diccionario compilado.
+    :return: Tupla (tamaño, mtime_ns, hash) del origen, o None si el archivo no existe o no es válido.
+    """
+    try:
+        with open(p_ruta_cache, "rb") as archivo:
+            encabezado = archivo.read(CLAVE.size)
+    except OSError:
+        return None
+    if len(encabezado) != CLAVE.size:
+        return None
+    firma, version, tamano, mtime, resumen = CLAVE.unpack(encabezado)
+    if firma != FIRMA or version != VERSION:
+        return None
+    return tamano, mtime, resumen
+
+
+def escribir_cache(p_ruta_cache: str, p_clave: Tuple[int, int, bytes], p_corpus: Corpus):
+    """
+    Escribe el diccionario compilado de forma atómica: primero en un temporal de la misma
+    carpeta y luego se reemplaza el archivo final, así nunca queda una caché a medias.
+    :param p_ruta_cache: Ruta del diccionario compilado.
+    :param p_clave: Tupla (tamaño, mtime_ns, hash) del origen.
+    :param p_corpus: Corpus ya preprocesado.
+    """
+    carpeta = os.path.dirname(p_ruta_cache)
+    os.makedirs(carpeta, exist_ok=True)
+    descriptor, temporal = tempfile.mkstemp(dir=carpeta, suffix=".tmp")
+    try:
+        with os.fdopen(descriptor, "wb") as archivo:
+            archivo.write(CLAVE.pack(FIRMA, VERSION, *p_clave))
+            p_corpus.escribir(archivo)
+            archivo.flush()
+            os.fsync(archivo.fileno())
+        os.replace(temporal, p_ruta_cache)
+    except BaseException:
+        os.unlink(temporal)
+        raise
+
+
+def es_corpus(p_ruta: str) -> bool:
+    """
+    Indica si un archivo ya es un corpus empaquetado (por ejemplo, la salida de src.Ingesta).
+    :param p_ruta: Ruta del archivo.
+    :return: True si empieza con la firma de Corpus.
+    """
+    with open(p_ruta, "rb") as archivo:
+        return archivo.read(len(FIRMA_CORPUS)) == FIRMA_CORPUS
+
+
+def cargar_diccionario(p_ruta: str) -> Diccionario:
+    """
+    Carga una lista de palabras usando su diccionario compilado si está al día.
+    Un corpus empaquetado ya está compilado: se mapea directamente, sin caché.
+    Si el tamaño y la fecha de modificación coinciden, la caché se mapea sin más.
+    Si no coinciden pero el contenido es el mismo (mismo hash), solo se actualiza la clave.
+    En cualquier otro caso se procesa la lista de nuevo y se reescribe la caché.
+    :param p_ruta: Ruta de la lista de palabras (texto plano o .gz) o de un corpus.
+    :return: El diccionario cargado.
+    """
+    if es_corpus(p_ruta):
+        return Diccionario.desde_corpus(Corpus.cargar(p_ruta))
+    destino = ruta_cache(p_ruta)
+    informacion = os.stat(p_ruta)
+    guardada = leer_clave(destino)
+
+    if guardada is not None and guardada[:2] == (informacion.st_size, informacion.st_mtime_ns):
+        try:
+            return Diccionario.desde_corpus(Corpus.cargar(destino, CLAVE.size))
+        except ValueError:
+            # La caché está dañada: se ignora y se reconstruye
+            guardada = None
+
+    clave = (informacion.st_size, informacion.st_mtime_ns, calcular_hash(p_ruta))
+    corpus_nuevo = None
+    if guardada is not None and guardada[2] == clave[2]:
+        # El archivo se tocó pero su contenido no cambió: se reutiliza el corpus ya procesado
+        try:
+            corpus = Corpus.cargar(destino, CLAVE.size)
+        except ValueError:
+            # La clave se lee bien pero el corpus está dañado: se procesa la lista de nuevo
+            pass
+        else:
+            corpus_nuevo = Corpus(bytes(corpus.datos), array("I", corpus.desplazamientos))
+            corpus.cerrar()
+    if corpus_nuevo is None:
+        with abrir_lista(p_ruta) as archivo:
+            corpus_nuevo = Corpus.desde_palabras(palabras_validas(archivo))
+
+    try:
+        escribir_cache(destino, clave, corpus_nuevo)
+    except OSError:
+        # Si la carpeta no admite escritura se juega igual, solo que sin caché
+        return Diccionario.desde_corpus(corpus_nuevo)
+    return Diccionario.desde_corpus(Corpus.cargar(destino, CLAVE.size))
+
@@ -0,0 +1,73 @@
+__author__ = "Nicolas Alejandro Diaz Acosta"
+__license__ = "GPL"
+__version__ = "1.0.0"
+__email__ = "nicolas.diazacost@campusucc.edu.co"
+
+from array import array
+from typing import List, Tuple
+
+from src.Selector import MASCARA_64, mezclar64
+
+
+def sortear_posicion(p_semilla: int, p_partida: int, p_total: int) -> int:
+    """
+    Escoge de forma determinista la palabra de una partida a partir de la semilla del juego.
+    No guarda estado: la misma (semilla, partida) da siempre la misma posición, en cualquier
+    proceso o hilo.
+    :param p_semilla: Semilla del juego.
+    :param p_partida: Número de partida dentro del juego (0 para la primera).
+    :param p_total: Número de palabras del diccionario.
+    :return: Posición entre 0 y total - 1.
+    """
+    aleatorio = mezclar64(p_semilla ^ mezclar64(p_partida))
+    # Se escala el número de 64 bits al total en lugar de usar el módulo
+    return (aleatorio * p_total) >> 64
+
+
+def semilla_de_juego(p_semilla_maestra: int, p_numero: int) -> int:
+    """
+    Deriva la semilla del juego número n de una simulación a partir de la semilla maestra.
+    :param p_semilla_maestra: Semilla de toda la simulación.
+    :param p_numero: Número del juego dentro de la simulación.
+    :return: Semilla de 64 bits para ese juego.
+    """
+    return mezclar64((p_semilla_maestra * 0x9E3779B97F4A7C15 + p_numero) & MASCARA_64)
+
+
+def generar_calendario(p_cantidad: int, p_semilla_maestra: int, p_total: int,
+                       p_inicio: int = 0) -> Tuple[array, array]:
+    """
+    Genera por adelantado las semillas y las palabras de una serie de juegos.
+    El juego número n siempre recibe el mismo par (semilla, posición), sin importar cómo se
+    reparta la simulación, y su posición es la que escogería JuegoAhorcado(semilla=...) en
+    su primera partida.
+    :param p_cantidad: Número de juegos a generar.
+    :param p_semilla_maestra: Semilla de toda la simulación.
+    :param p_total: Número de palabras del diccionario.
+    :param p_inicio: Número del primer juego a generar.
+    :return: Dos arreglos paralelos: semillas (64 bits) y posiciones (32 bits).
+    """
+    semillas = array("Q")
+    posiciones = array("I")
+    for numero in range(p_inicio, p_inicio + p_cantidad):
+        semilla = semilla_de_juego(p_semilla_maestra, numero)
+        semillas.append(semilla)
+        posiciones.append(sortear_posicion(semilla, 0, p_total))
+    return semillas, posiciones
+
+
+def repartir(p_cantidad: int, p_trabajadores: int) -> List[range]:
+    """
+    Reparte los números de juego entre trabajadores en bloques contiguos y deterministas.
+    :param p_cantidad: Número total de juegos.
+    :param p_trabajadores: Número de trabajadores.
+    :return: Un rango de números de juego por trabajador.
+    """
+    base, sobrante = divmod(p_cantidad, p_trabajadores)
+    rangos = []
+    inicio = 0
+    for trabajador in range(p_trabajadores):
+        fin = inicio + base + (1 if trabajador < sobrante else 0)
+        rangos.append(range(inicio, fin))
+        inicio = fin
+    return rangos
@@ -0,0 +1,171 @@
+__author__ = "Nicolas Alejandro Diaz Acosta"
+__license__ = "GPL"
+__version__ = "1.0.0"
+__email__ = "nicolas.diazacost@campusucc.edu.co"
+
+import mmap
+import struct
+import sys
+from array import array
+from typing import Iterable, Union
+
+# Formato del archivo (little-endian):
+#   encabezado: firma, versión, reservado, cantidad de palabras, longitud de los datos
+#   datos: las palabras en UTF-8, una detrás de otra y sin separadores
+#   relleno hasta múltiplo de 4 bytes
+#   desplazamientos: cantidad + 1 enteros de 32 bits, la palabra i ocupa datos[d[i]:d[i + 1]]
+FIRMA = b"AHCP"
+VERSION = 1
+ENCABEZADO = struct.Struct("<4sHHII")
+
+
+def _relleno(p_longitud: int) -> int:
+    """
+    Calcula cuántos bytes faltan para alinear una longitud a 4 bytes.
+    :param p_longitud: Longitud actual.
+    :return: Número de bytes de relleno.
+    """
+    return -p_longitud % 4
+
+
+class Corpus:
+    """
+    Clase que guarda un conjunto de palabras de forma compacta: un único buffer de bytes
+    con todas las palabras y una tabla de desplazamientos de 32 bits.
+    Puede escribirse a disco y volver a abrirse con mmap sin copiar los datos.
+    """
+
+    def __init__(self, p_datos: Union[bytes, bytearray, memoryview], p_desplazamientos: Union[array, memoryview]):
+        """
+        Construye el corpus a partir de sus dos partes.
+        :param p_datos: Buffer con las palabras codificadas en UTF-8.
+        :param p_desplazamientos: Tabla con len + 1 desplazamientos dentro de los datos.
+        """
+        self.datos = p_datos
+        self.desplazamientos = p_desplazamientos
+        self._mapa = None
+
+    @classmethod
+    def desde_palabras(cls, p_palabras: Iterable[str]) -> 'Corpus':
+        """
+        Empaqueta en memoria una secuencia de palabras ya normalizadas. Las repetidas se guardan
+        una sola vez, en la posición de su primera aparición.
+        :param p_palabras: Palabras a guardar, en orden.
+        :return: El corpus construido.
+        """
+        datos = bytearray()
+        desplazamientos = array("I", [0])
+        vistas = set()
+        for palabra in p_palabras:
+            if palabra in vistas:
+                continue
+            vistas.add(palabra)
+            datos += palabra.encode("utf-8")
+            desplazamientos.append(len(datos))
+        return cls(bytes(datos), desplazamientos)
+
+    @classmethod
+    def cargar(cls, p_ruta: str, p_inicio: int = 0) -> 'Corpus':
+        """
+        Abre un corpus guardado en disco mapeándolo en memoria, sin copiar su contenido.
+        :param p_ruta: Ruta del archivo.
+        :param p_inicio: Byte del archivo donde empieza el corpus.
+        :return: El corpus cargado.
+        :raise ValueError: Si el archivo no tiene el formato esperado.
+        """
+        with open(p_ruta, "rb") as archivo:
+            mapa = mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ)
+        vista = memoryview(mapa)
+        try:
+            if len(vista) < p_inicio + ENCABEZADO.size:
+                raise ValueError(f"{p_ruta} no es un corpus válido")
+            firma, version, _, cantidad, longitud = ENCABEZADO.unpack_from(vista, p_inicio)
+            if firma != FIRMA or version != VERSION:
+                raise ValueError(f"{p_ruta} no es un corpus válido o es de otra versión")
+            inicio_datos = p_inicio + ENCABEZADO.size
+            inicio_tabla = inicio_datos + longitud + _relleno(longitud)
+            fin_tabla = inicio_tabla + 4 * (cantidad + 1)
+            if len(vista) < fin_tabla:
+                raise ValueError(f"{p_ruta} está incompleto")
+            datos = vista[inicio_datos:inicio_datos + longitud]
+            tabla = vista[inicio_tabla:fin_tabla]
+        except ValueError:
+            vista.release()
+            mapa.close()
+            raise
+        if sys.byteorder == "little":
+            desplazamientos = tabla.cast("I")
+        else:
+            # En máquinas big-endian la tabla debe voltearse, así que aquí sí se copia
+            desplazamientos = array("I", tabla.tobytes())
+            desplazamientos.byteswap()
+        corpus = cls(datos, desplazamientos)
+        corpus._mapa = mapa
+        return corpus
+
+    def guardar(self, p_ruta: str):
+        """
+        Escribe el corpus en disco con el formato descrito al inicio del módulo.
+        :param p_ruta: Ruta del archivo a crear.
+        """
+        with open(p_ruta, "wb") as archivo:
+            self.escribir(archivo)
+
+    def escribir(self, p_archivo):
+        """
+        Escribe el corpus en un archivo ya abierto en modo binario.
+        :param p_archivo: Archivo donde se escribe.
+        """
+        longitud = len(self.datos)
+        p_archivo.write(ENCABEZADO.pack(FIRMA, VERSION, 0, len(self), longitud))
+        p_archivo.write(self.datos)
+        p_archivo.write(b"\0" * _relleno(longitud))
+        tabla = array("I", self.desplazamientos)
+        if sys.byteorder != "little":
+            tabla.byteswap()
+        p_archivo.write(tabla.tobytes())
+
+    def cerrar(self):
+        """
+        Libera el mapa de memoria si el corpus fue cargado desde disco.
+        """
+        if self._mapa is not None:
+            self.datos.release()
+            if isinstance(self.desplazamientos, memoryview):
+                self.desplazamientos.release()
+            self._mapa.close()
+            self._mapa = None
+
+    def __len__(self) -> int:
+        return len(self.desplazamientos) - 1
+
+    def dar_texto(self, posicion: int) -> str:
+        """
+        Devuelve la palabra en una posición.
+        :param posicion: Posición de la palabra, entre 0 y len - 1.
+        :return: La palabra decodificada.
+        """
+        if not 0 <= posicion < len(self):
+            raise IndexError("Posición fuera del corpus")
+        return str(self.datos[self.desplazamientos[posicion]:self.desplazamientos[posicion + 1]], "utf-8")
+
+
+def main():
+    """
+    Convierte una lista de palabras (texto plano o .gz) en un corpus empaquetado.
+    Uso: python -m src.Corpus palabras.txt palabras.corpus
+    """
+    # Se importa aquí porque el diccionario depende de este módulo
+    from src.Diccionario import Diccionario
+
+    if len(sys.argv) != 3:
+        print("Uso: python -m src.Corpus <lista de palabras> <corpus de salida>")
+        sys.exit(2)
+    origen, destino = sys.argv[1], sys.argv[2]
+    diccionario = Diccionario.desde_archivo(origen)
+    diccionario.corpus.guardar(destino)
+    print(f"{len(diccionario)} palabras guardadas en {destino}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+__author__ = "Nicolas Alejandro Diaz Acosta"
+__license__ = "GPL"
+__version__ = "1.0.0"
+__email__ = "nicolas.diazacost@campusucc.edu.co"
+
+import gzip
+from typing import IO, Iterable, Iterator, Optional
+from src.Corpus import Corpus
+from src.Palabra import Palabra
+
+# Palabras con las que se juega si no se indica otro diccionario
+PALABRAS_PREDETERMINADAS = (
+    "algoritmo",
+    "contenedora",
+    "avance",
+    "ciclo",
+    "indice",
+    "instrucciones",
+    "arreglo",
+    "vector",
+    "inicio",
+    "cuerpo",
+    "recorrido",
+    "patron",
+)
+
+
+def normalizar_palabra(p_linea: str) -> Optional[str]:
+    """
+    Limpia una línea del archivo de palabras y verifica que sea una palabra válida.
+    :param p_linea: Línea leída del archivo.
+    :return: La palabra en minúscula, o None si la línea no es una palabra válida.
+    """
+    palabra = p_linea.strip().lower()
+    # Solo aceptamos palabras formadas únicamente por letras
+    if not palabra or not palabra.isalpha():
+        return None
+    return palabra
+
+
+def palabras_validas(p_palabras: Iterable[str]) -> Iterator[str]:
+    """
+    Normaliza las palabras y descarta las inválidas, conservando el orden. Las repetidas las
+    descarta Corpus.desde_palabras.
+    :param p_palabras: Líneas o palabras de entrada.
+    :return: Generador con cada palabra válida.
+    """
+    for entrada in p_palabras:
+        palabra = normalizar_palabra(entrada)
+        if palabra is not None:
+            yield palabra
+
+
+def abrir_lista(p_ruta: str) -> IO[str]:
+    """
+    Abre un archivo de palabras en modo texto, descomprimiéndolo si termina en .gz.
+    :param p_ruta: Ruta del archivo.
+    :return: Archivo abierto listo para leerse línea por línea.
+    """
+    if p_ruta.endswith(".gz"):
+        return gzip.open(p_ruta, "rt", encoding="utf-8")
+    return open(p_ruta, "r", encoding="utf-8")
+
+
+class Diccionario:
+    """
+    Clase que representa el conjunto de palabras con las que se puede jugar.
+    Guarda el texto de las palabras empaquetado en un Corpus; los objetos Palabra se
+    construyen cuando se piden. Es de solo lectura, así que una misma instancia puede compartirse entre todos los juegos.
+    """
+
+    # Instancia compartida del diccionario predeterminado, se crea la primera vez que se pide
+    _predeterminado: Optional['Diccionario'] = None
+
+    def __init__(self, p_palabras: Iterable[str] = PALABRAS_PREDETERMINADAS):
+        """
+        Construye un diccionario a partir de una secuencia de palabras.
+        Las entradas que no son palabras válidas se descartan y las repetidas se guardan una sola vez.
+        :param p_palabras: Palabras del diccionario.
+        :raise ValueError: Si no queda ninguna palabra válida.
+        """
+        self.corpus = Corpus.desde_palabras(palabras_validas(p_palabras))
+        if len(self.corpus) == 0:
+            raise ValueError("El diccionario no tiene palabras válidas")
+
+    @classmethod
+    def desde_corpus(cls, p_corpus: Corpus) -> 'Diccionario':
+        """
+        Construye un diccionario sobre un corpus ya empaquetado, sin volver a normalizarlo.
+        :param p_corpus: Corpus con las palabras.
+        :return: El diccionario.
+        :raise ValueError: Si el corpus está vacío.
+        """
+        if len(p_corpus) == 0:
+            raise ValueError("El diccionario no tiene palabras válidas")
+        diccionario = cls.__new__(cls)
+        diccionario.corpus = p_corpus
+        return diccionario
+
+    @classmethod
+    def predeterminado(cls) -> 'Diccionario':
+        """
+        Devuelve el diccionario predeterminado, compartido por todo el proceso.
+        :return: La instancia única del diccionario con las palabras predeterminadas.
+        """
+        if cls._predeterminado is None:
+            cls._predeterminado = cls(PALABRAS_PREDETERMINADAS)
+        return cls._predeterminado
+
+    @classmethod
+    def desde_archivo(cls, p_ruta: str) -> 'Diccionario':
+        """
+        Carga un diccionario leyendo el archivo línea por línea, sin palabras repetidas, igual que
+        cargar_diccionario: así las posiciones (y los sorteos con semilla) no dependen de si se usó la caché.
+        Los archivos .corpus se mapean en memoria directamente, sin procesarlos.
+        :param p_ruta: Ruta de un archivo de texto plano o .gz con una palabra por línea, o de un corpus.
+        :return: El diccionario cargado.
+        """
+        if p_ruta.endswith(".corpus"):
+            return cls.desde_corpus(Corpus.cargar(p_ruta))
+        with abrir_lista(p_ruta) as archivo:
+            return cls.desde_corpus(Corpus.desde_palabras(palabras_validas(archivo)))
+
+    def __len__(self) -> int:
+        return len(self.corpus)
+
+    def __getitem__(self, posicion: int) -> Palabra:
+        return Palabra(self.corpus.dar_texto(posicion))
+
+    def dar_texto(self, posicion: int) -> str:
+        """
+        Devuelve el texto de la palabra en una posición, sin construir la Palabra.
+        :param posicion: Posición de la palabra en el diccionario.
+        :return: La palabra en minúscula.
+        """
+        return self.corpus.dar_texto(posicion)
@@ -0,0 +1,344 @@
+__author__ = "Nicolas Alejandro Diaz Acosta"
+__license__ = "GPL"
+__version__ = "1.0.0"
+__email__ = "nicolas.diazacost@campusucc.edu.co"
+
+import argparse
+import hashlib
+import mmap
+import os
+import struct
+import sys
+import tempfile
+import time
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from typing import Optional, Tuple, Union
+
+from src.CacheDiccionario import cargar_diccionario, ruta_cache
+from src.Calendario import semilla_de_juego
+from src.Diccionario import Diccionario
+from src.JuegoAhorcado import JuegoAhorcado, Estado
+from src.Simulacion import ESTRATEGIAS, jugar_partida
+
+# Formato del archivo (little-endian):
+#   encabezado: firma, versión, reservado, cantidad de palabras, semilla, estrategia de referencia,
+#               huella de las palabras puntuadas
+#   puntajes: un byte por palabra, en el orden del diccionario (relleno hasta múltiplo de 4)
+#   orden: posiciones de las palabras ordenadas por puntaje (enteros de 32 bits)
+#   inicios: para cada puntaje p, dónde empiezan en "orden" las palabras con puntaje p (MAX_PUNTAJE + 2 enteros)
+FIRMA = b"AHDF"
+VERSION = 1
+ENCABEZADO = struct.Struct("<4sHHIQ16s32s")
+MAX_PUNTAJE = 255
+
+# Bandas de dificultad: rango de puntajes (fallos de la estrategia de referencia) de cada una
+BANDAS = {
+    "facil": (0, 1),
+    "media": (2, 3),
+    "dificil": (4, MAX_PUNTAJE),
+}
+
+# Diccionario de cada proceso trabajador; se carga una sola vez al iniciar el proceso
+_diccionario_trabajador: Optional[Diccionario] = None
+
+
+def ruta_dificultad(p_ruta_origen: str) -> str:
+    """
+    Devuelve la ruta de la tabla de dificultad de una lista de palabras, junto a su caché.
+    :param p_ruta_origen: Ruta de la lista de palabras.
+    :return: Ruta del archivo de puntajes.
+    """
+    return ruta_cache(p_ruta_origen)[:-len(".corpus")] + ".dificultad"
+
+
+def huella_prefijo(p_diccionario: Diccionario, p_cantidad: int) -> bytes:
+    """
+    Calcula una huella de las primeras palabras de un diccionario. Sirve para saber si los
+    puntajes guardados siguen correspondiendo a las mismas palabras en las mismas posiciones.
+    :param p_diccionario: Diccionario a resumir.
+    :param p_cantidad: Número de palabras a incluir.
+    :return: Los 32 bytes del SHA-256.
+    """
+    corpus = p_diccionario.corpus
+    resumen = hashlib.sha256()
+    resumen.update(corpus.datos[:corpus.desplazamientos[p_cantidad]])
+    resumen.update(array("I", corpus.desplazamientos[:p_cantidad + 1]).tobytes())
+    return resumen.digest()
+
+
+def puntaje_partida(p_juego: JuegoAhorcado) -> int:
+    """
+    Calcula la dificultad de una partida ya terminada: los intentos fallados y, si el jugador
+    fue ahorcado, además las posiciones que quedaron sin descubrir.
+    :param p_juego: Juego terminado.
+    :return: Puntaje entre 0 y MAX_PUNTAJE; más alto es más difícil.
+    """
+    puntaje = JuegoAhorcado.MAX_INTENTOS - p_juego.dar_intentos_disponibles()
+    if p_juego.dar_estado() == Estado.AHORCADO:
+        puntaje += p_juego.dar_ocurrencias().count("_")
+    return min(puntaje, MAX_PUNTAJE)
+
+
+def calcular_puntajes(p_diccionario: Diccionario, p_inicio: int, p_fin: int,
+                      p_estrategia: str = "frecuencia", p_semilla: int = 0) -> bytes:
+    """
+    Juega una partida por palabra con la estrategia de referencia y puntúa cada una.
+    Cada palabra usa su propia semilla, así el puntaje no depende de cómo se reparta el trabajo.
+    :param p_diccionario: Diccionario del que salen las palabras.
+    :param p_inicio: Primera posición a puntuar.
+    :param p_fin: Última posición + 1.
+    :param p_estrategia: Nombre de la estrategia de referencia (clave de ESTRATEGIAS).
+    :param p_semilla: Semilla de la puntuación.
+    :return: Un byte por palabra con su puntaje.
+    """
+    fabrica = ESTRATEGIAS[p_estrategia]
+    puntajes = bytearray(p_fin - p_inicio)
+    juego = JuegoAhorcado(p_diccionario)
+    for posicion in range(p_inicio, p_fin):
+        juego.iniciar_con_posicion(posicion)
+        jugar_partida(juego, fabrica(semilla_de_juego(p_semilla, posicion), p_diccionario))
+        puntajes[posicion - p_inicio] = puntaje_partida(juego)
+    return bytes(puntajes)
+
+
+def _iniciar_trabajador(p_ruta: str):
+    global _diccionario_trabajador
+    _diccionario_trabajador = cargar_diccionario(p_ruta)
+
+
+def _puntuar_bloque(p_tarea: Tuple[int, int, str, int]) -> Tuple[int, bytes]:
+    inicio, fin, estrategia, semilla = p_tarea
+    return inicio, calcular_puntajes(_diccionario_trabajador, inicio, fin, estrategia, semilla)
+
+
+def ordenar_por_puntaje(p_puntajes: bytes) -> Tuple[array, array]:
+    """
+    Ordena las posiciones por puntaje con un conteo, en tiempo lineal.
+    :param p_puntajes: Puntaje de cada palabra.
+    :return: Tupla (orden, inicios): las posiciones ordenadas y dónde empieza cada puntaje.
+    """
+    conteos = [0] * (MAX_PUNTAJE + 1)
+    for puntaje in p_puntajes:
+        conteos[puntaje] += 1
+    inicios = array("I", [0] * (MAX_PUNTAJE + 2))
+    for puntaje in range(MAX_PUNTAJE + 1):
+        inicios[puntaje + 1] = inicios[puntaje] + conteos[puntaje]
+    siguiente = list(inicios[:-1])
+    orden = array("I", bytes(4 * len(p_puntajes)))
+    for posicion, puntaje in enumerate(p_puntajes):
+        orden[siguiente[puntaje]] = posicion
+        siguiente[puntaje] += 1
+    return orden, inicios
+
+
+def escribir_tabla(p_ruta: str, p_puntajes: bytes, p_estrategia: str, p_semilla: int, p_huella: bytes):
+    """
+    Guarda los puntajes y su orden de forma atómica.
+    :param p_ruta: Archivo a crear.
+    :param p_puntajes: Puntaje de cada palabra, en el orden del diccionario.
+    :param p_estrategia: Nombre de la estrategia de referencia.
+    :param p_semilla: Semilla de la puntuación.
+    :param p_huella: Huella de las palabras puntuadas.
+    """
+    orden, inicios = ordenar_por_puntaje(p_puntajes)
+    if sys.byteorder != "little":
+        orden.byteswap()
+        inicios.byteswap()
+
+    carpeta = os.path.dirname(os.path.abspath(p_ruta))
+    os.makedirs(carpeta, exist_ok=True)
+    descriptor, temporal = tempfile.mkstemp(dir=carpeta, suffix=".tmp")
+    try:
+        with os.fdopen(descriptor, "wb") as archivo:
+            archivo.write(ENCABEZADO.pack(FIRMA, VERSION, 0, len(p_puntajes), p_semilla,
+                                          p_estrategia.encode("ascii"), p_huella))
+            archivo.write(p_puntajes)
+            archivo.write(bytes(-len(p_puntajes) % 4))
+            archivo.write(orden.tobytes())
+            archivo.write(inicios.tobytes())
+            archivo.flush()
+            os.fsync(archivo.fileno())
+        os.replace(temporal, p_ruta)
+    except BaseException:
+        os.unlink(temporal)
+        raise
+
+
+class TablaDificultad:
+    """
+    Clase que consulta los puntajes de dificultad guardados en disco, mapeados en memoria.
+    Como las posiciones están ordenadas por puntaje, las palabras de una banda ocupan un tramo
+    contiguo de "orden" y sortear una de ellas cuesta O(1).
+    """
+
+    def __init__(self, p_ruta: str):
+        """
+        Abre una tabla guardada en disco.
+        :param p_ruta: Ruta del archivo de puntajes.
+        :raise ValueError: Si el archivo no es válido o es de otra versión.
+        """
+        with open(p_ruta, "rb") as archivo:
+            self._mapa = mmap.mmap(archivo.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._mapa) < ENCABEZADO.size:
+            self._mapa.close()
+            raise ValueError(f"{p_ruta} no es una tabla de dificultad válida")
+        firma, version, _, cantidad, semilla, estrategia, huella = ENCABEZADO.unpack_from(self._mapa, 0)
+        inicio_orden = ENCABEZADO.size + cantidad + (-cantidad % 4)
+        inicio_inicios = inicio_orden + 4 * cantidad
+        if firma != FIRMA or version != VERSION or len(self._mapa) != inicio_inicios + 4 * (MAX_PUNTAJE + 2):
+            self._mapa.close()
+            raise ValueError(f"{p_ruta} no es una tabla de dificultad válida o es de otra versión")
+
+        self.cantidad = cantidad
+        self.semilla = semilla
+        self.estrategia = estrategia.rstrip(b"\0").decode("ascii")
+        self.huella = huella
+        vista = memoryview(self._mapa)
+        self.puntajes = vista[ENCABEZADO.size:ENCABEZADO.size + cantidad]
+        if sys.byteorder == "little":
+            self.orden = vista[inicio_orden:inicio_inicios].cast("I")
+            self.inicios = vista[inicio_inicios:].cast("I")
+        else:
+            self.orden = array("I", vista[inicio_orden:inicio_inicios].tobytes())
+            self.inicios = array("I", vista[inicio_inicios:].tobytes())
+            self.orden.byteswap()
+            self.inicios.byteswap()
+
+    def __len__(self) -> int:
+        return self.cantidad
+
+    def dar_puntaje(self, p_posicion: int) -> int:
+        """
+        :param p_posicion: Posición de la palabra en el diccionario.
+        :return: Puntaje de dificultad de la palabra.
+        """
+        return self.puntajes[p_posicion]
+
+    def dar_rango(self, p_banda: Union[str, Tuple[int, int]]) -> Tuple[int, int]:
+        """
+        Devuelve el tramo de "orden" que ocupan las palabras de una banda.
+        :param p_banda: Nombre de una banda de BANDAS o tupla (puntaje mínimo, puntaje máximo).
+        :return: Tupla (inicio, fin) del tramo.
+        :raise ValueError: Si la banda no existe.
+        """
+        if isinstance(p_banda, str):
+            if p_banda not in BANDAS:
+                raise ValueError(f"Banda de dificultad desconocida: {p_banda}")
+            p_banda = BANDAS[p_banda]
+        minimo, maximo = max(p_banda[0], 0), min(p_banda[1], MAX_PUNTAJE)
+        if minimo > maximo:
+            return 0, 0
+        return self.inicios[minimo], self.inicios[maximo + 1]
+
+    def dar_posicion(self, p_numero: int) -> int:
+        """
+        :param p_numero: Lugar dentro del orden por puntaje.
+        :return: Posición en el diccionario de la palabra que ocupa ese lugar.
+        """
+        return self.orden[p_numero]
+
+    def cerrar(self):
+        """
+        Libera el mapa de memoria.
+        """
+        self.puntajes.release()
+        if isinstance(self.orden, memoryview):
+            self.orden.release()
+            self.inicios.release()
+        self._mapa.close()
+
+
+def cargar_tabla(p_ruta_origen: str, p_diccionario: Diccionario) -> Optional[TablaDificultad]:
+    """
+    Abre la tabla de dificultad de una lista de palabras si existe y está al día.
+    :param p_ruta_origen: Lista de palabras.
+    :param p_diccionario: Diccionario cargado de esa lista.
+    :return: La tabla, o None si falta, está dañada o no corresponde al diccionario.
+    """
+    try:
+        tabla = TablaDificultad(ruta_dificultad(p_ruta_origen))
+    except (OSError, ValueError):
+        return None
+    if tabla.cantidad != len(p_diccionario) or tabla.huella != huella_prefijo(p_diccionario, tabla.cantidad):
+        tabla.cerrar()
+        return None
+    return tabla
+
+
+def actualizar(p_ruta_origen: str, p_estrategia: str = "frecuencia", p_trabajadores: Optional[int] = None,
+               p_bloque: int = 2000, p_semilla: int = 0) -> TablaDificultad:
+    """
+    Calcula los puntajes de dificultad de una lista de palabras y los guarda junto a su caché.
+    Si ya hay una tabla con la misma estrategia y semilla cuyas palabras siguen al principio
+    del diccionario, solo se puntúan las palabras agregadas después.
+    :param p_ruta_origen: Lista de palabras (texto plano o .gz).
+    :param p_estrategia: Nombre de la estrategia de referencia (clave de ESTRATEGIAS).
+    :param p_trabajadores: Número de procesos; por defecto, uno por núcleo.
+    :param p_bloque: Palabras por tarea.
+    :param p_semilla: Semilla de la puntuación.
+    :return: La tabla al día.
+    :raise ValueError: Si la estrategia no existe.
+    """
+    if p_estrategia not in ESTRATEGIAS:
+        raise ValueError(f"Estrategia desconocida: {p_estrategia}")
+    diccionario = cargar_diccionario(p_ruta_origen)
+    destino = ruta_dificultad(p_ruta_origen)
+    total = len(diccionario)
+
+    puntajes = b""
+    try:
+        anterior = TablaDificultad(destino)
+    except (OSError, ValueError):
+        anterior = None
+    if anterior is not None:
+        if (anterior.estrategia == p_estrategia and anterior.semilla == p_semilla and anterior.cantidad <= total
+                and anterior.huella == huella_prefijo(diccionario, anterior.cantidad)):
+            puntajes = bytes(anterior.puntajes)
+        anterior.cerrar()
+        if len(puntajes) == total:
+            return TablaDificultad(destino)
+
+    nuevos = bytearray(total - len(puntajes))
+    tareas = [(inicio, min(inicio + p_bloque, total), p_estrategia, p_semilla)
+              for inicio in range(len(puntajes), total, p_bloque)]
+    if p_trabajadores == 1 or len(tareas) <= 1:
+        for tarea in tareas:
+            nuevos[tarea[0] - len(puntajes):tarea[1] - len(puntajes)] = \
+                calcular_puntajes(diccionario, *tarea)
+    else:
+        with ProcessPoolExecutor(max_workers=p_trabajadores, initializer=_iniciar_trabajador,
+                                 initargs=(p_ruta_origen,)) as ejecutor:
+            for inicio, parcial in ejecutor.map(_puntuar_bloque, tareas):
+                nuevos[inicio - len(puntajes):inicio - len(puntajes) + len(parcial)] = parcial
+
+    escribir_tabla(destino, puntajes + bytes(nuevos), p_estrategia, p_semilla, huella_prefijo(diccionario, total))
+    return TablaDificultad(destino)
+
+
+def main():
+    """
+    Calcula o actualiza la tabla de dificultad de una lista de palabras.
+    Uso: python -m src.Dificultad palabras.txt [--estrategia frecuencia] [--trabajadores 8]
+    """
+    analizador = argparse.ArgumentParser(description="Puntúa la dificultad de cada palabra del diccionario")
+    analizador.add_argument("lista", help="Lista de palabras (texto plano o .gz)")
+    analizador.add_argument("--estrategia", choices=sorted(ESTRATEGIAS), default="frecuencia")
+    analizador.add_argument("--trabajadores", type=int, default=os.cpu_count())
+    analizador.add_argument("--bloque", type=int, default=2000)
+    analizador.add_argument("--semilla", type=int, default=0)
+    argumentos = analizador.parse_args()
+
+    inicio = time.perf_counter()
+    tabla = actualizar(argumentos.lista, argumentos.estrategia, argumentos.trabajadores,
+                       argumentos.bloque, argumentos.semilla)
+    print(f"{len(tabla)} palabras puntuadas en {ruta_dificultad(argumentos.lista)} "
+          f"({time.perf_counter() - inicio:.1f} s)")
+    for nombre in BANDAS:
+        desde, hasta = tabla.dar_rango(nombre)
+        print(f"  {nombre:<8} {hasta - desde:>10} palabras")
+    tabla.cerrar()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,185 @@
+__author__ = "Nicolas Alejandro Diaz Acosta"
+__license__ = "GPL"
+__version__ = "1.0.0"
+__email__ = "nicolas.diazacost@campusucc.edu.co"
+
+from array import array
+from typing import Dict, Iterable, List, Sequence, Set, Tuple
+
+from src.Alfabeto import Alfabeto, ESPANOL
+from src.Diccionario import Diccionario
+from src.JuegoAhorcado import JuegoAhorcado
+from src.Letra import Letra
+
+
+def bits_desde_posiciones(p_posiciones: Iterable[int], p_cantidad: int) -> int:
+    """
+    Construye un conjunto de bits (un entero de Python) a partir de sus posiciones,
+    en tiempo lineal: se marcan los bits en un bytearray y se convierte una sola vez.
+    :param p_posiciones: Posiciones de los bits encendidos.
+    :param p_cantidad: Número total de bits del conjunto.
+    :return: El entero con esos bits encendidos.
+    """
+    buffer = bytearray((p_cantidad + 7) // 8)
+    for posicion in p_posiciones:
+        buffer[posicion >> 3] |= 1 << (posicion & 7)
+    return int.from_bytes(buffer, "little")
+
+
+def posiciones_desde_bits(p_bits: int) -> List[int]:
+    """
+    Devuelve las posiciones de los bits encendidos, de menor a mayor.
+    :param p_bits: Conjunto de bits.
+    :return: Lista de posiciones.
+    """
+    posiciones = []
+    buffer = p_bits.to_bytes((p_bits.bit_length() + 7) // 8, "little")
+    for numero_byte, valor in enumerate(buffer):
+        while valor:
+            menor = valor & -valor
+            posiciones.append(numero_byte * 8 + menor.bit_length() - 1)
+            valor ^= menor
+    return posiciones
+
+
+class GrupoLongitud:
+    """
+    Clase con el índice de todas las palabras de una misma longitud.
+    Cada palabra del grupo tiene un número local; los conjuntos de palabras son enteros
+    en los que el bit i representa la palabra local i.
+    """
+
+    def __init__(self, p_longitud: int):
+        self.longitud = p_longitud
+        # Número local -> posición de la palabra en el diccionario
+        self.palabras = array("I")
+        # (posición, símbolo) -> palabras que tienen ese símbolo en esa posición
+        self.casillas: Dict[Tuple[int, str], int] = {}
+        # símbolo -> palabras que contienen el símbolo en cualquier posición
+        self.contiene: Dict[str, int] = {}
+        self.todas = 0
+
+    def construir(self, p_textos: Sequence[str]):
+        """
+        Calcula los conjuntos de bits a partir del texto de las palabras del grupo.
+        :param p_textos: Texto de cada palabra, en el orden de sus números locales.
+        """
+        cantidad = len(p_textos)
+        por_casilla: Dict[Tuple[int, str], List[int]] = {}
+        por_simbolo: Dict[str, Set[int]] = {}
+        for local, texto in enumerate(p_textos):
+            for posicion, simbolo in enumerate(texto):
+                por_casilla.setdefault((posicion, simbolo), []).append(local)
+                por_simbolo.setdefault(simbolo, set()).add(local)
+        self.casillas = {clave: bits_desde_posiciones(locales, cantidad) for clave, locales in por_casilla.items()}
+        self.contiene = {simbolo: bits_desde_posiciones(sorted(locales), cantidad)
+                         for simbolo, locales in por_simbolo.items()}
+        self.todas = (1 << cantidad) - 1
+
+
+class IndicePatrones:
+    """
+    Clase que encuentra rápidamente las palabras del diccionario que siguen siendo posibles
+    para un patrón de ocurrencias (por ejemplo "_ l _ o _ i _ m _") y unas letras jugadas.
+    Las palabras se agrupan por longitud y cada grupo guarda, para cada (posición, letra),
+    el conjunto de bits de las palabras que la cumplen; una consulta es una intersección
+    de unos pocos conjuntos de bits.
+    Las letras se indexan plegadas con el alfabeto del juego (en español, 'í' e 'i' son el mismo
+    símbolo), igual que las compara jugar_letra.
+    """
+
+    def __init__(self, p_diccionario: Diccionario, p_alfabeto: Alfabeto = ESPANOL):
+        """
+        Construye el índice recorriendo el diccionario una vez.
+        :param p_diccionario: Diccionario a indexar.
+        :param p_alfabeto: Alfabeto con el que se juega.
+        """
+        self.diccionario = p_diccionario
+        self.alfabeto = p_alfabeto
+        # Carácter -> símbolo plegado; "_" es la marca de las posiciones ocultas y no se pliega
+        self._plegados: Dict[str, str] = {"_": "_"}
+        textos: Dict[int, List[str]] = {}
+        self.grupos: Dict[int, GrupoLongitud] = {}
+        for posicion in range(len(p_diccionario)):
+            texto = self.plegar_texto(p_diccionario.dar_texto(posicion))
+            grupo = self.grupos.get(len(texto))
+            if grupo is None:
+                grupo = self.grupos[len(texto)] = GrupoLongitud(len(texto))
+                textos[len(texto)] = []
+            grupo.palabras.append(posicion)
+            textos[len(texto)].append(texto)
+        for longitud, grupo in self.grupos.items():
+            grupo.construir(textos[longitud])
+
+    def plegar(self, p_caracter: str) -> str:
+        """
+        Devuelve el símbolo con el que se indexa un carácter.
+        :param p_caracter: Carácter de una palabra, de un patrón o de una jugada.
+        :return: La letra canónica del alfabeto o, si el carácter no es del alfabeto, el carácter
+        tal como lo muestra el juego.
+        """
+        simbolo = self._plegados.get(p_caracter)
+        if simbolo is None:
+            codigo = self.alfabeto.codigo(p_caracter)
+            simbolo = Letra(p_caracter).dar_letra() if codigo is None else self.alfabeto.simbolos[codigo]
+            self._plegados[p_caracter] = simbolo
+        return simbolo
+
+    def plegar_texto(self, p_texto: str) -> str:
+        """
+        :param p_texto: Texto de una palabra.
+        :return: El texto con cada carácter plegado.
+        """
+        return "".join(map(self.plegar, p_texto))
+
+    def consultar(self, p_patron: Sequence[str], p_jugadas: Iterable[str] = ()) -> Tuple[GrupoLongitud, int]:
+        """
+        Calcula el conjunto de palabras compatibles con un patrón.
+        Una palabra es compatible si tiene las letras reveladas en sus posiciones y ninguna
+        letra jugada en las posiciones que siguen ocultas (si la tuviera, estaría revelada).
+        :param p_patron: Ocurrencias, con "_" en las posiciones ocultas.
+        :param p_jugadas: Letras ya jugadas (acertadas o falladas).
+        :return: El grupo de la longitud del patrón y el conjunto de bits de sus palabras compatibles.
+        """
+        grupo = self.grupos.get(len(p_patron))
+        if grupo is None:
+            return GrupoLongitud(len(p_patron)), 0
+
+        patron = [self.plegar(simbolo) for simbolo in p_patron]
+        reveladas = {simbolo for simbolo in patron if simbolo != "_"}
+        jugadas = {self.plegar(simbolo) for simbolo in p_jugadas}
+        bits = grupo.todas
+        ocultas = []
+        for posicion, simbolo in enumerate(patron):
+            if simbolo == "_":
+                ocultas.append(posicion)
+            else:
+                bits &= grupo.casillas.get((posicion, simbolo), 0)
+
+        # Las letras falladas no pueden estar en ninguna parte de la palabra
+        for simbolo in jugadas - reveladas:
+            bits &= ~grupo.contiene.get(simbolo, 0)
+        # Las letras reveladas no pueden estar en las posiciones que siguen ocultas
+        for simbolo in reveladas:
+            for posicion in ocultas:
+                bits &= ~grupo.casillas.get((posicion, simbolo), 0)
+        return grupo, bits
+
+    def candidatas(self, p_patron: Sequence[str], p_jugadas: Iterable[str] = ()) -> List[int]:
+        """
+        Lista las palabras del diccionario compatibles con un patrón.
+        :param p_patron: Ocurrencias, con "_" en las posiciones ocultas.
+        :param p_jugadas: Letras ya jugadas (acertadas o falladas).
+        :return: Posiciones en el diccionario de las palabras compatibles.
+        """
+        grupo, bits = self.consultar(p_patron, p_jugadas)
+        return [grupo.palabras[local] for local in posiciones_desde_bits(bits)]
+
+    def candidatas_de_juego(self, p_juego: JuegoAhorcado) -> List[int]:
+        """
+        Lista las palabras compatibles con el estado de un juego, usando solo sus datos públicos.
+        :param p_juego: Juego en curso.
+        :return: Posiciones en el diccionario de las palabras compatibles.
+        """
+        jugadas = [letra.dar_letra() for letra in p_juego.dar_jugadas()]
+        return self.candidatas(p_juego.dar_ocurrencias(), jugadas)
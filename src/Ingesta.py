@@ -0,0 +1,322 @@
+__author__ = "Nicolas Alejandro Diaz Acosta"
+__license__ = "GPL"
+__version__ = "1.0.0"
+__email__ = "nicolas.diazacost@campusucc.edu.co"
+
+import argparse
+import heapq
+import os
+import re
+import shutil
+import sys
+import tempfile
+import time
+import unicodedata
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import IO, Callable, Iterable, Iterator, List, Optional
+
+from src.Corpus import ENCABEZADO, FIRMA, VERSION
+from src.Diccionario import abrir_lista
+from src.Plegado import quitar_tildes
+
+# Letras que se aceptan por defecto: las del teclado del juego
+ALFABETO_ESPANOL = "abcdefghijklmnñopqrstuvwxyz"
+# Secuencias de letras dentro de una línea (sin dígitos ni guiones bajos)
+PATRON_PALABRA = re.compile(r"[^\W\d_]+")
+# Palabras distintas que se guardan en memoria antes de volcarlas ordenadas a disco
+MAX_EN_MEMORIA = 1000000
+# Desplazamientos que se acumulan antes de escribirlos al archivo temporal
+TAMANO_TANDA = 65536
+
+
+class OpcionesIngesta:
+    """
+    Clase con los criterios que debe cumplir una palabra para entrar al diccionario.
+    """
+
+    def __init__(self, p_alfabeto: str = ALFABETO_ESPANOL, p_longitud_minima: int = 3,
+                 p_longitud_maxima: int = 20, p_quitar_tildes: bool = True):
+        """
+        :param p_alfabeto: Letras permitidas, en minúscula.
+        :param p_longitud_minima: Longitud mínima de las palabras.
+        :param p_longitud_maxima: Longitud máxima de las palabras.
+        :param p_quitar_tildes: Si se quitan las tildes y diéresis (la ñ se conserva).
+        """
+        self.alfabeto = p_alfabeto
+        self.longitud_minima = p_longitud_minima
+        self.longitud_maxima = p_longitud_maxima
+        self.quitar_tildes = p_quitar_tildes
+
+
+class ProgresoIngesta:
+    """
+    Clase que cuenta lo procesado por la ingesta y calcula su velocidad.
+    """
+
+    def __init__(self):
+        self.lineas = 0
+        self.aceptadas = 0
+        self.escritas = 0
+        self.segundos = 0.0
+
+    def lineas_por_segundo(self) -> float:
+        return self.lineas / self.segundos if self.segundos else 0.0
+
+    def resumen(self) -> str:
+        return (f"{self.lineas} líneas, {self.aceptadas} palabras aceptadas, {self.escritas} distintas "
+                f"en {self.segundos:.1f} s ({self.lineas_por_segundo():,.0f} líneas/s)")
+
+
+def normalizar_token(p_token: str, p_opciones: OpcionesIngesta) -> Optional[str]:
+    """
+    Normaliza un token igual que lo compara Letra.es_igual (sin distinguir mayúsculas, con las
+    letras acentuadas compuestas en un solo carácter) y aplica los filtros de la ingesta.
+    :param p_token: Secuencia de letras leída del texto.
+    :param p_opciones: Criterios de la ingesta.
+    :return: La palabra normalizada, o None si no cumple los criterios.
+    """
+    palabra = p_token.lower()
+    if not palabra.isascii():
+        palabra = unicodedata.normalize("NFC", palabra)
+        if p_opciones.quitar_tildes:
+            palabra = quitar_tildes(palabra)
+    if not p_opciones.longitud_minima <= len(palabra) <= p_opciones.longitud_maxima:
+        return None
+    # strip quita todas las letras permitidas: si queda algo, había una letra fuera del alfabeto
+    if palabra.strip(p_opciones.alfabeto):
+        return None
+    return palabra
+
+
+def normalizar_bloque(p_lineas: List[str], p_opciones: OpcionesIngesta) -> List[str]:
+    """
+    Separa en palabras un bloque de líneas y se queda con las que cumplen los criterios.
+    :param p_lineas: Líneas de texto.
+    :param p_opciones: Criterios de la ingesta.
+    :return: Palabras aceptadas, en el orden en que aparecen.
+    """
+    aceptadas = []
+    for linea in p_lineas:
+        for token in PATRON_PALABRA.findall(linea):
+            palabra = normalizar_token(token, p_opciones)
+            if palabra is not None:
+                aceptadas.append(palabra)
+    return aceptadas
+
+
+def leer_bloques(p_archivo: IO[str], p_tamano: int, p_progreso: ProgresoIngesta) -> Iterator[List[str]]:
+    """
+    Lee un archivo de texto en bloques de líneas.
+    :param p_archivo: Archivo abierto en modo texto.
+    :param p_tamano: Líneas por bloque.
+    :param p_progreso: Contador de líneas leídas.
+    :return: Generador de bloques.
+    """
+    bloque = []
+    for linea in p_archivo:
+        bloque.append(linea)
+        if len(bloque) == p_tamano:
+            p_progreso.lineas += len(bloque)
+            yield bloque
+            bloque = []
+    if bloque:
+        p_progreso.lineas += len(bloque)
+        yield bloque
+
+
+def normalizar_en_paralelo(p_bloques: Iterable[List[str]], p_opciones: OpcionesIngesta,
+                           p_trabajadores: int) -> Iterator[List[str]]:
+    """
+    Normaliza los bloques en varios procesos, en orden y con pocos bloques en vuelo a la vez,
+    para que la memoria no crezca con el tamaño de la entrada.
+    :param p_bloques: Bloques de líneas.
+    :param p_opciones: Criterios de la ingesta.
+    :param p_trabajadores: Número de procesos; con 1 se normaliza en este mismo proceso.
+    :return: Generador con las palabras aceptadas de cada bloque.
+    """
+    if p_trabajadores <= 1:
+        for bloque in p_bloques:
+            yield normalizar_bloque(bloque, p_opciones)
+        return
+    with ProcessPoolExecutor(max_workers=p_trabajadores) as ejecutor:
+        en_vuelo = deque()
+        for bloque in p_bloques:
+            en_vuelo.append(ejecutor.submit(normalizar_bloque, bloque, p_opciones))
+            if len(en_vuelo) >= 2 * p_trabajadores:
+                yield en_vuelo.popleft().result()
+        while en_vuelo:
+            yield en_vuelo.popleft().result()
+
+
+def _volcar(p_palabras: set, p_carpeta: str) -> str:
+    """
+    Escribe un conjunto de palabras, ordenadas y una por línea, en un archivo temporal.
+    :return: Ruta del archivo escrito.
+    """
+    descriptor, ruta = tempfile.mkstemp(dir=p_carpeta, suffix=".tramo")
+    with os.fdopen(descriptor, "w", encoding="utf-8") as archivo:
+        for palabra in sorted(p_palabras):
+            archivo.write(palabra + "\n")
+    return ruta
+
+
+def sin_repetir_externo(p_palabras: Iterable[str], p_carpeta: str,
+                        p_max_en_memoria: int = MAX_EN_MEMORIA) -> Iterator[str]:
+    """
+    Descarta las palabras repetidas con memoria acotada (ordenamiento externo): las palabras
+    distintas se juntan hasta p_max_en_memoria, se vuelcan ordenadas a disco y al final se
+    mezclan todos los tramos.
+    :param p_palabras: Palabras normalizadas.
+    :param p_carpeta: Carpeta para los archivos temporales.
+    :param p_max_en_memoria: Palabras distintas que se guardan en memoria a la vez.
+    :return: Generador con cada palabra una sola vez, en orden.
+    """
+    tramos = []
+    vistas = set()
+    try:
+        for palabra in p_palabras:
+            vistas.add(palabra)
+            if len(vistas) >= p_max_en_memoria:
+                tramos.append(_volcar(vistas, p_carpeta))
+                vistas = set()
+        if not tramos:
+            # Todo cupo en memoria: no hace falta pasar por disco
+            yield from sorted(vistas)
+            return
+        if vistas:
+            tramos.append(_volcar(vistas, p_carpeta))
+            vistas = set()
+
+        archivos = [open(ruta, encoding="utf-8") for ruta in tramos]
+        try:
+            anterior = None
+            for linea in heapq.merge(*archivos):
+                if linea != anterior:
+                    yield linea[:-1]
+                    anterior = linea
+        finally:
+            for archivo in archivos:
+                archivo.close()
+    finally:
+        for ruta in tramos:
+            os.unlink(ruta)
+
+
+def escribir_corpus(p_palabras: Iterable[str], p_ruta: str, p_carpeta: str, p_progreso: ProgresoIngesta):
+    """
+    Escribe un corpus en disco a medida que llegan las palabras, sin tenerlas todas en memoria.
+    Los datos van a un temporal junto al archivo final y los desplazamientos a otro que se copia al
+    final; el corpus terminado reemplaza al final de una vez, así nunca queda uno a medias.
+    :param p_palabras: Palabras normalizadas y sin repetir.
+    :param p_ruta: Archivo de corpus a crear.
+    :param p_carpeta: Carpeta para los archivos temporales.
+    :param p_progreso: Contador de palabras escritas.
+    :raise ValueError: Si los datos no caben en desplazamientos de 32 bits.
+    """
+    descriptor, temporal = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(p_ruta)), suffix=".tmp")
+    try:
+        with os.fdopen(descriptor, "wb") as salida, tempfile.TemporaryFile(dir=p_carpeta) as tabla:
+            salida.write(bytes(ENCABEZADO.size))
+            longitud = 0
+            tanda = array("I", [0])
+            for palabra in p_palabras:
+                datos = palabra.encode("utf-8")
+                salida.write(datos)
+                longitud += len(datos)
+                if longitud >= 1 << 32:
+                    raise ValueError("El corpus supera los 4 GB de datos")
+                tanda.append(longitud)
+                p_progreso.escritas += 1
+                if len(tanda) >= TAMANO_TANDA:
+                    if sys.byteorder != "little":
+                        tanda.byteswap()
+                    tabla.write(tanda.tobytes())
+                    tanda = array("I")
+            if sys.byteorder != "little":
+                tanda.byteswap()
+            tabla.write(tanda.tobytes())
+
+            salida.write(bytes(-longitud % 4))
+            tabla.seek(0)
+            shutil.copyfileobj(tabla, salida)
+            salida.seek(0)
+            salida.write(ENCABEZADO.pack(FIRMA, VERSION, 0, p_progreso.escritas, longitud))
+            salida.flush()
+            os.fsync(salida.fileno())
+        os.replace(temporal, p_ruta)
+    except BaseException:
+        os.unlink(temporal)
+        raise
+
+
+def ingerir(p_origen: str, p_destino: str, p_opciones: Optional[OpcionesIngesta] = None,
+            p_trabajadores: int = 1, p_bloque: int = 20000, p_max_en_memoria: int = MAX_EN_MEMORIA,
+            p_informe: Optional[Callable[[ProgresoIngesta], None]] = None) -> ProgresoIngesta:
+    """
+    Convierte un volcado de texto (plano o .gz) en un corpus empaquetado listo para
+    Diccionario.desde_archivo. Cada etapa es un generador, así la memoria usada no depende
+    del tamaño de la entrada: descomprimir, separar en palabras, normalizar y filtrar,
+    descartar repetidas y escribir.
+    :param p_origen: Archivo de texto de entrada.
+    :param p_destino: Archivo .corpus de salida.
+    :param p_opciones: Criterios de la ingesta.
+    :param p_trabajadores: Procesos que normalizan los bloques.
+    :param p_bloque: Líneas por bloque.
+    :param p_max_en_memoria: Palabras distintas que se guardan en memoria a la vez.
+    :param p_informe: Función que se llama con el progreso después de cada bloque (opcional).
+    :return: Las cifras de la ingesta.
+    """
+    opciones = p_opciones if p_opciones is not None else OpcionesIngesta()
+    progreso = ProgresoIngesta()
+    carpeta = os.path.dirname(os.path.abspath(p_destino))
+    inicio = time.perf_counter()
+
+    def aceptadas(p_listas: Iterable[List[str]]) -> Iterator[str]:
+        for lista in p_listas:
+            progreso.aceptadas += len(lista)
+            progreso.segundos = time.perf_counter() - inicio
+            if p_informe is not None:
+                p_informe(progreso)
+            yield from lista
+
+    with abrir_lista(p_origen) as archivo:
+        bloques = leer_bloques(archivo, p_bloque, progreso)
+        palabras = aceptadas(normalizar_en_paralelo(bloques, opciones, p_trabajadores))
+        escribir_corpus(sin_repetir_externo(palabras, carpeta, p_max_en_memoria), p_destino, carpeta, progreso)
+    progreso.segundos = time.perf_counter() - inicio
+    return progreso
+
+
+def main():
+    """
+    Construye un corpus a partir de un volcado de texto.
+    Uso: python -m src.Ingesta volcado.txt.gz palabras.corpus [--trabajadores 8] [--minima 3] [--maxima 20]
+    """
+    analizador = argparse.ArgumentParser(description="Ingesta de volcados de texto a un corpus empaquetado")
+    analizador.add_argument("origen", help="Texto de entrada (plano o .gz)")
+    analizador.add_argument("destino", help="Corpus de salida (.corpus)")
+    analizador.add_argument("--alfabeto", default=ALFABETO_ESPANOL)
+    analizador.add_argument("--minima", type=int, default=3, help="Longitud mínima de las palabras")
+    analizador.add_argument("--maxima", type=int, default=20, help="Longitud máxima de las palabras")
+    analizador.add_argument("--con-tildes", action="store_true", help="Conservar tildes y diéresis")
+    analizador.add_argument("--trabajadores", type=int, default=os.cpu_count())
+    analizador.add_argument("--bloque", type=int, default=20000, help="Líneas por bloque")
+    analizador.add_argument("--memoria", type=int, default=MAX_EN_MEMORIA,
+                            help="Palabras distintas en memoria antes de volcar a disco")
+    argumentos = analizador.parse_args()
+
+    opciones = OpcionesIngesta(argumentos.alfabeto, argumentos.minima, argumentos.maxima, not argumentos.con_tildes)
+    def informar(p_progreso: ProgresoIngesta):
+        print(f"\r{p_progreso.lineas} líneas ({p_progreso.lineas_por_segundo():,.0f} líneas/s)",
+              end="", file=sys.stderr, flush=True)
+
+    progreso = ingerir(argumentos.origen, argumentos.destino, opciones, argumentos.trabajadores,
+                       argumentos.bloque, argumentos.memoria, informar)
+    print(file=sys.stderr)
+    print(progreso.resumen())
+
+
+if __name__ == "__main__":
+    main()
@@ -5,7 +5,10 @@ __email__ = "nicolas.diazacost@campusucc.edu.co"
 
 import random
 from enum import Enum
-from typing import List
+from typing import List, Optional
+from src.Alfabeto import Alfabeto, ESPANOL
+from src.Calendario import sortear_posicion
+from src.Diccionario import Diccionario, PALABRAS_PREDETERMINADAS
 from src.Palabra import Palabra
 from src.Letra import Letra
 
@@ -17,42 +20,134 @@ class Estado(Enum):
     AHORCADO = 4
 
 class JuegoAhorcado:
-    TOTAL_PALABRAS = 12
+    TOTAL_PALABRAS = len(PALABRAS_PREDETERMINADAS)
     MAX_INTENTOS = 6
 
-    def __init__(self):
-        self.diccionario: List[Palabra] = [
-            Palabra("algoritmo"),
-            Palabra("contenedora"),
-            Palabra("avance"),
-            Palabra("ciclo"),
-            Palabra("indice"),
-            Palabra("instrucciones"),
-            Palabra("arreglo"),
-            Palabra("vector"),
-            Palabra("inicio"),
-            Palabra("cuerpo"),
-            Palabra("recorrido"),
-            Palabra("patron"),
-        ]
-        
+    def __init__(self, diccionario: Optional[Diccionario] = None, selector=None,
+                 semilla: Optional[int] = None, generador: Optional[random.Random] = None, dificultades=None,
+                 alfabeto: Optional[Alfabeto] = None, bitacora=None, sesion: int = 0, rueda=None,
+                 limite_jugada: Optional[float] = None):
+        # El diccionario es de solo lectura y se comparte entre todos los juegos;
+        # cada juego solo guarda la posición de su palabra actual
+        self.diccionario = diccionario if diccionario is not None else Diccionario.predeterminado()
+        self.TOTAL_PALABRAS = len(self.diccionario)
+        # Letras con las que se juega; las jugadas se guardan como bits de sus códigos
+        self.alfabeto = alfabeto if alfabeto is not None else ESPANOL
+        # Opcionalmente, un objeto con un método siguiente() que decide qué palabra sale
+        # (por ejemplo un SelectorSinRepeticion); si no hay, se escoge al azar
+        self.selector = selector
+        # Cada juego sortea sus palabras con su propia semilla, así los juegos en paralelo no
+        # comparten estado y con la misma semilla se repiten exactamente las mismas partidas.
+        # También se puede pasar un random.Random propio en lugar de la semilla.
+        self.generador = generador
+        self.semilla = semilla if semilla is not None else random.getrandbits(64)
+        self.partidas = 0                            # Partidas iniciadas con esta semilla
+        # Opcionalmente, una TablaDificultad del diccionario para escoger palabras por dificultad
+        self.dificultades = dificultades
+        # Opcionalmente, una Bitacora donde se registra cada inicio y cada jugada de esta sesión
+        self.bitacora = bitacora
+        self.sesion = sesion
+        # Opcionalmente, un límite de segundos por jugada: si vence, cuenta como un fallo.
+        # Los vencimientos de todos los juegos los lleva una misma RuedaTemporizadores
+        if (rueda is None) != (limite_jugada is None):
+            raise ValueError("El límite por jugada necesita una rueda de temporizadores, y viceversa")
+        self.rueda = rueda
+        self.limite_jugada = limite_jugada
+        self.turno = None                            # Temporizador de la jugada en curso
+        self.receptor_turno = self                   # Quien cobra el vencimiento (el juego o quien lo envuelva)
+
         # HAy que inicializar las variables del jueguitoo
+        self.posicion_actual = None                  # Posición de la palabra en el diccionario
         self.palabra_actual = None                    # No hay palabra seleccionada aún
         self.jugadas = []                            # Lista vacía de letras jugadas
+        self.mascara_jugadas = 0                     # Un bit por el código de cada letra jugada
+        self.letras_restantes = 0                    # Símbolos distintos que faltan por adivinar
+        self.ocurrencias = []                        # Patrón visible, se actualiza con cada acierto
         self.intentos_disponibles = self.MAX_INTENTOS # Empezamos con 6 intentos
         self.estado = Estado.NO_INICIADO 
 
-    def iniciar_juego(self):
-        # Generamos un número aleatorio entre 0 y 11 (TOTAL_PALABRAS - 1)
-        posicion_aleatoria = random.randint(0, self.TOTAL_PALABRAS - 1)
+    def iniciar_juego(self, banda=None):
+        if banda is not None:
+            # Las palabras de la banda ocupan un tramo contiguo de la tabla ordenada por puntaje
+            if self.dificultades is None:
+                raise ValueError("Para escoger por dificultad hace falta una tabla de dificultad")
+            inicio, fin = self.dificultades.dar_rango(banda)
+            if fin == inicio:
+                raise ValueError(f"No hay palabras en la banda de dificultad {banda}")
+            if self.generador is not None:
+                numero = self.generador.randrange(fin - inicio)
+            else:
+                numero = sortear_posicion(self.semilla, self.partidas, fin - inicio)
+                self.partidas += 1
+            posicion = self.dificultades.dar_posicion(inicio + numero)
+        elif self.selector is not None:
+            # El selector decide la posición (por ejemplo, sin repetir palabras)
+            posicion = self.selector.siguiente()
+        elif self.generador is not None:
+            # Generamos un número aleatorio entre 0 y TOTAL_PALABRAS - 1
+            posicion = self.generador.randrange(self.TOTAL_PALABRAS)
+        else:
+            # Sorteamos a partir de la semilla y del número de partida
+            posicion = sortear_posicion(self.semilla, self.partidas, self.TOTAL_PALABRAS)
+            self.partidas += 1
         
         # Seleccionamos la palabra en esa posición del diccionario
-        self.palabra_actual = self.diccionario[posicion_aleatoria]
+        self.iniciar_con_posicion(posicion)
+
+    def iniciar_con_posicion(self, posicion: int):
+        # La Palabra se construye solo para este juego a partir del diccionario compartido
+        self.iniciar_con_palabra(Palabra(self.diccionario.dar_texto(posicion), self.alfabeto), posicion)
+
+    def iniciar_con_palabra(self, palabra: Palabra, posicion: Optional[int] = None):
+        # La palabra debe usar los códigos del alfabeto de este juego
+        if palabra.alfabeto is not self.alfabeto:
+            palabra = Palabra("".join(letra.dar_letra() for letra in palabra.dar_letras()), self.alfabeto)
+        # Fijamos la palabra que se va a adivinar
+        self.palabra_actual = palabra
+        self.posicion_actual = posicion
         
         # Reiniciamos todas las variables del juego
         self.jugadas = []                            # Limpiamos las jugadas anteriores
+        self.mascara_jugadas = 0                     # Y también su máscara
+        self.letras_restantes = palabra.dar_cantidad_distintas()
+        self.ocurrencias = ["_"] * len(palabra.dar_letras())
+        if palabra.visibles:
+            # Los caracteres que no son del alfabeto se ven desde el principio
+            for posicion, letra in enumerate(palabra.dar_letras()):
+                if palabra.visibles >> posicion & 1:
+                    self.ocurrencias[posicion] = letra.dar_letra()
         self.intentos_disponibles = self.MAX_INTENTOS # Restauramos los 6 intentos
-        self.estado = Estado.JUGANDO                 # Cambiamos el estado a jugando
+        self.estado = Estado.JUGANDO if self.letras_restantes else Estado.GANADOR
+        if self.bitacora is not None:
+            self.bitacora.registrar_inicio(self.sesion, self)
+        if self.rueda is not None:
+            self.armar_turno()
+
+    def restaurar_partida(self, posicion: int, mascara_jugadas: int, intentos: int, estado: Estado):
+        # Reconstruye una partida guardada a partir de su palabra y de la máscara de letras jugadas;
+        # las jugadas quedan en el orden del alfabeto, no en el orden en que se hicieron.
+        # Restaurar no es un evento nuevo, así que no se registra en la bitácora
+        bitacora, self.bitacora = self.bitacora, None
+        try:
+            self.iniciar_con_posicion(posicion)
+        finally:
+            self.bitacora = bitacora
+        palabra = self.palabra_actual
+        self.jugadas = self.alfabeto.dar_letras_de_mascara(mascara_jugadas)
+        self.mascara_jugadas = mascara_jugadas
+        for bit, posiciones in palabra.posiciones.items():
+            if mascara_jugadas & bit:
+                self.letras_restantes -= 1
+                while posiciones:
+                    menor = posiciones & -posiciones
+                    posicion_letra = menor.bit_length() - 1
+                    self.ocurrencias[posicion_letra] = palabra.letras[posicion_letra].dar_letra()
+                    posiciones ^= menor
+        self.intentos_disponibles = intentos
+        self.estado = estado
+        if self.rueda is not None:
+            # La jugada en curso vuelve a tener el tiempo completo
+            self.armar_turno()
 
     def jugar_letra(self, letra: Letra) -> bool:
         # Verificamos si el juego está en estado de juego
@@ -60,23 +155,40 @@ class JuegoAhorcado:
             # Si no estamos jugando, no se puede jugar una letra
             return False
         
-        # Verificamos si la letra ya fue utilizada anteriormente
-        if self.letra_utilizada(letra):
-            # Si ya fue utilizada, no la procesamos
+        # Verificamos si la letra es del alfabeto y si ya fue utilizada anteriormente
+        bit = self.alfabeto.bit_de(letra)
+        if bit == 0 or self.mascara_jugadas & bit:
+            # Si no es una letra del juego o ya fue utilizada, no la procesamos
             return False
         
-        # Agregamos la letra a la lista de jugadas
-        self.jugadas.append(letra)
+        # Agregamos la letra (en su forma canónica del alfabeto) a la lista de jugadas y a su máscara
+        self.jugadas.append(self.alfabeto.dar_letra(bit.bit_length() - 1))
+        self.mascara_jugadas |= bit
         
         # Verificamos si la letra está en la palabra actual
-        if self.palabra_actual.esta_letra(letra):
+        posiciones = self.palabra_actual.posiciones.get(bit, 0)
+        if posiciones:
             # ¡La letra SÍ está en la palabra!
             
+            # Destapamos solo las posiciones donde aparece la letra, tal como está escrita en la palabra
+            letras = self.palabra_actual.letras
+            while posiciones:
+                menor = posiciones & -posiciones
+                posicion = menor.bit_length() - 1
+                self.ocurrencias[posicion] = letras[posicion].dar_letra()
+                posiciones ^= menor
+            self.letras_restantes -= 1
+            
             # Verificamos si con esta letra se completó la palabra
-            if self.palabra_actual.esta_completa(self.jugadas):
+            if self.letras_restantes == 0:
                 # Si se completó, el jugador ganó
                 self.estado = Estado.GANADOR
             
+            if self.bitacora is not None:
+                self.bitacora.registrar_jugada(self.sesion, self, bit, True)
+            if self.rueda is not None:
+                self.armar_turno()
+            
             # Retornamos True porque la letra estaba en la palabra
             return True
         else:
@@ -90,16 +202,48 @@ class JuegoAhorcado:
                 # Si no quedan intentos, el jugador fue ahorcado
                 self.estado = Estado.AHORCADO
             
+            if self.bitacora is not None:
+                self.bitacora.registrar_jugada(self.sesion, self, bit, False)
+            if self.rueda is not None:
+                self.armar_turno()
+            
             # Retornamos False porque la letra no estaba en la palabra
             return False
 
+    def armar_turno(self):
+        # Mientras se juega, el turno vence limite_jugada segundos después de la última jugada
+        if self.estado == Estado.JUGANDO:
+            self.turno = self.rueda.reprogramar(self.turno, self.limite_jugada, self.receptor_turno)
+        else:
+            self.detener_turno()
+
+    def detener_turno(self):
+        # Sin turno pendiente el juego no recibe vencimientos (por ejemplo, al guardarlo en disco)
+        if self.turno is not None:
+            self.rueda.cancelar(self.turno)
+
+    def vencer_turno(self) -> bool:
+        # Se acabó el tiempo de la jugada: cuenta como un fallo
+        if self.estado != Estado.JUGANDO:
+            return False
+        self.intentos_disponibles -= 1
+        if self.intentos_disponibles == 0:
+            self.estado = Estado.AHORCADO
+        if self.bitacora is not None:
+            self.bitacora.registrar_vencimiento(self.sesion, self)
+        self.armar_turno()
+        return True
+
     def dar_palabra_actual(self) -> Palabra:
         return self.palabra_actual
 
+    def dar_posicion_actual(self) -> Optional[int]:
+        return self.posicion_actual
+
     def dar_palabra(self, posicion: int) -> Palabra:
         # Verificamos que la posición esté dentro del rango válido
         if 0 <= posicion < self.TOTAL_PALABRAS:
-            return self.diccionario[posicion]
+            return Palabra(self.diccionario.dar_texto(posicion), self.alfabeto)
         
         # Si la posición no es válida, retornamos None
         return None
@@ -111,29 +255,30 @@ class JuegoAhorcado:
         return self.jugadas
 
     def dar_ocurrencias(self) -> List[Letra]:
-        # Si no hay palabra actual, retornamos lista vacía
-        if self.palabra_actual is None:
-            return []
-        
-        # Usamos el método de la palabra para obtener las ocurrencias
-        return self.palabra_actual.dar_ocurrencias(self.jugadas)
+        # El patrón se mantiene al día en jugar_letra; si no hay palabra está vacío.
+        # Se entrega una copia: modificarla no debe cambiar el estado del juego
+        return list(self.ocurrencias)
 
     def dar_estado(self) -> Estado:
         return self.estado
     
     def letra_utilizada(self, letra: Letra) -> bool:
-        # Recorremos todas las jugadas realizadas
-        for jugada in self.jugadas:
-            # Comparamos cada jugada con la letra usando es_igual
-            if jugada.es_igual(letra):
-                # Si encontramos la letra, ya fue utilizada
-                return True
-        
-        # Si no la encontramos, no ha sido utilizada
-        return False
+        # Cada letra es un bit de su código en el alfabeto: basta consultar la máscara
+        return self.mascara_jugadas & self.alfabeto.bit_de(letra) != 0
 
     def metodo1(self) -> str:
         return "Respuesta 1"
 
     def metodo2(self) -> str:
         return "Respuesta 2"
+
+
+def vencer_turnos(rueda, ahora: Optional[float] = None) -> list:
+    # Avanza la rueda y cobra como fallo cada turno vencido, todos en un solo lote. Cada vencimiento
+    # lo cobra el receptor_turno del juego: el juego mismo o, por ejemplo, el JuegoCompartido que lo envuelve
+    vencidos = []
+    for temporizador in rueda.avanzar(ahora):
+        receptor = temporizador.dato
+        if receptor.vencer_turno():
+            vencidos.append(receptor)
+    return vencidos
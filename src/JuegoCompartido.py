@@ -0,0 +1,190 @@
+__author__ = "Nicolas Alejandro Diaz Acosta"
+__license__ = "GPL"
+__version__ = "1.0.0"
+__email__ = "nicolas.diazacost@campusucc.edu.co"
+
+import asyncio
+import threading
+from typing import Any, Dict, Hashable, List, NamedTuple, Optional, Tuple
+
+from src.JuegoAhorcado import JuegoAhorcado, Estado
+from src.Letra import Letra
+
+
+class VistaCompartida(NamedTuple):
+    """
+    Foto inmutable de la partida compartida. Todos sus campos corresponden al mismo instante.
+    """
+    version: int                                      # Aumenta con cada cambio de la partida
+    ocurrencias: str
+    intentos: int
+    estado: Estado
+    jugadas: str
+    mascara_jugadas: int
+    mascara_aciertos: int                             # Letras jugadas que estaban en la palabra
+
+
+class Resultado(NamedTuple):
+    acierto: bool                                     # Si la letra está en la palabra
+    nueva: bool                                       # False si otro jugador ya la había jugado
+    vista: VistaCompartida                            # La partida justo después de la jugada
+
+
+class JuegoCompartido:
+    """
+    Clase para que muchos jugadores adivinen la misma palabra a la vez, desde hilos o desde tareas
+    de asyncio. Las jugadas que cambian la partida pasan de a una por un candado y, al terminar,
+    publican una VistaCompartida nueva; los jugadores leen siempre la vista publicada, sin candado,
+    así nadie ve un patrón a medio actualizar.
+    Una letra que ya se jugó se reconoce en la vista con una operación de bits, sin tomar el candado:
+    si varios jugadores envían la misma letra a la vez, solo la primera cuenta y las demás reciben
+    su mismo resultado, sin gastar intentos.
+    Para jugar por puntos, cada letra acertada da al jugador que la jugó primero un punto por
+    posición destapada.
+    Si el juego tiene límite por jugada, sus vencimientos (los cobra vencer_turnos) también pasan por
+    el candado y publican una vista nueva.
+    """
+
+    def __init__(self, p_juego: Optional[JuegoAhorcado] = None):
+        """
+        :param p_juego: Juego con el que se juega (diccionario, alfabeto, dificultad...);
+        desde ahora solo se debe usar a través de este objeto.
+        """
+        self.juego = p_juego if p_juego is not None else JuegoAhorcado()
+        self._candado = threading.Lock()
+        self._cambio = threading.Condition(self._candado)
+        self.puntajes: Dict[Hashable, int] = {}
+        self.fallos: Dict[Hashable, int] = {}
+        self._mascara_aciertos = 0
+        self._version = 0
+        # Tareas de asyncio que esperan un cambio: (ciclo de eventos, futuro)
+        self._esperas: List[Tuple[asyncio.AbstractEventLoop, asyncio.Future]] = []
+        self.vista = self._publicar()
+        if self.juego.rueda is not None:
+            # La rueda entrega los vencimientos del turno a este objeto, no directamente al juego
+            self.juego.receptor_turno = self
+            if self.juego.turno is not None:
+                self.juego.turno.dato = self
+
+    def iniciar_juego(self, banda=None, p_version: Optional[int] = None) -> VistaCompartida:
+        """
+        Empieza una palabra nueva para todos.
+        :param banda: Banda de dificultad, como en JuegoAhorcado.iniciar_juego.
+        :param p_version: Si se indica, solo se reinicia si la partida sigue en esa versión; así, si
+        varios jugadores piden una palabra nueva a la vez al ver que la anterior terminó, se inicia una sola.
+        :return: La vista después de iniciar (o la actual, si otro ya la reinició).
+        """
+        with self._candado:
+            if p_version is not None and p_version != self._version:
+                return self.vista
+            self.juego.iniciar_juego(banda)
+            self.puntajes = {}
+            self.fallos = {}
+            self._mascara_aciertos = 0
+            vista, esperas = self._publicar_y_despertar()
+        self._avisar(esperas, vista)
+        return vista
+
+    def jugar(self, p_jugador: Hashable, p_letra: Letra) -> Resultado:
+        """
+        Juega una letra. No hace falta await: la jugada dura microsegundos, así que también se puede
+        llamar desde una corrutina.
+        :param p_jugador: Identificador del jugador.
+        :param p_letra: Letra jugada.
+        :return: El resultado, con la vista en la que ya está aplicado.
+        """
+        bit = self.juego.alfabeto.bit_de(p_letra)
+        vista = self.vista
+        if bit == 0 or vista.mascara_jugadas & bit:
+            # Letra fuera del alfabeto o ya jugada: se responde con la vista publicada, sin candado
+            return Resultado(vista.mascara_aciertos & bit != 0, False, vista)
+        with self._candado:
+            juego = self.juego
+            if juego.estado != Estado.JUGANDO or juego.mascara_jugadas & bit:
+                # Otro jugador la jugó mientras se esperaba el candado, o la partida terminó
+                return Resultado(self._mascara_aciertos & bit != 0, False, self.vista)
+            acierto = juego.jugar_letra(p_letra)
+            if acierto:
+                self._mascara_aciertos |= bit
+                destapadas = bin(juego.palabra_actual.posiciones[bit]).count("1")
+                self.puntajes[p_jugador] = self.puntajes.get(p_jugador, 0) + destapadas
+            else:
+                self.fallos[p_jugador] = self.fallos.get(p_jugador, 0) + 1
+            vista, esperas = self._publicar_y_despertar()
+        self._avisar(esperas, vista)
+        return Resultado(acierto, True, vista)
+
+    def vencer_turno(self) -> bool:
+        """
+        Cobra como fallo un turno vencido, igual que una jugada: con el candado y publicando la vista.
+        Lo llama vencer_turnos al avanzar la rueda.
+        :return: True si el vencimiento cambió la partida.
+        """
+        with self._candado:
+            turno = self.juego.turno
+            if turno is not None and turno.esta_activo():
+                # Alguien jugó entre el vencimiento y la toma del candado, y el turno ya se renovó
+                return False
+            if not self.juego.vencer_turno():
+                return False
+            vista, esperas = self._publicar_y_despertar()
+        self._avisar(esperas, vista)
+        return True
+
+    def dar_ocurrencias(self) -> str:
+        return self.vista.ocurrencias
+
+    def dar_estado(self) -> Estado:
+        return self.vista.estado
+
+    def esperar_cambio(self, p_version: int, p_espera: Optional[float] = None) -> VistaCompartida:
+        """
+        Bloquea el hilo hasta que la partida pase de una versión.
+        :param p_version: Versión que ya se conoce.
+        :param p_espera: Segundos máximos de espera, o None para esperar sin límite.
+        :return: La vista actual (la misma versión si se acabó la espera).
+        """
+        with self._cambio:
+            self._cambio.wait_for(lambda: self._version != p_version, p_espera)
+            return self.vista
+
+    async def esperar_cambio_async(self, p_version: int) -> VistaCompartida:
+        """
+        Espera, sin bloquear el ciclo de eventos, a que la partida pase de una versión. Funciona
+        aunque la jugada que la cambie se haga desde otro hilo.
+        :param p_version: Versión que ya se conoce.
+        :return: La vista nueva.
+        """
+        ciclo = asyncio.get_running_loop()
+        with self._candado:
+            if self._version != p_version:
+                return self.vista
+            futuro = ciclo.create_future()
+            self._esperas.append((ciclo, futuro))
+        return await futuro
+
+    def _publicar(self) -> VistaCompartida:
+        juego = self.juego
+        self._version += 1
+        self.vista = VistaCompartida(self._version, "".join(juego.ocurrencias), juego.intentos_disponibles,
+                                     juego.estado, "".join(letra.dar_letra() for letra in juego.jugadas),
+                                     juego.mascara_jugadas, self._mascara_aciertos)
+        return self.vista
+
+    def _publicar_y_despertar(self) -> Tuple[VistaCompartida, List[Tuple[asyncio.AbstractEventLoop, Any]]]:
+        # Se llama con el candado tomado
+        vista = self._publicar()
+        self._cambio.notify_all()
+        esperas, self._esperas = self._esperas, []
+        return vista, esperas
+
+    @staticmethod
+    def _avisar(p_esperas, p_vista: VistaCompartida):
+        # Fuera del candado: cada futuro se resuelve en su propio ciclo de eventos
+        for ciclo, futuro in p_esperas:
+            ciclo.call_soon_threadsafe(_resolver, futuro, p_vista)
+
+
+def _resolver(p_futuro: asyncio.Future, p_vista: VistaCompartida):
+    if not p_futuro.done():
+        p_futuro.set_result(p_vista)
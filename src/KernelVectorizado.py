@@ -0,0 +1,174 @@
+__author__ = "Nicolas Alejandro Diaz Acosta"
+__license__ = "GPL"
+__version__ = "1.0.0"
+__email__ = "nicolas.diazacost@campusucc.edu.co"
+
+from typing import List, Optional, Sequence, Union
+
+import numpy as np
+
+from src.Alfabeto import Alfabeto, ESPANOL
+from src.Diccionario import Diccionario
+from src.JuegoAhorcado import JuegoAhorcado, Estado
+from src.Letra import Letra
+
+# Código que rellena las posiciones que sobran en las palabras más cortas que la más larga
+RELLENO = 255
+# Código de los caracteres que no son del alfabeto (guiones, apóstrofos...): se ven desde el principio
+VISIBLE = 254
+
+
+class LoteJuegos:
+    """
+    Clase que juega muchas partidas a la vez con NumPy.
+    Cada fila de los arreglos es una partida: la palabra codificada como uint8 con los códigos del
+    alfabeto (que tiene como mucho 64 letras), la máscara de letras de la palabra, la máscara de letras jugadas, los intentos disponibles y el estado.
+    Las letras reveladas son jugadas & mascara_palabra, así que no hace falta recorrer la
+    palabra en cada jugada; las posiciones reveladas se calculan solo cuando se piden.
+    Una jugada se aplica a todas las partidas con unas pocas operaciones sobre arreglos y da
+    exactamente los mismos resultados que JuegoAhorcado.jugar_letra en cada partida.
+    """
+
+    def __init__(self, p_palabras: Sequence[str], p_alfabeto: Alfabeto = ESPANOL):
+        """
+        Inicia una partida por cada palabra.
+        :param p_palabras: Texto de la palabra de cada partida.
+        :param p_alfabeto: Alfabeto con el que se juega, el mismo que usaría JuegoAhorcado.
+        :raise ValueError: Si el lote está vacío.
+        """
+        if len(p_palabras) == 0:
+            raise ValueError("El lote debe tener al menos una partida")
+        self.alfabeto = p_alfabeto
+        # Textos originales, para mostrar cada letra tal como está escrita (por ejemplo, con tilde)
+        self.textos = list(p_palabras)
+        cantidad = len(p_palabras)
+        longitud = max(len(palabra) for palabra in p_palabras)
+
+        self.palabras = np.full((cantidad, longitud), RELLENO, dtype=np.uint8)
+        self.mascara_palabra = np.zeros(cantidad, dtype=np.uint64)
+        self.restantes = np.zeros(cantidad, dtype=np.uint8)
+        for fila, palabra in enumerate(p_palabras):
+            codigos = [self.codificar(caracter) for caracter in palabra]
+            self.palabras[fila, :len(codigos)] = [VISIBLE if codigo is None else codigo for codigo in codigos]
+            mascara = 0
+            for codigo in codigos:
+                if codigo is not None:
+                    mascara |= 1 << codigo
+            self.mascara_palabra[fila] = mascara
+            self.restantes[fila] = bin(mascara).count("1")
+
+        self.jugadas = np.zeros(cantidad, dtype=np.uint64)
+        self.intentos = np.full(cantidad, JuegoAhorcado.MAX_INTENTOS, dtype=np.int8)
+        # Copia booleana de estado == JUGANDO, para no recalcularla en cada jugada.
+        # Una palabra sin letras del alfabeto ya está ganada, como en iniciar_con_palabra
+        self.activas = self.restantes != 0
+        self.estado = np.where(self.activas, np.uint8(Estado.JUGANDO.value), np.uint8(Estado.GANADOR.value))
+
+    @classmethod
+    def desde_diccionario(cls, p_diccionario: Diccionario, p_posiciones: Sequence[int],
+                          p_alfabeto: Alfabeto = ESPANOL) -> 'LoteJuegos':
+        """
+        Inicia una partida por cada posición del diccionario.
+        :param p_diccionario: Diccionario del que salen las palabras.
+        :param p_posiciones: Posición de la palabra de cada partida.
+        :param p_alfabeto: Alfabeto con el que se juega.
+        :return: El lote de partidas.
+        """
+        return cls([p_diccionario.dar_texto(posicion) for posicion in p_posiciones], p_alfabeto)
+
+    def codificar(self, p_caracter: str) -> Optional[int]:
+        """
+        Devuelve el código de un carácter en el alfabeto del lote, con el mismo plegado de
+        mayúsculas y tildes que JuegoAhorcado.jugar_letra.
+        :param p_caracter: Carácter a codificar.
+        :return: Código entre 0 y 63, o None si el carácter no es del alfabeto.
+        """
+        return self.alfabeto.codigo(p_caracter)
+
+    def _bit(self, p_caracter: str) -> int:
+        codigo = self.alfabeto.codigo(p_caracter)
+        return 0 if codigo is None else 1 << codigo
+
+    def __len__(self) -> int:
+        return len(self.estado)
+
+    def jugar(self, p_letras: Union[str, Sequence[str]]) -> np.ndarray:
+        """
+        Juega una letra en cada partida del lote, con las mismas reglas de jugar_letra:
+        las partidas terminadas, las letras repetidas y las que no son del alfabeto no cambian
+        nada; un acierto revela
+        las posiciones de la letra y puede ganar la partida; un fallo resta un intento y
+        puede ahorcar al jugador.
+        :param p_letras: Una letra para todas las partidas o una letra por partida.
+        :return: Arreglo de booleanos con el resultado de jugar_letra en cada partida.
+        """
+        if isinstance(p_letras, str):
+            # Misma letra para todo el lote: basta con escalares, sin arreglos de letras
+            bit = self._bit(p_letras)
+            if bit == 0:
+                return np.zeros(len(self), dtype=bool)
+            bits = np.uint64(bit)
+            # Solo cuentan las partidas en juego y las letras que no se habían jugado
+            nuevas = self.activas & ((self.jugadas & bits) == 0)
+        else:
+            bits = np.fromiter((self._bit(letra) for letra in p_letras), dtype=np.uint64, count=len(self))
+            # Además, una letra que no es del alfabeto (bit 0) no es una jugada
+            nuevas = self.activas & ((self.jugadas & bits) == 0) & (bits != 0)
+        self.jugadas |= bits * nuevas
+
+        en_palabra = (self.mascara_palabra & bits) != 0
+        aciertos = nuevas & en_palabra
+        fallos = nuevas ^ aciertos
+
+        # Aciertos: se descuenta un símbolo pendiente y, si no quedan, se gana la partida
+        self.restantes -= aciertos
+        ganadas = aciertos & (self.restantes == 0)
+
+        # Fallos: se pierde un intento y, si no quedan, el jugador queda ahorcado
+        self.intentos -= fallos
+        ahorcadas = fallos & (self.intentos == 0)
+
+        # Los estados se actualizan sumando, sin indexar con máscaras
+        self.estado += ganadas * np.uint8(Estado.GANADOR.value - Estado.JUGANDO.value)
+        self.estado += ahorcadas * np.uint8(Estado.AHORCADO.value - Estado.JUGANDO.value)
+        self.activas ^= ganadas | ahorcadas
+        return aciertos
+
+    def en_juego(self) -> int:
+        """
+        Indica cuántas partidas del lote siguen en juego.
+        :return: Número de partidas en estado JUGANDO.
+        """
+        return int(np.count_nonzero(self.activas))
+
+    def dar_estado(self, p_partida: int) -> Estado:
+        return Estado(int(self.estado[p_partida]))
+
+    def dar_intentos_disponibles(self, p_partida: int) -> int:
+        return int(self.intentos[p_partida])
+
+    def dar_reveladas(self) -> np.ndarray:
+        """
+        Calcula qué posiciones de cada palabra ya están a la vista.
+        :return: Arreglo de booleanos de forma (partidas, longitud máxima).
+        """
+        relleno = self.palabras == RELLENO
+        visibles = self.palabras == VISIBLE
+        codigos = np.where(relleno | visibles, 0, self.palabras).astype(np.uint64)
+        return ((self.jugadas[:, None] >> codigos) & np.uint64(1)).astype(bool) & ~relleno | visibles
+
+    def dar_ocurrencias(self, p_partida: int) -> List[str]:
+        """
+        Devuelve el patrón visible de una partida, igual que JuegoAhorcado.dar_ocurrencias.
+        :param p_partida: Número de la partida en el lote.
+        :return: Lista con las letras reveladas y "_" en las demás posiciones.
+        """
+        jugadas = int(self.jugadas[p_partida])
+        resultado = []
+        for caracter, codigo in zip(self.textos[p_partida], self.palabras[p_partida].tolist()):
+            # Se muestra la letra tal como está escrita, igual que en JuegoAhorcado
+            if codigo == VISIBLE or jugadas >> codigo & 1:
+                resultado.append(Letra(caracter).dar_letra())
+            else:
+                resultado.append("_")
+        return resultado
@@ -3,22 +3,87 @@ __license__ = "GPL"
 __version__ = "1.0.0"
 __email__ = "nicolas.diazacost@campusucc.edu.co"
 
+import threading
+from typing import List, Optional
+
+from src.Plegado import PLEGADO_MAYUSCULAS
+
+# Tabla carácter -> identificador del plegado, consultada directamente al crear letras
+_IDS = PLEGADO_MAYUSCULAS.ids
+
+
 class Letra:
     """
     Clase que representa una letra de una palabra.
+    Las letras son inmutables y se comparten: existe una única instancia por símbolo
+    (sin importar mayúsculas/minúsculas), así que Letra('A') is Letra('a').
+    El índice de cada letra es el identificador de su símbolo en la tabla de plegado, que se
+    calcula una vez al importar el módulo; crear o comparar letras no llama a lower().
     """
 
+    __slots__ = ("letra", "indice", "bit")
+
+    # Instancias ya creadas, indexadas por el identificador del símbolo
+    _instancias: List[Optional['Letra']] = []
+    # Protege la creación de instancias nuevas cuando varios hilos juegan a la vez
+    _candado = threading.Lock()
+
+    def __new__(cls, p_letra: str):
+        """
+        Devuelve la instancia compartida para el carácter dado, creándola la primera vez.
+        :param p_letra: Variable de tipo str que representa un carácter para inicializar la letra.
+        """
+        indice = _IDS.get(p_letra)
+        if indice is None:
+            indice = PLEGADO_MAYUSCULAS.dar_id(p_letra)
+        if indice < len(cls._instancias):
+            instancia = cls._instancias[indice]
+            if instancia is not None:
+                return instancia
+        with cls._candado:
+            if indice >= len(cls._instancias):
+                cls._instancias.extend([None] * (indice + 1 - len(cls._instancias)))
+            instancia = cls._instancias[indice]
+            if instancia is None:
+                instancia = super().__new__(cls)
+                object.__setattr__(instancia, "letra", PLEGADO_MAYUSCULAS.dar_simbolo(indice))
+                object.__setattr__(instancia, "indice", indice)
+                object.__setattr__(instancia, "bit", 1 << indice)
+                cls._instancias[indice] = instancia
+        return instancia
+
     def __init__(self, p_letra: str):
         """
         Crea una nueva letra a partir de un carácter dado.
+        La inicialización real ocurre en __new__, que reutiliza la instancia del símbolo.
         :param p_letra: Variable de tipo str que representa un carácter para inicializar la letra.
         """
-        self.letra = p_letra
+
+    def __setattr__(self, nombre, valor):
+        raise AttributeError("Las letras son inmutables")
+
+    def __delattr__(self, nombre):
+        raise AttributeError("Las letras son inmutables")
+
+    def __reduce__(self):
+        # Al deserializar se vuelve a pasar por __new__ para recuperar la instancia compartida
+        return (Letra, (self.letra,))
+
+    def __eq__(self, otra_letra) -> bool:
+        if not isinstance(otra_letra, Letra):
+            return NotImplemented
+        return self.indice == otra_letra.indice
+
+    def __hash__(self) -> int:
+        return self.indice
+
+    def __repr__(self) -> str:
+        return f"Letra({self.letra!r})"
 
     def dar_letra(self) -> str:
         """
         Devuelve el carácter que representa la letra.
-        :return: Un carácter con la letra.
+        :return: Un carácter con la letra, en minúscula.
         """
         return self.letra
 
@@ -28,4 +93,5 @@ class Letra:
         :param otra_letra: La letra para comparar.
         :return: True si las letras son iguales sin importar mayúsculas/minúsculas, False de lo contrario.
         """
-        return self.letra.lower() == otra_letra.dar_letra().lower() #  El lower() convierte la letra a minúscula para la comparación
+        # Las letras ya están plegadas desde su creación, basta comparar sus índices
+        return self.indice == otra_letra.indice
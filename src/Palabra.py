@@ -3,26 +3,56 @@ __license__ = "GPL"
 __version__ = "1.0.0"
 __email__ = "nicolas.diazacost@campusucc.edu.co"
 
-from typing import List
+from typing import Dict, List, Optional
+from src.Alfabeto import Alfabeto, ESPANOL
 from src.Letra import Letra
 
+
+def mascara_de_letras(p_letras: List[Letra], p_alfabeto: Alfabeto = ESPANOL) -> int:
+    """
+    Construye la máscara de bits de una lista de letras.
+    :param p_letras: Lista de letras (por ejemplo, las jugadas).
+    :param p_alfabeto: Alfabeto que da el código de cada letra.
+    :return: Un entero con un bit encendido por el código de cada letra de la lista.
+    """
+    mascara = 0
+    for letra in p_letras:
+        mascara |= p_alfabeto.bit_de(letra)
+    return mascara
+
+
 class Palabra:
     """
     Clase para representar una palabra del juego.
     """
 
-    def __init__(self, p_palabra: str):
+    def __init__(self, p_palabra: str, p_alfabeto: Optional[Alfabeto] = None):
         """
         Construye una nueva palabra a partir de su representación en string.
         :param p_palabra: La palabra que se quiere construir.
+        :param p_alfabeto: Alfabeto con el que se juega (por defecto, el español).
+        Los caracteres que no son del alfabeto (guiones, apóstrofos...) se muestran desde el inicio.
         """
+        self.alfabeto = p_alfabeto if p_alfabeto is not None else ESPANOL
         # Creo una lista vacia para las letras
         self.letras = []
+        # Máscara con un bit por el código de cada símbolo distinto de la palabra
+        self.mascara = 0
+        # Para cada bit de símbolo, la máscara de posiciones donde aparece
+        self.posiciones: Dict[int, int] = {}
+        # Posiciones de los caracteres que no se adivinan
+        self.visibles = 0
         # Recorro la palabra y creo una letra por cada caracter
-        for caracter in p_palabra:
+        for posicion, caracter in enumerate(p_palabra):
             # Se convierte cada caracter a letra
             letra = Letra(caracter)
             self.letras.append(letra)
+            bit = self.alfabeto.bit_de(letra)
+            if bit == 0:
+                self.visibles |= 1 << posicion
+                continue
+            self.mascara |= bit
+            self.posiciones[bit] = self.posiciones.get(bit, 0) | (1 << posicion)
 
     def esta_completa(self, p_jugadas: List[Letra]) -> bool:
         """
@@ -30,10 +60,15 @@ class Palabra:
         :param p_jugadas: Lista con las letras jugadas.
         :return: True si la palabra está completamente adivinada, False en caso contrario.
         """
-        for letra in self.letras:
-            if not self._buscar_letra_en_lista(letra, p_jugadas):
-                return False
-        return True
+        return self.esta_completa_mascara(mascara_de_letras(p_jugadas, self.alfabeto))
+
+    def esta_completa_mascara(self, p_mascara_jugadas: int) -> bool:
+        """
+        Indica si la máscara de letras jugadas cubre todos los símbolos de la palabra.
+        :param p_mascara_jugadas: Máscara de bits de las letras jugadas.
+        :return: True si la palabra está completamente adivinada, False en caso contrario.
+        """
+        return self.mascara & ~p_mascara_jugadas == 0
 
     def buscar_letra_en_lista(self, p_letra: Letra, lista_letras: List[Letra]) -> bool:
         """
@@ -53,8 +88,34 @@ class Palabra:
         :param p_letra: Letra a consultar.
         :return: True si la letra está en la palabra, False de lo contrario.
         """
-        # Usamos nuestro método auxiliar para buscar la letra en nuestra palabra
-        return self._buscar_letra_en_lista(p_letra, self.letras)
+        return self.mascara & self.alfabeto.bit_de(p_letra) != 0
+
+    def dar_posiciones(self, p_letra: Letra) -> int:
+        """
+        Devuelve la máscara de posiciones en las que aparece una letra.
+        :param p_letra: Letra a consultar.
+        :return: Entero con el bit i encendido si la letra aparece en la posición i.
+        """
+        return self.posiciones.get(self.alfabeto.bit_de(p_letra), 0)
+
+    def dar_cantidad_distintas(self) -> int:
+        """
+        Devuelve cuántos símbolos distintos tiene la palabra.
+        :return: Número de letras distintas del alfabeto, sin importar mayúsculas/minúsculas.
+        """
+        return len(self.posiciones)
+
+    def dar_posiciones_reveladas(self, p_mascara_jugadas: int) -> int:
+        """
+        Devuelve la máscara de posiciones que quedan visibles con las letras jugadas.
+        :param p_mascara_jugadas: Máscara de bits de las letras jugadas.
+        :return: Entero con el bit i encendido si la posición i ya fue adivinada.
+        """
+        reveladas = self.visibles
+        for bit, posiciones in self.posiciones.items():
+            if p_mascara_jugadas & bit:
+                reveladas |= posiciones
+        return reveladas
 
     def dar_ocurrencias(self, p_jugadas: List[Letra]) -> List[Letra]:
         """
@@ -62,19 +123,18 @@ class Palabra:
         :param p_jugadas: Letras jugadas.
         :return: Lista de letras visibles (las que han sido adivinadas o "_" para las desconocidas).
         """
-        # Creamos una lista vacía para el resultado
+        reveladas = self.dar_posiciones_reveladas(mascara_de_letras(p_jugadas, self.alfabeto))
+
+        # Recorremos cada letra de nuestra palabra y miramos si su posición ya es visible
         resultado = []
-        
-        # Recorremos cada letra de nuestra palabra
-        for letra in self.letras:
-            # Verificamos si esta letra ya fue jugada
-            if self._buscar_letra_en_lista(letra, p_jugadas):
+        for posicion, letra in enumerate(self.letras):
+            if reveladas >> posicion & 1:
                 # Si fue jugada, mostramos la letra
                 resultado.append(letra.dar_letra())
             else:
                 # Si no fue jugada, mostramos un guión bajo
                 resultado.append("_")
-        
+
         # Retornamos la lista con letras visibles y guiones
         return resultado
 
@@ -0,0 +1,124 @@
+__author__ = "Nicolas Alejandro Diaz Acosta"
+__license__ = "GPL"
+__version__ = "1.0.0"
+__email__ = "nicolas.diazacost@campusucc.edu.co"
+
+import threading
+import unicodedata
+from typing import Dict, List
+
+# Las letras del español reciben los primeros identificadores, así sus bits caben en una palabra de máquina
+LETRAS_PRIORITARIAS = "abcdefghijklmnñopqrstuvwxyzáéíóúü"
+# Los caracteres por debajo de este código se pliegan al construir la tabla (latín básico y extendido)
+LIMITE_TABLA = 0x0250
+
+
+def quitar_tildes(p_texto: str) -> str:
+    """
+    Quita las tildes, diéresis y demás marcas diacríticas de un texto en minúscula, conservando la ñ.
+    :param p_texto: Texto en forma NFC.
+    :return: El texto sin marcas diacríticas.
+    """
+    partes = []
+    for caracter in unicodedata.normalize("NFD", p_texto):
+        if unicodedata.combining(caracter):
+            # La virgulilla sobre la n forma la ñ, que es una letra distinta
+            if caracter == "\u0303" and partes and partes[-1] == "n":
+                partes[-1] = "ñ"
+            continue
+        partes.append(caracter)
+    return "".join(partes)
+
+
+class TablaPlegado:
+    """
+    Clase que asigna a cada carácter el identificador de su símbolo canónico: la misma letra en
+    mayúscula y en minúscula (y, si se pide, con y sin tilde) recibe el mismo número.
+    La tabla de los caracteres latinos se calcula una sola vez al construirla; plegar un carácter
+    es entonces una sola consulta, sin llamar a lower() ni a unicodedata.
+    """
+
+    def __init__(self, p_quitar_tildes: bool = False):
+        """
+        Construye la tabla.
+        :param p_quitar_tildes: Si las letras con tilde o diéresis se pliegan a la letra sin ella
+        (la ñ siempre se conserva como letra distinta).
+        """
+        self.quitar_tildes = p_quitar_tildes
+        # Identificador -> símbolo canónico
+        self.simbolos: List[str] = []
+        self._ids_por_simbolo: Dict[str, int] = {}
+        # Carácter -> identificador; los que no están se pliegan la primera vez que se piden
+        self.ids: Dict[str, int] = {}
+        self._candado = threading.Lock()
+
+        for simbolo in LETRAS_PRIORITARIAS:
+            self._id_de_simbolo(self.plegar(simbolo))
+        for codigo in range(LIMITE_TABLA):
+            caracter = chr(codigo)
+            if caracter.isalpha():
+                self.ids[caracter] = self._id_de_simbolo(self.plegar(caracter))
+
+    def plegar(self, p_caracter: str) -> str:
+        """
+        Calcula el símbolo canónico de un carácter, sin usar la tabla.
+        :param p_caracter: Carácter a plegar.
+        :return: El símbolo en minúscula y, si corresponde, sin tilde.
+        """
+        simbolo = p_caracter.lower()
+        if len(simbolo) != 1:
+            # Algunos caracteres se convierten en dos al pasarlos a minúscula (por ejemplo 'İ')
+            simbolo = unicodedata.normalize("NFC", simbolo)
+        if self.quitar_tildes:
+            sin_tildes = quitar_tildes(simbolo)
+            if sin_tildes:
+                simbolo = sin_tildes
+        return simbolo if len(simbolo) == 1 else p_caracter
+
+    def _id_de_simbolo(self, p_simbolo: str) -> int:
+        identificador = self._ids_por_simbolo.get(p_simbolo)
+        if identificador is None:
+            identificador = self._ids_por_simbolo[p_simbolo] = len(self.simbolos)
+            self.simbolos.append(p_simbolo)
+        return identificador
+
+    def dar_id(self, p_caracter: str) -> int:
+        """
+        Devuelve el identificador del símbolo canónico de un carácter.
+        :param p_caracter: Un carácter.
+        :return: Identificador pequeño y denso; las letras del español tienen los primeros.
+        """
+        identificador = self.ids.get(p_caracter)
+        if identificador is not None:
+            return identificador
+        if len(p_caracter) != 1:
+            raise ValueError(f"Se esperaba un solo carácter: {p_caracter!r}")
+        # Carácter que no es letra latina: se pliega ahora y se recuerda
+        with self._candado:
+            identificador = self.ids[p_caracter] = self._id_de_simbolo(self.plegar(p_caracter))
+        return identificador
+
+    def dar_simbolo(self, p_id: int) -> str:
+        """
+        :param p_id: Identificador de un símbolo.
+        :return: El símbolo canónico.
+        """
+        return self.simbolos[p_id]
+
+    def son_iguales(self, p_caracter: str, p_otro: str) -> bool:
+        """
+        Indica si dos caracteres representan el mismo símbolo.
+        :param p_caracter: Un carácter.
+        :param p_otro: Otro carácter.
+        :return: True si se pliegan al mismo símbolo.
+        """
+        ids = self.ids
+        if p_caracter in ids and p_otro in ids:
+            return ids[p_caracter] == ids[p_otro]
+        return self.dar_id(p_caracter) == self.dar_id(p_otro)
+
+
+# Plegado de mayúsculas que usan las letras del juego
+PLEGADO_MAYUSCULAS = TablaPlegado()
+# Plegado de mayúsculas y tildes, para alfabetos que no distinguen las vocales acentuadas
+PLEGADO_TILDES = TablaPlegado(p_quitar_tildes=True)
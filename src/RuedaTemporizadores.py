@@ -0,0 +1,168 @@
+__author__ = "Nicolas Alejandro Diaz Acosta"
+__license__ = "GPL"
+__version__ = "1.0.0"
+__email__ = "nicolas.diazacost@campusucc.edu.co"
+
+import math
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+# Cada nivel de la rueda tiene 2^BITS_NIVEL ranuras
+BITS_NIVEL = 8
+RANURAS = 1 << BITS_NIVEL
+MASCARA_RANURA = RANURAS - 1
+# Con 4 niveles de 256 ranuras la rueda cubre 2^32 ticks (casi 500 días con ticks de 10 ms);
+# los vencimientos más lejanos se guardan en el último nivel y se reubican al pasar por él
+NIVELES = 4
+
+
+class Temporizador:
+    """
+    Clase que representa un vencimiento programado en una RuedaTemporizadores.
+    """
+    __slots__ = ("vencimiento", "dato", "_ranura")
+
+    def __init__(self, p_vencimiento: int, p_dato: Any):
+        self.vencimiento = p_vencimiento              # Tick en el que vence
+        self.dato = p_dato                            # Lo que se quiera asociar (por ejemplo, un juego)
+        self._ranura: Optional[Dict['Temporizador', None]] = None
+
+    def esta_activo(self) -> bool:
+        return self._ranura is not None
+
+
+class RuedaTemporizadores:
+    """
+    Clase que lleva muchos vencimientos a la vez con una rueda jerárquica de temporizadores.
+    El tiempo se cuenta en ticks. El nivel 0 tiene una ranura por tick para los próximos 256 ticks;
+    el nivel 1, una ranura por cada 256 ticks, y así sucesivamente. Programar o cancelar un
+    vencimiento es agregarlo o quitarlo de una ranura (un diccionario), sin importar cuántos haya.
+    Cuando el nivel 0 da la vuelta, la ranura que toca del nivel siguiente se reparte en los
+    niveles de abajo. avanzar() devuelve de una vez todos los que vencieron.
+    Un candado protege las ranuras: se puede programar y cancelar desde los hilos de los
+    jugadores mientras otro hilo avanza la rueda.
+    """
+
+    def __init__(self, p_tick: float = 0.01, p_reloj: Callable[[], float] = time.monotonic):
+        """
+        :param p_tick: Duración de un tick en segundos; los vencimientos se redondean hacia arriba a ticks.
+        :param p_reloj: Función que da el tiempo actual en segundos (en las pruebas, un reloj falso).
+        """
+        if p_tick <= 0:
+            raise ValueError("La duración del tick debe ser positiva")
+        self.tick = p_tick
+        self.reloj = p_reloj
+        self._origen = p_reloj()
+        self.actual = 0                               # Último tick procesado
+        self._ranuras: List[List[Dict[Temporizador, None]]] = [[{} for _ in range(RANURAS)]
+                                                                for _ in range(NIVELES)]
+        self.cantidad = 0                             # Vencimientos pendientes
+        self._candado = threading.Lock()
+
+    def __len__(self) -> int:
+        return self.cantidad
+
+    def programar(self, p_espera: float, p_dato: Any = None) -> Temporizador:
+        """
+        Programa un vencimiento.
+        :param p_espera: Segundos desde ahora.
+        :param p_dato: Dato asociado al vencimiento.
+        :return: El temporizador, para cancelarlo o reprogramarlo.
+        """
+        temporizador = Temporizador(0, p_dato)
+        with self._candado:
+            self._programar(temporizador, p_espera)
+        return temporizador
+
+    def reprogramar(self, p_temporizador: Optional[Temporizador], p_espera: float, p_dato: Any = None) -> Temporizador:
+        """
+        Mueve un vencimiento (o lo programa si no existe), reutilizando el temporizador.
+        :param p_temporizador: Temporizador anterior, activo o no, o None.
+        :param p_espera: Segundos desde ahora.
+        :param p_dato: Dato asociado, si se crea un temporizador nuevo.
+        :return: El temporizador.
+        """
+        if p_temporizador is None:
+            return self.programar(p_espera, p_dato)
+        with self._candado:
+            self._cancelar(p_temporizador)
+            self._programar(p_temporizador, p_espera)
+        return p_temporizador
+
+    def cancelar(self, p_temporizador: Temporizador) -> bool:
+        """
+        Cancela un vencimiento.
+        :return: True si estaba pendiente.
+        """
+        with self._candado:
+            return self._cancelar(p_temporizador)
+
+    def _cancelar(self, p_temporizador: Temporizador) -> bool:
+        ranura = p_temporizador._ranura
+        if ranura is None:
+            return False
+        del ranura[p_temporizador]
+        p_temporizador._ranura = None
+        self.cantidad -= 1
+        return True
+
+    def avanzar(self, p_ahora: Optional[float] = None) -> List[Temporizador]:
+        """
+        Procesa los ticks transcurridos hasta ahora.
+        :param p_ahora: Tiempo actual; por defecto, el del reloj.
+        :return: Los temporizadores vencidos, en orden de vencimiento. Ya no están activos.
+        """
+        objetivo = math.floor(((self.reloj() if p_ahora is None else p_ahora) - self._origen) / self.tick)
+        vencidos: List[Temporizador] = []
+        ranuras = self._ranuras
+        with self._candado:
+            while self.actual < objetivo:
+                if self.cantidad == 0:
+                    # Sin pendientes no hay nada que repartir: se salta directamente al final
+                    self.actual = objetivo
+                    break
+                self.actual += 1
+                tick = self.actual
+                if tick & MASCARA_RANURA == 0:
+                    self._repartir(tick)
+                ranura = ranuras[0][tick & MASCARA_RANURA]
+                if ranura:
+                    for temporizador in ranura:
+                        temporizador._ranura = None
+                    vencidos.extend(ranura)
+                    self.cantidad -= len(ranura)
+                    ranura.clear()
+        return vencidos
+
+    def _programar(self, p_temporizador: Temporizador, p_espera: float):
+        # Se redondea hacia arriba para no vencer nunca antes de tiempo
+        vencimiento = math.ceil((self.reloj() + p_espera - self._origen) / self.tick)
+        p_temporizador.vencimiento = max(vencimiento, self.actual + 1)
+        self._insertar(p_temporizador)
+        self.cantidad += 1
+
+    def _insertar(self, p_temporizador: Temporizador):
+        vencimiento = p_temporizador.vencimiento
+        distancia = vencimiento - self.actual
+        if distancia < RANURAS:
+            ranura = self._ranuras[0][vencimiento & MASCARA_RANURA]
+        else:
+            nivel = min((distancia.bit_length() - 1) // BITS_NIVEL, NIVELES - 1)
+            ranura = self._ranuras[nivel][(vencimiento >> (BITS_NIVEL * nivel)) & MASCARA_RANURA]
+        ranura[p_temporizador] = None
+        p_temporizador._ranura = ranura
+
+    def _repartir(self, p_tick: int):
+        # Al empezar un bloque de 256^n ticks, la ranura de ese bloque en el nivel n se reparte
+        # en los niveles inferiores; si el índice del nivel es 0, también el nivel siguiente dio la vuelta
+        for nivel in range(1, NIVELES):
+            indice = (p_tick >> (BITS_NIVEL * nivel)) & MASCARA_RANURA
+            ranura = self._ranuras[nivel][indice]
+            if ranura:
+                temporizadores = list(ranura)
+                ranura.clear()
+                for temporizador in temporizadores:
+                    self._insertar(temporizador)
+            if indice != 0:
+                break
@@ -0,0 +1,87 @@
+__author__ = "Nicolas Alejandro Diaz Acosta"
+__license__ = "GPL"
+__version__ = "1.0.0"
+__email__ = "nicolas.diazacost@campusucc.edu.co"
+
+MASCARA_64 = (1 << 64) - 1
+RONDAS_FEISTEL = 4
+
+
+def mezclar64(p_valor: int) -> int:
+    """
+    Mezcla los bits de un entero de 64 bits (finalizador de SplitMix64).
+    Entradas parecidas dan salidas sin relación aparente entre sí.
+    :param p_valor: Entero a mezclar; solo se usan sus 64 bits más bajos.
+    :return: Entero de 64 bits mezclado.
+    """
+    z = (p_valor + 0x9E3779B97F4A7C15) & MASCARA_64
+    z = ((z ^ (z >> 30)) * 0xBF58476D1CE4E5B9) & MASCARA_64
+    z = ((z ^ (z >> 27)) * 0x94D049BB133111EB) & MASCARA_64
+    return z ^ (z >> 31)
+
+
+class SelectorSinRepeticion:
+    """
+    Clase que escoge posiciones del diccionario sin repetir ninguna hasta haberlas usado todas.
+    En lugar de barajar una lista (que ocupa memoria proporcional al diccionario) se usa una
+    permutación pseudoaleatoria calculada con una red de Feistel: la jugada número n devuelve
+    permutar(n), así cada selección es O(1) y el estado es solo la semilla y un contador.
+    Cuando se agotan las palabras empieza otra vuelta con una permutación distinta.
+    """
+
+    def __init__(self, p_total: int, p_semilla: int = 0, p_contador: int = 0):
+        """
+        Crea el selector para un diccionario de un tamaño dado.
+        :param p_total: Número de palabras del diccionario.
+        :param p_semilla: Semilla que define el orden; la misma semilla da el mismo orden.
+        :param p_contador: Cantidad de palabras ya entregadas (para retomar una sesión).
+        :raise ValueError: Si el total no es positivo.
+        """
+        if p_total <= 0:
+            raise ValueError("El total de palabras debe ser positivo")
+        self.total = p_total
+        self.semilla = p_semilla
+        self.contador = p_contador
+        # El dominio de la permutación es la potencia de 4 más pequeña que cubre el total,
+        # para poder partir cada número en dos mitades de igual cantidad de bits
+        bits = max(2, (p_total - 1).bit_length())
+        self._bits_mitad = (bits + 1) // 2
+        self._mascara_mitad = (1 << self._bits_mitad) - 1
+
+    def _feistel(self, p_valor: int, p_clave: int) -> int:
+        """
+        Aplica la red de Feistel, que es una biyección sobre el dominio de 2 * bits_mitad bits.
+        :param p_valor: Número a permutar.
+        :param p_clave: Clave de la vuelta actual.
+        :return: El número permutado.
+        """
+        izquierda = p_valor >> self._bits_mitad
+        derecha = p_valor & self._mascara_mitad
+        for ronda in range(RONDAS_FEISTEL):
+            mezcla = mezclar64(p_clave ^ (ronda << 56) ^ derecha) & self._mascara_mitad
+            izquierda, derecha = derecha, izquierda ^ mezcla
+        return (izquierda << self._bits_mitad) | derecha
+
+    def permutar(self, p_posicion: int, p_vuelta: int = 0) -> int:
+        """
+        Devuelve la imagen de una posición en la permutación de una vuelta.
+        Si el resultado cae fuera del total se vuelve a permutar hasta caer dentro
+        (como el dominio es menor que cuatro veces el total, en promedio basta con pocas veces).
+        :param p_posicion: Posición entre 0 y total - 1.
+        :param p_vuelta: Número de vuelta completa sobre el diccionario.
+        :return: Posición permutada, entre 0 y total - 1.
+        """
+        clave = mezclar64(self.semilla * 0x100000001B3 + p_vuelta)
+        valor = self._feistel(p_posicion, clave)
+        while valor >= self.total:
+            valor = self._feistel(valor, clave)
+        return valor
+
+    def siguiente(self) -> int:
+        """
+        Devuelve la siguiente posición del orden y avanza el contador.
+        :return: Posición de una palabra que no ha salido en la vuelta actual.
+        """
+        vuelta, posicion = divmod(self.contador, self.total)
+        self.contador += 1
+        return self.permutar(posicion, vuelta)
@@ -0,0 +1,401 @@
+__author__ = "Nicolas Alejandro Diaz Acosta"
+__license__ = "GPL"
+__version__ = "1.0.0"
+__email__ = "nicolas.diazacost@campusucc.edu.co"
+
+import argparse
+import asyncio
+import json
+import os
+import random
+from typing import Any, Dict, List, Optional, Tuple
+
+from src.Alfabeto import ALFABETOS, Alfabeto
+from src.Bitacora import Bitacora, repetir
+from src.CacheDiccionario import cargar_diccionario
+from src.Calendario import semilla_de_juego
+from src.Diccionario import Diccionario
+from src.JuegoAhorcado import JuegoAhorcado, Estado, vencer_turnos
+from src.Letra import Letra
+from src.RuedaTemporizadores import RuedaTemporizadores
+from src.Sesiones import AlmacenSesiones, INSTANTANEA
+
+# Protocolo: cada mensaje es un objeto JSON en una línea, y cada respuesta también.
+#   {"cmd": "start"}                              -> crea una sesión e inicia su juego (iniciar_juego)
+#   {"cmd": "start", "sesion": 7}                 -> inicia otra partida en una sesión existente
+#   {"cmd": "guess", "sesion": 7, "letra": "a"}   -> jugar_letra
+#   {"cmd": "state", "sesion": 7}                 -> dar_estado, intentos y jugadas
+#   {"cmd": "reveal", "sesion": 7}                -> dar_ocurrencias (y la palabra si el juego terminó)
+#   {"cmd": "close", "sesion": 7}                 -> libera la sesión
+# Si el mensaje trae un campo "id", la respuesta lo repite, para emparejarlas al enviar en lote.
+# Los errores se responden con {"ok": false, "error": "..."} sin cerrar la conexión.
+PUERTO_PREDETERMINADO = 5050
+# Bytes pendientes de envío a partir de los cuales se deja de leer de un cliente
+LIMITE_ESCRITURA = 1 << 20
+# Longitud máxima de una línea; un cliente que la supere se desconecta
+MAX_LINEA = 1 << 16
+# Cada cuántos segundos se desalojan las sesiones inactivas
+INTERVALO_EXPIRACION = 1.0
+# Resolución, en segundos, del límite de tiempo por jugada
+TICK_TURNOS = 0.1
+
+
+class ServidorAhorcado:
+    """
+    Clase con las sesiones de juego de un servidor. Cada sesión es un JuegoAhorcado y todas
+    comparten el mismo diccionario (mapeado en memoria), así una sesión nueva no lee disco.
+    Los comandos se atienden de forma síncrona: una jugada es una operación corta, así que
+    no hace falta una corrutina por mensaje.
+    Las sesiones viven en un AlmacenSesiones: las inactivas se desalojan a disco y se restauran
+    solas cuando vuelven a jugar, así la memoria no crece con las sesiones abandonadas.
+    Con una bitácora, cada evento se registra y las respuestas se envían solo después de
+    confirmar el grupo de eventos de la vuelta del ciclo en que se atendieron; al arrancar,
+    las sesiones de la bitácora se recuperan.
+    """
+
+    def __init__(self, p_ruta: Optional[str] = None, p_alfabeto: Optional[Alfabeto] = None,
+                 p_semilla: Optional[int] = None, p_max_sesiones: int = 100000, p_inactividad: float = 600.0,
+                 p_ruta_derrame: Optional[str] = None, p_ruta_bitacora: Optional[str] = None,
+                 p_sincronizar: bool = True, p_limite_jugada: Optional[float] = None):
+        """
+        :param p_ruta: Lista de palabras, o None para el diccionario predeterminado.
+        :param p_alfabeto: Alfabeto con el que se juega; por defecto, el español.
+        :param p_semilla: Semilla maestra (64 bits); la sesión n juega con semilla_de_juego(semilla, n).
+        Si no se indica, se usa la de la bitácora o, si no hay, una al azar.
+        :param p_max_sesiones: Máximo de sesiones en memoria.
+        :param p_inactividad: Segundos sin jugar tras los que una sesión se desaloja a disco.
+        :param p_ruta_derrame: Archivo para las sesiones desalojadas; por defecto, uno temporal.
+        :param p_ruta_bitacora: Bitácora de eventos, o None para no registrarlos.
+        :param p_sincronizar: Si cada grupo de eventos de la bitácora se sincroniza con fsync.
+        :param p_limite_jugada: Segundos por jugada; al vencer cuentan como un fallo. None para no limitar.
+        """
+        self.ruta = p_ruta
+        self.alfabeto = p_alfabeto
+        self.semilla_indicada = p_semilla is not None
+        self.semilla = p_semilla & 0xFFFFFFFFFFFFFFFF if p_semilla is not None else random.getrandbits(64)
+        self.diccionario: Optional[Diccionario] = None
+        self.sesiones = AlmacenSesiones(self._crear_juego, p_max_sesiones, p_inactividad, p_ruta_derrame)
+        self.ruta_bitacora = p_ruta_bitacora
+        self.sincronizar = p_sincronizar
+        self.bitacora: Optional[Bitacora] = None
+        # Una sola rueda lleva los turnos de todas las sesiones
+        self.limite_jugada = p_limite_jugada
+        self.rueda = RuedaTemporizadores(TICK_TURNOS) if p_limite_jugada is not None else None
+        # Respuestas que esperan a que se confirme la bitácora
+        self._por_responder: List[Tuple[asyncio.Transport, bytes]] = []
+        # Tareas periódicas del ciclo de eventos (expirar sesiones, vencer turnos)
+        self._tareas: List[asyncio.Task] = []
+        self.comandos = {
+            "start": self._iniciar,
+            "guess": self._jugar,
+            "state": self._estado,
+            "reveal": self._revelar,
+            "close": self._cerrar,
+        }
+
+    async def cargar(self):
+        """
+        Carga el diccionario y recupera la bitácora en un hilo aparte, para no detener el ciclo
+        de eventos mientras se leen los archivos.
+        """
+        if self.ruta is None:
+            self.diccionario = Diccionario.predeterminado()
+        else:
+            self.diccionario = await asyncio.get_running_loop().run_in_executor(None, cargar_diccionario, self.ruta)
+        if self.ruta_bitacora is not None and self.bitacora is None:
+            await asyncio.get_running_loop().run_in_executor(None, self._recuperar)
+
+    def _recuperar(self):
+        # La bitácora guarda la semilla maestra con la que se creó: sin ella, las sesiones recuperadas
+        # sortearían sus próximas palabras de otra secuencia y podrían repetir las ya jugadas
+        existia = os.path.exists(self.ruta_bitacora)
+        bitacora = Bitacora(self.ruta_bitacora, self.sincronizar, p_semilla=self.semilla)
+        if existia and bitacora.semilla != self.semilla:
+            if self.semilla_indicada:
+                bitacora.cerrar()
+                raise ValueError(f"La bitácora {self.ruta_bitacora} se creó con otra semilla ({bitacora.semilla})")
+            self.semilla = bitacora.semilla
+        # Las sesiones de la bitácora entran al almacén como desalojadas y se restauran al pedirlas
+        estado = repetir(self.ruta_bitacora) if existia else None
+        if estado is not None:
+            for indice in range(len(estado)):
+                self.sesiones.importar(int(estado.sesiones[indice]), INSTANTANEA.pack(
+                    int(estado.posiciones[indice]), int(estado.mascaras[indice]), int(estado.intentos[indice]),
+                    int(estado.estados[indice]), int(estado.partidas[indice]) & 0xFFFF))
+            self.sesiones.reservar(estado.mayor_sesion)
+        self.bitacora = bitacora
+
+    async def escuchar(self, p_host: str = "127.0.0.1", p_puerto: int = PUERTO_PREDETERMINADO) -> asyncio.AbstractServer:
+        """
+        Carga el diccionario si hace falta y empieza a aceptar conexiones.
+        :param p_host: Dirección en la que se escucha.
+        :param p_puerto: Puerto (0 para que el sistema escoja uno libre).
+        :return: El servidor de asyncio, ya escuchando.
+        """
+        if self.diccionario is None:
+            await self.cargar()
+        if not self._tareas:
+            # Si se escucha en varias direcciones, las tareas periódicas se comparten
+            self._tareas.append(asyncio.get_running_loop().create_task(self._expirar_periodicamente()))
+            if self.rueda is not None:
+                self._tareas.append(asyncio.get_running_loop().create_task(self._vencer_periodicamente()))
+        return await asyncio.get_running_loop().create_server(lambda: ProtocoloAhorcado(self), p_host, p_puerto)
+
+    async def _expirar_periodicamente(self):
+        while True:
+            await asyncio.sleep(INTERVALO_EXPIRACION)
+            self.sesiones.expirar()
+
+    async def _vencer_periodicamente(self):
+        # Un solo temporizador del ciclo de eventos por tick, para todas las sesiones
+        while True:
+            await asyncio.sleep(self.rueda.tick)
+            if vencer_turnos(self.rueda) and self.bitacora is not None:
+                self.bitacora.confirmar()
+
+    def _crear_juego(self, p_sesion: int) -> JuegoAhorcado:
+        # La semilla sale del identificador, así una sesión restaurada sigue sorteando las mismas palabras
+        return JuegoAhorcado(self.diccionario, semilla=semilla_de_juego(self.semilla, p_sesion),
+                             alfabeto=self.alfabeto, bitacora=self.bitacora, sesion=p_sesion, rueda=self.rueda,
+                             limite_jugada=self.limite_jugada)
+
+    def responder(self, p_transporte: asyncio.Transport, p_datos: bytes):
+        """
+        Envía respuestas a un cliente. Con bitácora, las respuestas esperan al final de la vuelta
+        del ciclo de eventos: ahí se confirman juntos los eventos de todas las conexiones (un solo
+        fsync) y luego se envían todas.
+        """
+        if self.bitacora is None:
+            p_transporte.write(p_datos)
+            return
+        if not self._por_responder:
+            asyncio.get_running_loop().call_soon(self._confirmar)
+        self._por_responder.append((p_transporte, p_datos))
+
+    def _confirmar(self):
+        self.bitacora.confirmar()
+        por_responder, self._por_responder = self._por_responder, []
+        for transporte, datos in por_responder:
+            if not transporte.is_closing():
+                transporte.write(datos)
+
+    def cerrar(self):
+        for tarea in self._tareas:
+            tarea.cancel()
+        self._tareas = []
+        self.sesiones.cerrar()
+        if self.bitacora is not None:
+            self.bitacora.cerrar()
+
+    def atender(self, p_linea: bytes) -> bytes:
+        """
+        Atiende un mensaje y construye su respuesta.
+        :param p_linea: Mensaje JSON, sin el salto de línea.
+        :return: Respuesta JSON terminada en salto de línea.
+        """
+        identificador = None
+        try:
+            mensaje = json.loads(p_linea)
+            if not isinstance(mensaje, dict):
+                raise ValueError("El mensaje debe ser un objeto JSON")
+            identificador = mensaje.get("id")
+            comando = self.comandos.get(mensaje.get("cmd"))
+            if comando is None:
+                raise ValueError(f"Comando desconocido: {mensaje.get('cmd')}")
+            respuesta = comando(mensaje)
+            respuesta["ok"] = True
+        except (ValueError, TypeError) as error:
+            respuesta = {"ok": False, "error": str(error)}
+        if identificador is not None:
+            respuesta["id"] = identificador
+        return json.dumps(respuesta, ensure_ascii=False).encode("utf-8") + b"\n"
+
+    def _dar_identificador(self, p_mensaje: Dict[str, Any]) -> int:
+        # Solo enteros: True o 1.0 se confundirían con la sesión 1 y una lista no se puede buscar
+        sesion = p_mensaje.get("sesion")
+        if not self.sesiones.es_identificador(sesion):
+            raise ValueError(f"Sesión desconocida: {json.dumps(sesion, ensure_ascii=False)}")
+        return sesion
+
+    def _dar_sesion(self, p_mensaje: Dict[str, Any]) -> JuegoAhorcado:
+        sesion = self._dar_identificador(p_mensaje)
+        juego = self.sesiones.obtener(sesion)
+        if juego is None:
+            raise ValueError(f"Sesión desconocida: {sesion}")
+        return juego
+
+    def _resumen(self, p_juego: JuegoAhorcado) -> Dict[str, Any]:
+        return {
+            "ocurrencias": "".join(p_juego.dar_ocurrencias()),
+            "intentos": p_juego.dar_intentos_disponibles(),
+            "estado": p_juego.dar_estado().name,
+        }
+
+    def _iniciar(self, p_mensaje: Dict[str, Any]) -> Dict[str, Any]:
+        if "sesion" in p_mensaje:
+            juego = self._dar_sesion(p_mensaje)
+            sesion = p_mensaje["sesion"]
+        else:
+            sesion, juego = self.sesiones.crear()
+        juego.iniciar_juego()
+        respuesta = self._resumen(juego)
+        respuesta["sesion"] = sesion
+        return respuesta
+
+    def _jugar(self, p_mensaje: Dict[str, Any]) -> Dict[str, Any]:
+        juego = self._dar_sesion(p_mensaje)
+        simbolo = p_mensaje.get("letra")
+        if not isinstance(simbolo, str) or not juego.alfabeto.es_valida(simbolo):
+            raise ValueError(f"Letra inválida: {simbolo}")
+        letra = Letra(simbolo)
+        if juego.dar_estado() != Estado.JUGANDO:
+            raise ValueError("La partida no está en juego")
+        if juego.letra_utilizada(letra):
+            raise ValueError(f"La letra {simbolo} ya fue jugada")
+        acierto = juego.jugar_letra(letra)
+        respuesta = self._resumen(juego)
+        respuesta["acierto"] = acierto
+        return respuesta
+
+    def _estado(self, p_mensaje: Dict[str, Any]) -> Dict[str, Any]:
+        juego = self._dar_sesion(p_mensaje)
+        respuesta = self._resumen(juego)
+        respuesta["jugadas"] = "".join(letra.dar_letra() for letra in juego.dar_jugadas())
+        return respuesta
+
+    def _revelar(self, p_mensaje: Dict[str, Any]) -> Dict[str, Any]:
+        juego = self._dar_sesion(p_mensaje)
+        respuesta = {"ocurrencias": "".join(juego.dar_ocurrencias())}
+        if juego.dar_estado() in (Estado.GANADOR, Estado.AHORCADO):
+            # La palabra solo se muestra cuando ya no se puede jugar
+            respuesta["palabra"] = "".join(letra.dar_letra() for letra in juego.dar_palabra_actual().dar_letras())
+        return respuesta
+
+    def _cerrar(self, p_mensaje: Dict[str, Any]) -> Dict[str, Any]:
+        sesion = self._dar_identificador(p_mensaje)
+        if not self.sesiones.eliminar(sesion):
+            raise ValueError(f"Sesión desconocida: {sesion}")
+        if self.bitacora is not None:
+            self.bitacora.registrar_cierre(sesion)
+        return {}
+
+
+class ProtocoloAhorcado(asyncio.Protocol):
+    """
+    Clase que atiende una conexión: separa los mensajes por líneas, responde todos los que
+    llegaron juntos con una sola escritura y deja de leer si el cliente no consume sus respuestas.
+    """
+
+    def __init__(self, p_servidor: ServidorAhorcado):
+        self.servidor = p_servidor
+        self.transporte: Optional[asyncio.Transport] = None
+        self._pendiente = b""
+
+    def connection_made(self, transport: asyncio.Transport):
+        self.transporte = transport
+        transport.set_write_buffer_limits(high=LIMITE_ESCRITURA)
+
+    def data_received(self, data: bytes):
+        lineas = (self._pendiente + data).split(b"\n")
+        self._pendiente = lineas.pop()
+        if len(self._pendiente) > MAX_LINEA:
+            self.transporte.close()
+            return
+        respuestas = [self.servidor.atender(linea) for linea in lineas if linea.strip()]
+        if respuestas:
+            self.servidor.responder(self.transporte, b"".join(respuestas))
+
+    def pause_writing(self):
+        # El cliente no está leyendo: se deja de leer lo que envía hasta que se vacíe el buffer
+        self.transporte.pause_reading()
+
+    def resume_writing(self):
+        self.transporte.resume_reading()
+
+
+class ClienteAhorcado:
+    """
+    Cliente de prueba del servidor. Puede enviar un mensaje y esperar su respuesta, o enviar
+    muchos a la vez y leer todas las respuestas después (en orden).
+    """
+
+    def __init__(self, p_lector: asyncio.StreamReader, p_escritor: asyncio.StreamWriter):
+        self.lector = p_lector
+        self.escritor = p_escritor
+
+    @classmethod
+    async def conectar(cls, p_host: str = "127.0.0.1", p_puerto: int = PUERTO_PREDETERMINADO) -> 'ClienteAhorcado':
+        lector, escritor = await asyncio.open_connection(p_host, p_puerto, limit=MAX_LINEA)
+        return cls(lector, escritor)
+
+    async def enviar(self, **p_mensaje) -> Dict[str, Any]:
+        """
+        Envía un mensaje y espera su respuesta.
+        :return: La respuesta decodificada.
+        """
+        return (await self.enviar_lote([p_mensaje]))[0]
+
+    async def enviar_lote(self, p_mensajes: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Envía varios mensajes seguidos y luego lee sus respuestas.
+        :param p_mensajes: Mensajes a enviar.
+        :return: Las respuestas, en el mismo orden.
+        """
+        self.escritor.write(b"".join(json.dumps(mensaje).encode("utf-8") + b"\n" for mensaje in p_mensajes))
+        await self.escritor.drain()
+        return [json.loads(await self.lector.readline()) for _ in p_mensajes]
+
+    async def cerrar(self):
+        self.escritor.close()
+        await self.escritor.wait_closed()
+
+
+async def servir(p_ruta: Optional[str], p_host: str, p_puerto: int, p_alfabeto: Optional[Alfabeto],
+                 p_max_sesiones: int = 100000, p_inactividad: float = 600.0, p_ruta_bitacora: Optional[str] = None,
+                 p_sincronizar: bool = True, p_limite_jugada: Optional[float] = None, p_semilla: Optional[int] = None):
+    servidor = ServidorAhorcado(p_ruta, p_alfabeto, p_semilla, p_max_sesiones=p_max_sesiones,
+                                p_inactividad=p_inactividad, p_ruta_bitacora=p_ruta_bitacora,
+                                p_sincronizar=p_sincronizar, p_limite_jugada=p_limite_jugada)
+    escucha = await servidor.escuchar(p_host, p_puerto)
+    # Con el puerto 0 el sistema escoge uno libre: se informa el que quedó
+    puerto = escucha.sockets[0].getsockname()[1]
+    print(f"Servidor del ahorcado en {p_host}:{puerto} con {len(servidor.diccionario)} palabras "
+          f"(semilla {servidor.semilla})", flush=True)
+    try:
+        async with escucha:
+            await escucha.serve_forever()
+    finally:
+        servidor.cerrar()
+
+
+def main():
+    """
+    Inicia el servidor desde la línea de comandos.
+    Uso: python -m src.Servidor [--diccionario palabras.txt] [--puerto 5050] [--alfabeto es] [--semilla 7]
+    """
+    analizador = argparse.ArgumentParser(description="Servidor del ahorcado (JSON por líneas sobre TCP)")
+    analizador.add_argument("--diccionario", help="Lista de palabras (texto plano o .gz)")
+    analizador.add_argument("--host", default="127.0.0.1")
+    analizador.add_argument("--puerto", type=int, default=PUERTO_PREDETERMINADO)
+    analizador.add_argument("--alfabeto", choices=sorted(ALFABETOS), default="es")
+    analizador.add_argument("--max-sesiones", type=int, default=100000,
+                            help="Sesiones en memoria; las demás se desalojan a disco (~1.5 KB cada una)")
+    analizador.add_argument("--inactividad", type=float, default=600.0,
+                            help="Segundos sin jugar tras los que una sesión se desaloja")
+    analizador.add_argument("--bitacora", help="Registra los eventos en esta bitácora y recupera sus sesiones")
+    analizador.add_argument("--sin-fsync", action="store_true", help="Confirma la bitácora sin fsync")
+    analizador.add_argument("--limite-jugada", type=float,
+                            help="Segundos por jugada; si se acaban cuenta como un fallo")
+    analizador.add_argument("--semilla", type=int,
+                            help="Semilla maestra de las sesiones; por defecto, la de la bitácora o una al azar")
+    argumentos = analizador.parse_args()
+    try:
+        asyncio.run(servir(argumentos.diccionario, argumentos.host, argumentos.puerto, ALFABETOS[argumentos.alfabeto],
+                           argumentos.max_sesiones, argumentos.inactividad, argumentos.bitacora,
+                           not argumentos.sin_fsync, argumentos.limite_jugada, argumentos.semilla))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
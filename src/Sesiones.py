@@ -0,0 +1,226 @@
+__author__ = "Nicolas Alejandro Diaz Acosta"
+__license__ = "GPL"
+__version__ = "1.0.0"
+__email__ = "nicolas.diazacost@campusucc.edu.co"
+
+import os
+import struct
+import tempfile
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Optional, Tuple
+
+from src.JuegoAhorcado import JuegoAhorcado, Estado
+
+# Instantánea de una sesión, 16 bytes: posición de la palabra, máscara de letras jugadas,
+# intentos disponibles, estado y número de partidas iniciadas (para seguir sorteando con la semilla)
+INSTANTANEA = struct.Struct("<IQBBH")
+# Posición que indica que la sesión todavía no tiene palabra
+SIN_PALABRA = 0xFFFFFFFF
+# Un estado 0 en el archivo de derrame es un hueco: una sesión que no existe o que se eliminó
+SIN_SESION = 0
+
+
+def tomar_instantanea(p_juego: JuegoAhorcado) -> bytes:
+    """
+    Resume una partida en INSTANTANEA.size bytes.
+    :param p_juego: Juego a guardar; su palabra debe venir del diccionario.
+    :return: La instantánea.
+    :raise ValueError: Si la palabra no tiene posición en el diccionario.
+    """
+    posicion = p_juego.dar_posicion_actual()
+    if posicion is None:
+        if p_juego.dar_estado() != Estado.NO_INICIADO:
+            raise ValueError("Solo se pueden guardar partidas con una palabra del diccionario")
+        posicion = SIN_PALABRA
+    return INSTANTANEA.pack(posicion, p_juego.mascara_jugadas, p_juego.dar_intentos_disponibles(),
+                            p_juego.dar_estado().value, p_juego.partidas & 0xFFFF)
+
+
+def restaurar_instantanea(p_juego: JuegoAhorcado, p_datos: bytes):
+    """
+    Devuelve un juego recién creado (con la misma semilla y alfabeto) al estado de una instantánea.
+    :param p_juego: Juego a restaurar.
+    :param p_datos: Instantánea creada con tomar_instantanea.
+    """
+    posicion, mascara, intentos, estado, partidas = INSTANTANEA.unpack(p_datos)
+    p_juego.partidas = partidas
+    if posicion != SIN_PALABRA:
+        p_juego.restaurar_partida(posicion, mascara, intentos, Estado(estado))
+
+
+class AlmacenSesiones:
+    """
+    Clase que guarda las sesiones de un servidor. Las más usadas se mantienen en memoria, hasta
+    un máximo configurable; las menos usadas o inactivas se desalojan a un archivo de derrame
+    como instantáneas de 16 bytes y se reconstruyen solas la siguiente vez que se piden.
+    Los identificadores son enteros consecutivos, así la instantánea de la sesión n está en el
+    byte n * 16 del archivo y leerla o escribirla es un solo acceso, sin índice.
+    """
+
+    def __init__(self, p_fabrica: Callable[[int], JuegoAhorcado], p_max_en_memoria: int = 100000,
+                 p_max_inactividad: float = 600.0, p_ruta: Optional[str] = None,
+                 p_reloj: Callable[[], float] = time.monotonic):
+        """
+        :param p_fabrica: Función que crea el juego (sin iniciar) de un identificador de sesión. Para
+        restaurar una sesión debe crear un juego con la misma semilla y el mismo alfabeto.
+        :param p_max_en_memoria: Máximo de sesiones en memoria (cada una ocupa alrededor de 1.5 KB).
+        :param p_max_inactividad: Segundos sin uso tras los que expirar() desaloja una sesión.
+        :param p_ruta: Archivo de derrame; por defecto, uno temporal que se borra al cerrar.
+        :param p_reloj: Función que da el tiempo actual, en segundos.
+        """
+        if p_max_en_memoria < 1:
+            raise ValueError("Debe caber al menos una sesión en memoria")
+        self.fabrica = p_fabrica
+        self.max_en_memoria = p_max_en_memoria
+        self.max_inactividad = p_max_inactividad
+        self.reloj = p_reloj
+        # Identificador -> [juego, último uso], del menos al más recientemente usado
+        self.memoria: "OrderedDict[int, list]" = OrderedDict()
+        self.cantidad = 0                                # Sesiones vivas, en memoria o derramadas
+        self.desalojadas = 0
+        self.restauradas = 0
+        self._siguiente = 1
+        if p_ruta is None:
+            descriptor, self.ruta = tempfile.mkstemp(prefix="sesiones-", suffix=".derrame")
+            self._temporal = True
+        else:
+            descriptor = os.open(p_ruta, os.O_RDWR | os.O_CREAT | os.O_TRUNC, 0o644)
+            self.ruta = p_ruta
+            self._temporal = False
+        self._descriptor = descriptor
+
+    def __len__(self) -> int:
+        return self.cantidad
+
+    def en_memoria(self) -> int:
+        return len(self.memoria)
+
+    def crear(self) -> Tuple[int, JuegoAhorcado]:
+        """
+        Crea una sesión nueva.
+        :return: Su identificador y su juego, sin iniciar.
+        """
+        sesion = self._siguiente
+        self._siguiente += 1
+        juego = self.fabrica(sesion)
+        self._guardar_en_memoria(sesion, juego)
+        self.cantidad += 1
+        return sesion, juego
+
+    def importar(self, p_sesion: int, p_datos: bytes):
+        """
+        Agrega una sesión ya desalojada, por ejemplo al recuperarla de una bitácora. Los
+        identificadores nuevos seguirán después del mayor importado.
+        :param p_sesion: Identificador de la sesión (no debe existir).
+        :param p_datos: Su instantánea.
+        """
+        if p_sesion < 1:
+            raise ValueError(f"Identificador de sesión inválido: {p_sesion}")
+        self.reservar(p_sesion)
+        self._escribir(p_sesion, p_datos)
+        self.cantidad += 1
+
+    def reservar(self, p_sesion: int):
+        """
+        Hace que los identificadores nuevos sigan después de uno dado, para no reutilizar los de
+        sesiones que ya existieron.
+        :param p_sesion: Mayor identificador usado.
+        """
+        self._siguiente = max(self._siguiente, p_sesion + 1)
+
+    def es_identificador(self, p_sesion: Any) -> bool:
+        """
+        Indica si un valor puede ser el identificador de una sesión: un entero (no un booleano)
+        entre 1 y el último asignado.
+        :param p_sesion: Valor a revisar, por ejemplo el que llegó en un mensaje.
+        """
+        return type(p_sesion) is int and 0 < p_sesion < self._siguiente
+
+    def obtener(self, p_sesion: int) -> Optional[JuegoAhorcado]:
+        """
+        Busca una sesión y la marca como usada; si estaba desalojada, la reconstruye.
+        :param p_sesion: Identificador de la sesión.
+        :return: Su juego, o None si la sesión no existe.
+        """
+        if not self.es_identificador(p_sesion):
+            return None
+        entrada = self.memoria.get(p_sesion)
+        if entrada is not None:
+            entrada[1] = self.reloj()
+            self.memoria.move_to_end(p_sesion)
+            return entrada[0]
+        datos = self._leer(p_sesion)
+        if datos is None:
+            return None
+        juego = self.fabrica(p_sesion)
+        restaurar_instantanea(juego, datos)
+        self._escribir(p_sesion, bytes(INSTANTANEA.size))
+        self.restauradas += 1
+        self._guardar_en_memoria(p_sesion, juego)
+        return juego
+
+    def eliminar(self, p_sesion: int) -> bool:
+        """
+        Elimina una sesión, esté en memoria o desalojada.
+        :return: True si la sesión existía.
+        """
+        if not self.es_identificador(p_sesion):
+            return False
+        entrada = self.memoria.pop(p_sesion, None)
+        if entrada is not None:
+            entrada[0].detener_turno()
+        else:
+            if self._leer(p_sesion) is None:
+                return False
+            self._escribir(p_sesion, bytes(INSTANTANEA.size))
+        self.cantidad -= 1
+        return True
+
+    def expirar(self) -> int:
+        """
+        Desaloja las sesiones que llevan más de max_inactividad segundos sin usarse. Como la memoria
+        está ordenada por último uso, solo se recorren las que efectivamente se desalojan.
+        :return: Cantidad de sesiones desalojadas.
+        """
+        limite = self.reloj() - self.max_inactividad
+        desalojadas = 0
+        while self.memoria:
+            _, ultimo_uso = next(iter(self.memoria.values()))
+            if ultimo_uso > limite:
+                break
+            self._desalojar_primera()
+            desalojadas += 1
+        return desalojadas
+
+    def cerrar(self):
+        if self._descriptor is not None:
+            os.close(self._descriptor)
+            self._descriptor = None
+            if self._temporal:
+                os.unlink(self.ruta)
+
+    def _guardar_en_memoria(self, p_sesion: int, p_juego: JuegoAhorcado):
+        while len(self.memoria) >= self.max_en_memoria:
+            self._desalojar_primera()
+        self.memoria[p_sesion] = [p_juego, self.reloj()]
+
+    def _desalojar_primera(self):
+        # La primera sesión es la usada hace más tiempo
+        sesion, (juego, _) = self.memoria.popitem(last=False)
+        # Una sesión en disco no tiene turno en curso; al restaurarla recibe de nuevo el tiempo completo
+        juego.detener_turno()
+        self._escribir(sesion, tomar_instantanea(juego))
+        self.desalojadas += 1
+
+    def _leer(self, p_sesion: int) -> Optional[bytes]:
+        if not self.es_identificador(p_sesion):
+            return None
+        datos = os.pread(self._descriptor, INSTANTANEA.size, p_sesion * INSTANTANEA.size)
+        # Más allá del final del archivo o en un hueco no hay sesión
+        if len(datos) < INSTANTANEA.size or datos[13] == SIN_SESION:
+            return None
+        return datos
+
+    def _escribir(self, p_sesion: int, p_datos: bytes):
+        os.pwrite(self._descriptor, p_datos, p_sesion * INSTANTANEA.size)
@@ -0,0 +1,256 @@
+__author__ = "Nicolas Alejandro Diaz Acosta"
+__license__ = "GPL"
+__version__ = "1.0.0"
+__email__ = "nicolas.diazacost@campusucc.edu.co"
+
+import argparse
+import random
+import time
+from collections import Counter
+from typing import Callable, Dict, Iterable, List, Optional
+
+from src.Alfabeto import Alfabeto
+from src.Calendario import generar_calendario
+from src.CacheDiccionario import cargar_diccionario
+from src.Diccionario import Diccionario
+from src.JuegoAhorcado import JuegoAhorcado, Estado
+from src.Letra import Letra
+from src.Solucionador import Solucionador
+
+# Letras ordenadas de más a menos frecuentes en español
+LETRAS_POR_FRECUENCIA = "eaosrnidlctumpbgvyqhfzjñxkw"
+
+
+def letras_por_frecuencia(alfabeto: Alfabeto) -> List[Letra]:
+    """
+    Ordena las letras de un alfabeto por su frecuencia en español; las que no son del español
+    van al final, en el orden del alfabeto.
+    :param alfabeto: Alfabeto del juego.
+    :return: Las letras canónicas del alfabeto.
+    """
+    codigos = [alfabeto.codigo(caracter) for caracter in LETRAS_POR_FRECUENCIA]
+    codigos = [codigo for codigo in codigos if codigo is not None]
+    codigos += [codigo for codigo in range(len(alfabeto)) if codigo not in codigos]
+    return [alfabeto.dar_letra(codigo) for codigo in codigos]
+
+
+class EstrategiaAleatoria:
+    """
+    Estrategia que juega cada vez una letra al azar entre las del alfabeto que no se han usado.
+    """
+
+    def __init__(self, semilla: int = 0, diccionario: Optional[Diccionario] = None):
+        self.generador = random.Random(semilla)
+
+    def elegir_letra(self, juego: JuegoAhorcado) -> Letra:
+        """
+        Escoge la siguiente letra a jugar.
+        :param juego: Juego en curso.
+        :return: Una letra del alfabeto del juego que todavía no se ha jugado.
+        """
+        alfabeto = juego.alfabeto
+        disponibles = alfabeto.dar_letras_de_mascara(alfabeto.mascara_completa & ~juego.mascara_jugadas)
+        if not disponibles:
+            raise ValueError("Ya se jugaron todas las letras")
+        return self.generador.choice(disponibles)
+
+
+class EstrategiaFrecuencia:
+    """
+    Estrategia que juega las letras del alfabeto en orden de frecuencia del idioma.
+    """
+
+    def __init__(self, semilla: int = 0, diccionario: Optional[Diccionario] = None):
+        # Orden de las letras de cada alfabeto con el que se ha jugado
+        self.letras: Dict[Alfabeto, List[Letra]] = {}
+
+    def elegir_letra(self, juego: JuegoAhorcado) -> Letra:
+        """
+        Escoge la siguiente letra a jugar.
+        :param juego: Juego en curso.
+        :return: La letra más frecuente que todavía no se ha jugado.
+        """
+        letras = self.letras.get(juego.alfabeto)
+        if letras is None:
+            letras = self.letras[juego.alfabeto] = letras_por_frecuencia(juego.alfabeto)
+        for letra in letras:
+            if not juego.letra_utilizada(letra):
+                return letra
+        raise ValueError("Ya se jugaron todas las letras")
+
+
+class EstrategiaEntropia:
+    """
+    Estrategia que juega la letra con mayor ganancia de información sobre las palabras
+    del diccionario que siguen siendo posibles.
+    """
+
+    def __init__(self, semilla: int = 0, diccionario: Optional[Diccionario] = None):
+        if diccionario is None:
+            diccionario = Diccionario.predeterminado()
+        self.diccionario = diccionario
+        self.solucionador = Solucionador.para(diccionario)
+
+    def elegir_letra(self, juego: JuegoAhorcado) -> Letra:
+        """
+        Escoge la siguiente letra a jugar.
+        :param juego: Juego en curso.
+        :return: La letra sugerida por el solucionador.
+        """
+        if self.solucionador.alfabeto is not juego.alfabeto:
+            self.solucionador = Solucionador.para(self.diccionario, juego.alfabeto)
+        letra = self.solucionador.sugerir(juego)
+        if letra is None:
+            raise ValueError("Ya se jugaron todas las letras")
+        return letra
+
+
+# Estrategias disponibles por nombre; cada una se construye a partir de una semilla
+# y del diccionario con el que se va a jugar
+ESTRATEGIAS: Dict[str, Callable[[int, Optional[Diccionario]], object]] = {
+    "aleatoria": EstrategiaAleatoria,
+    "frecuencia": EstrategiaFrecuencia,
+    "entropia": EstrategiaEntropia,
+}
+
+
+class ResultadoSimulacion:
+    """
+    Clase que acumula las estadísticas de una serie de partidas simuladas.
+    """
+
+    def __init__(self):
+        self.partidas = 0
+        self.ganadas = 0
+        self.segundos = 0.0
+        # Cuántas partidas terminaron con cada número de jugadas y de fallos
+        self.jugadas = Counter()
+        self.fallos = Counter()
+
+    def registrar(self, juego: JuegoAhorcado):
+        """
+        Suma al resultado una partida ya terminada.
+        :param juego: Juego que acaba de terminar.
+        """
+        self.partidas += 1
+        if juego.dar_estado() == Estado.GANADOR:
+            self.ganadas += 1
+        self.jugadas[len(juego.dar_jugadas())] += 1
+        self.fallos[JuegoAhorcado.MAX_INTENTOS - juego.dar_intentos_disponibles()] += 1
+
+    def combinar(self, otro: 'ResultadoSimulacion'):
+        """
+        Suma a este resultado el de otra serie de partidas.
+        :param otro: Resultado a sumar.
+        """
+        self.partidas += otro.partidas
+        self.ganadas += otro.ganadas
+        self.segundos += otro.segundos
+        self.jugadas.update(otro.jugadas)
+        self.fallos.update(otro.fallos)
+
+    def tasa_victorias(self) -> float:
+        return self.ganadas / self.partidas if self.partidas else 0.0
+
+    def partidas_por_segundo(self) -> float:
+        return self.partidas / self.segundos if self.segundos else 0.0
+
+    def promedio_fallos(self) -> float:
+        if not self.partidas:
+            return 0.0
+        return sum(fallos * veces for fallos, veces in self.fallos.items()) / self.partidas
+
+    def resumen(self) -> str:
+        """
+        Construye un informe legible con las estadísticas.
+        :return: Texto de varias líneas con el informe.
+        """
+        lineas = [
+            f"Partidas:           {self.partidas}",
+            f"Partidas/segundo:   {self.partidas_por_segundo():.0f}",
+            f"Tasa de victorias:  {self.tasa_victorias():.2%}",
+            f"Fallos promedio:    {self.promedio_fallos():.2f} de {JuegoAhorcado.MAX_INTENTOS}",
+            "Jugadas por partida:",
+        ]
+        for jugadas in sorted(self.jugadas):
+            veces = self.jugadas[jugadas]
+            lineas.append(f"  {jugadas:>3}: {veces:>8} ({veces / self.partidas:.1%})")
+        return "\n".join(lineas)
+
+
+def jugar_partida(juego: JuegoAhorcado, estrategia) -> None:
+    """
+    Juega una partida ya iniciada hasta que termine.
+    :param juego: Juego en estado JUGANDO.
+    :param estrategia: Objeto con un método elegir_letra(juego).
+    :raise ValueError: Si la estrategia escoge una letra que el juego no acepta (repetida o fuera
+    del alfabeto); jugar_letra la ignoraría sin costo y la partida no terminaría nunca.
+    """
+    while juego.dar_estado() == Estado.JUGANDO:
+        letra = estrategia.elegir_letra(juego)
+        if juego.alfabeto.bit_de(letra) == 0 or juego.letra_utilizada(letra):
+            raise ValueError(f"La estrategia escogió '{letra.dar_letra()}', que no es una jugada válida")
+        juego.jugar_letra(letra)
+
+
+def simular(estrategia, cantidad: int, diccionario: Optional[Diccionario] = None,
+            semilla: int = 0, inicio: int = 0, alfabeto: Optional[Alfabeto] = None) -> ResultadoSimulacion:
+    """
+    Juega una serie de partidas con las reglas reales de JuegoAhorcado, sin interfaz.
+    Las palabras salen del calendario de la semilla, así la simulación es reproducible.
+    :param estrategia: Objeto con un método elegir_letra(juego).
+    :param cantidad: Número de partidas.
+    :param diccionario: Diccionario a usar; si no se indica, el predeterminado.
+    :param semilla: Semilla maestra de la simulación.
+    :param inicio: Número de la primera partida dentro del calendario.
+    :param alfabeto: Alfabeto con el que se juega; si no se indica, el español.
+    :return: Las estadísticas de las partidas.
+    """
+    if diccionario is None:
+        diccionario = Diccionario.predeterminado()
+    _, posiciones = generar_calendario(cantidad, semilla, len(diccionario), inicio)
+    return simular_posiciones(estrategia, posiciones, diccionario, alfabeto)
+
+
+def simular_posiciones(estrategia, posiciones: Iterable[int], diccionario: Diccionario,
+                       alfabeto: Optional[Alfabeto] = None) -> ResultadoSimulacion:
+    """
+    Juega una partida por cada posición indicada del diccionario.
+    :param estrategia: Objeto con un método elegir_letra(juego).
+    :param posiciones: Posiciones de las palabras a jugar.
+    :param diccionario: Diccionario del que salen las palabras.
+    :param alfabeto: Alfabeto con el que se juega; si no se indica, el español.
+    :return: Las estadísticas de las partidas.
+    """
+    juego = JuegoAhorcado(diccionario, alfabeto=alfabeto)
+    resultado = ResultadoSimulacion()
+    comienzo = time.perf_counter()
+    for posicion in posiciones:
+        juego.iniciar_con_posicion(posicion)
+        jugar_partida(juego, estrategia)
+        resultado.registrar(juego)
+    resultado.segundos = time.perf_counter() - comienzo
+    return resultado
+
+
+def main():
+    """
+    Ejecuta una simulación desde la línea de comandos.
+    Uso: python -m src.Simulacion --partidas 100000 --estrategia frecuencia [--diccionario palabras.txt]
+    """
+    analizador = argparse.ArgumentParser(description="Simulación del ahorcado sin interfaz")
+    analizador.add_argument("--partidas", type=int, default=100000)
+    analizador.add_argument("--estrategia", choices=sorted(ESTRATEGIAS), default="frecuencia")
+    analizador.add_argument("--diccionario", help="Lista de palabras (texto plano o .gz)")
+    analizador.add_argument("--semilla", type=int, default=0)
+    argumentos = analizador.parse_args()
+
+    diccionario = cargar_diccionario(argumentos.diccionario) if argumentos.diccionario else Diccionario.predeterminado()
+    estrategia = ESTRATEGIAS[argumentos.estrategia](argumentos.semilla, diccionario)
+    resultado = simular(estrategia, argumentos.partidas, diccionario, argumentos.semilla)
+    print(f"Estrategia: {argumentos.estrategia}")
+    print(resultado.resumen())
+
+
+if __name__ == "__main__":
+    main()
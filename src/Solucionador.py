@@ -0,0 +1,192 @@
+__author__ = "Nicolas Alejandro Diaz Acosta"
+__license__ = "GPL"
+__version__ = "1.0.0"
+__email__ = "nicolas.diazacost@campusucc.edu.co"
+
+import weakref
+from collections import OrderedDict
+from typing import Dict, Iterable, List, Optional, Sequence
+
+import numpy as np
+
+from src.Alfabeto import Alfabeto, ESPANOL
+from src.Diccionario import Diccionario
+from src.IndicePatrones import GrupoLongitud, IndicePatrones
+from src.JuegoAhorcado import JuegoAhorcado
+from src.Letra import Letra
+
+# Letras que se juegan, en orden de frecuencia, cuando la palabra no está en el diccionario;
+# después siguen las demás letras del alfabeto
+LETRAS_RESPALDO = "eaosrnidlctumpbgvyqhfzjñxkw"
+# Cantidad de decisiones que se recuerdan para no repetir el cálculo en estados ya vistos
+MAX_DECISIONES = 200000
+
+
+class FirmasGrupo:
+    """
+    Clase con, para cada palabra de un grupo y cada letra, el identificador de la "firma"
+    de la letra en la palabra: el conjunto de posiciones donde aparece (vacío si no está).
+    Los identificadores de todas las letras comparten un solo rango de números, de modo que
+    un único np.bincount cuenta a la vez cuántas candidatas caen en cada resultado posible
+    de cada letra.
+    """
+
+    def __init__(self, p_grupo: GrupoLongitud, p_textos: Sequence[str]):
+        """
+        Calcula las firmas de todas las palabras del grupo.
+        :param p_grupo: Grupo de palabras de una longitud.
+        :param p_textos: Texto de cada palabra del grupo, en el orden de sus números locales.
+        """
+        self.simbolos: List[str] = sorted(p_grupo.contiene)
+        columna = {simbolo: numero for numero, simbolo in enumerate(self.simbolos)}
+        ids_por_columna: List[Dict[int, int]] = [{0: 0} for _ in self.simbolos]
+
+        locales = np.zeros((len(p_textos), len(self.simbolos)), dtype=np.int64)
+        for local, texto in enumerate(p_textos):
+            mascaras: Dict[str, int] = {}
+            for posicion, simbolo in enumerate(texto):
+                mascaras[simbolo] = mascaras.get(simbolo, 0) | (1 << posicion)
+            for simbolo, mascara in mascaras.items():
+                numero = columna[simbolo]
+                ids = ids_por_columna[numero]
+                locales[local, numero] = ids.setdefault(mascara, len(ids))
+
+        # Se desplazan los identificadores de cada columna para que no se mezclen
+        tamanos = np.array([len(ids) for ids in ids_por_columna], dtype=np.int64)
+        self.inicios = np.concatenate(([0], np.cumsum(tamanos)[:-1]))
+        self.total_ids = int(tamanos.sum())
+        tipo = np.int32 if self.total_ids < 2 ** 31 else np.int64
+        self.ids = (locales + self.inicios[None, :]).astype(tipo)
+        # Identificador de "la letra no está en la palabra" de cada columna
+        self.ids_ausente = self.inicios.copy()
+
+
+def indices_desde_bits(p_bits: int) -> np.ndarray:
+    """
+    Convierte un conjunto de bits en el arreglo de posiciones de sus bits encendidos.
+    :param p_bits: Conjunto de bits.
+    :return: Arreglo de posiciones, de menor a mayor.
+    """
+    buffer = np.frombuffer(p_bits.to_bytes((p_bits.bit_length() + 7) // 8, "little"), dtype=np.uint8)
+    return np.flatnonzero(np.unpackbits(buffer, bitorder="little"))
+
+
+class Solucionador:
+    """
+    Clase que sugiere la letra con mayor ganancia de información esperada: la que mejor reparte
+    las palabras candidatas según el patrón que revelaría.
+    Las candidatas salen de un IndicePatrones como conjunto de bits y el reparto se cuenta con
+    NumPy de una sola vez para todas las letras. Solo sugiere letras del alfabeto que todavía
+    no se jugaron, comparadas con el mismo plegado que jugar_letra.
+    """
+
+    # Un solucionador por diccionario y alfabeto, para no reconstruir el índice en cada estrategia
+    _por_diccionario: 'weakref.WeakKeyDictionary[Diccionario, Dict[Alfabeto, Solucionador]]' = \
+        weakref.WeakKeyDictionary()
+
+    def __init__(self, p_diccionario: Diccionario, p_indice: Optional[IndicePatrones] = None,
+                 p_alfabeto: Alfabeto = ESPANOL):
+        """
+        Prepara el solucionador para un diccionario.
+        :param p_diccionario: Diccionario del que salen las palabras.
+        :param p_indice: Índice ya construido sobre ese diccionario (opcional); manda su alfabeto.
+        :param p_alfabeto: Alfabeto con el que se juega, si no se da el índice.
+        """
+        self.diccionario = p_diccionario
+        self.indice = p_indice if p_indice is not None else IndicePatrones(p_diccionario, p_alfabeto)
+        self.alfabeto = self.indice.alfabeto
+        self.respaldo = [simbolo for simbolo in LETRAS_RESPALDO if self.alfabeto.codigo(simbolo) is not None]
+        self.respaldo += [simbolo for simbolo in self.alfabeto.simbolos if simbolo not in self.respaldo]
+        self._firmas: Dict[int, FirmasGrupo] = {}
+        self._decisiones: 'OrderedDict[tuple, Optional[str]]' = OrderedDict()
+
+    @classmethod
+    def para(cls, p_diccionario: Diccionario, p_alfabeto: Alfabeto = ESPANOL) -> 'Solucionador':
+        """
+        Devuelve el solucionador compartido de un diccionario, creándolo la primera vez.
+        :param p_diccionario: Diccionario del que salen las palabras.
+        :param p_alfabeto: Alfabeto con el que se juega.
+        :return: El solucionador.
+        """
+        por_alfabeto = cls._por_diccionario.get(p_diccionario)
+        if por_alfabeto is None:
+            por_alfabeto = cls._por_diccionario[p_diccionario] = {}
+        solucionador = por_alfabeto.get(p_alfabeto)
+        if solucionador is None:
+            solucionador = por_alfabeto[p_alfabeto] = cls(p_diccionario, p_alfabeto=p_alfabeto)
+        return solucionador
+
+    def _firmas_de(self, p_grupo: GrupoLongitud) -> FirmasGrupo:
+        firmas = self._firmas.get(p_grupo.longitud)
+        if firmas is None:
+            textos = [self.indice.plegar_texto(self.diccionario.dar_texto(posicion))
+                      for posicion in p_grupo.palabras]
+            firmas = self._firmas[p_grupo.longitud] = FirmasGrupo(p_grupo, textos)
+        return firmas
+
+    def mejor_letra(self, p_patron: Sequence[str], p_jugadas: Iterable[str],
+                    p_ultimo_intento: bool = False) -> Optional[str]:
+        """
+        Calcula la mejor letra para un estado del juego.
+        :param p_patron: Ocurrencias, con "_" en las posiciones ocultas.
+        :param p_jugadas: Letras ya jugadas.
+        :param p_ultimo_intento: Si solo queda un intento se prefiere la letra más probable
+        de estar en la palabra en lugar de la más informativa.
+        :return: La letra sugerida (en su forma canónica del alfabeto), o None si ya no queda
+        ninguna por jugar.
+        """
+        jugadas = frozenset(map(self.indice.plegar, p_jugadas))
+        clave = (tuple(p_patron), jugadas, p_ultimo_intento)
+        if clave in self._decisiones:
+            self._decisiones.move_to_end(clave)
+            return self._decisiones[clave]
+
+        letra = self._calcular(p_patron, jugadas, p_ultimo_intento)
+        self._decisiones[clave] = letra
+        if len(self._decisiones) > MAX_DECISIONES:
+            self._decisiones.popitem(last=False)
+        return letra
+
+    def _calcular(self, p_patron: Sequence[str], p_jugadas: frozenset, p_ultimo_intento: bool) -> Optional[str]:
+        grupo, bits = self.indice.consultar(p_patron, p_jugadas)
+        cantidad = bits.bit_count()
+        if cantidad == 0:
+            # La palabra no está en el diccionario: se juega por frecuencia
+            return next((simbolo for simbolo in self.respaldo if simbolo not in p_jugadas), None)
+
+        firmas = self._firmas_de(grupo)
+        ids = firmas.ids[indices_desde_bits(bits)]
+        conteos = np.bincount(ids.ravel(), minlength=firmas.total_ids).astype(np.float64)
+
+        if p_ultimo_intento:
+            # Probabilidad de acertar: candidatas que no caen en "ausente"
+            puntajes = cantidad - conteos[firmas.ids_ausente]
+        else:
+            probabilidades = conteos / cantidad
+            terminos = np.zeros_like(probabilidades)
+            positivas = probabilidades > 0
+            terminos[positivas] = -probabilidades[positivas] * np.log2(probabilidades[positivas])
+            puntajes = np.add.reduceat(terminos, firmas.inicios)
+            if cantidad == 1:
+                # Con una sola candidata la información es cero: basta con jugar una de sus letras
+                puntajes = cantidad - conteos[firmas.ids_ausente]
+
+        for numero, simbolo in enumerate(firmas.simbolos):
+            # Las jugadas ya vienen plegadas, así 'í' cuenta como jugada si se jugó 'i'; los
+            # caracteres que no son del alfabeto se ven desde el principio y no se juegan
+            if simbolo in p_jugadas or self.alfabeto.codigo(simbolo) is None:
+                puntajes[numero] = -1.0
+        mejor = int(np.argmax(puntajes))
+        if puntajes[mejor] < 0:
+            return None
+        return firmas.simbolos[mejor]
+
+    def sugerir(self, p_juego: JuegoAhorcado) -> Optional[Letra]:
+        """
+        Sugiere la siguiente letra para un juego en curso usando solo sus datos públicos.
+        :param p_juego: Juego en curso.
+        :return: La letra sugerida, o None si ya no queda ninguna por jugar.
+        """
+        jugadas = [letra.dar_letra() for letra in p_juego.dar_jugadas()]
+        simbolo = self.mejor_letra(p_juego.dar_ocurrencias(), jugadas, p_juego.dar_intentos_disponibles() == 1)
+        return Letra(simbolo) if simbolo is not None else None
@@ -0,0 +1,127 @@
+__author__ = "Nicolas Alejandro Diaz Acosta"
+__license__ = "GPL"
+__version__ = "1.0.0"
+__email__ = "nicolas.diazacost@campusucc.edu.co"
+
+import argparse
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+from src.Calendario import semilla_de_juego
+from src.CacheDiccionario import cargar_diccionario
+from src.Diccionario import Diccionario
+from src.JuegoAhorcado import JuegoAhorcado
+from src.Simulacion import ESTRATEGIAS, ResultadoSimulacion, simular_posiciones
+
+# Diccionario de cada proceso trabajador; se carga una sola vez al iniciar el proceso
+_diccionario_trabajador: Optional[Diccionario] = None
+
+
+def _iniciar_trabajador(p_ruta: Optional[str]):
+    """
+    Carga el diccionario en el proceso trabajador. Con una ruta se mapea la caché compilada,
+    así todos los procesos comparten las mismas páginas en memoria.
+    :param p_ruta: Lista de palabras, o None para el diccionario predeterminado.
+    """
+    global _diccionario_trabajador
+    _diccionario_trabajador = cargar_diccionario(p_ruta) if p_ruta else Diccionario.predeterminado()
+
+
+def _jugar_bloque(p_tarea: Tuple[str, int, int, int]) -> Tuple[str, ResultadoSimulacion]:
+    """
+    Juega con una estrategia todas las palabras de un bloque del diccionario.
+    Solo viajan entre procesos la tarea (cuatro números y un nombre) y el resultado.
+    :param p_tarea: Tupla (estrategia, primera posición, última posición + 1, semilla).
+    :return: El nombre de la estrategia y el resultado del bloque.
+    """
+    nombre, inicio, fin, semilla = p_tarea
+    # Cada bloque tiene su propia semilla, así el resultado no depende de qué proceso lo juega
+    estrategia = ESTRATEGIAS[nombre](semilla_de_juego(semilla, inicio), _diccionario_trabajador)
+    return nombre, simular_posiciones(estrategia, range(inicio, fin), _diccionario_trabajador)
+
+
+def dividir_tareas(p_estrategias: Sequence[str], p_total: int, p_bloque: int,
+                   p_semilla: int) -> Iterator[Tuple[str, int, int, int]]:
+    """
+    Parte el torneo en bloques de palabras consecutivas para cada estrategia.
+    :param p_estrategias: Nombres de las estrategias.
+    :param p_total: Número de palabras del diccionario.
+    :param p_bloque: Palabras por bloque.
+    :param p_semilla: Semilla del torneo.
+    :return: Generador de tareas (estrategia, inicio, fin, semilla).
+    """
+    for inicio in range(0, p_total, p_bloque):
+        for nombre in p_estrategias:
+            yield nombre, inicio, min(inicio + p_bloque, p_total), p_semilla
+
+
+def jugar_torneo(p_estrategias: Sequence[str], p_ruta: Optional[str] = None, p_trabajadores: Optional[int] = None,
+                 p_bloque: int = 2000, p_semilla: int = 0) -> Dict[str, ResultadoSimulacion]:
+    """
+    Enfrenta varias estrategias sobre todas las palabras del diccionario usando varios procesos.
+    Los resultados parciales se van sumando a medida que terminan los bloques.
+    :param p_estrategias: Nombres de las estrategias (claves de ESTRATEGIAS).
+    :param p_ruta: Lista de palabras, o None para el diccionario predeterminado.
+    :param p_trabajadores: Número de procesos; por defecto, uno por núcleo.
+    :param p_bloque: Palabras por tarea.
+    :param p_semilla: Semilla del torneo.
+    :return: El resultado acumulado de cada estrategia.
+    """
+    for nombre in p_estrategias:
+        if nombre not in ESTRATEGIAS:
+            raise ValueError(f"Estrategia desconocida: {nombre}")
+    # El diccionario se carga aquí una vez para conocer su tamaño (y dejar la caché lista)
+    total = len(cargar_diccionario(p_ruta) if p_ruta else Diccionario.predeterminado())
+    resultados = {nombre: ResultadoSimulacion() for nombre in p_estrategias}
+
+    with ProcessPoolExecutor(max_workers=p_trabajadores, initializer=_iniciar_trabajador,
+                             initargs=(p_ruta,)) as ejecutor:
+        pendientes = [ejecutor.submit(_jugar_bloque, tarea)
+                      for tarea in dividir_tareas(p_estrategias, total, p_bloque, p_semilla)]
+        for terminada in as_completed(pendientes):
+            nombre, parcial = terminada.result()
+            resultados[nombre].combinar(parcial)
+    return resultados
+
+
+def tabla_resultados(p_resultados: Dict[str, ResultadoSimulacion]) -> List[str]:
+    """
+    Construye la tabla del torneo, de la estrategia con más victorias a la de menos.
+    :param p_resultados: Resultado de cada estrategia.
+    :return: Líneas de texto de la tabla.
+    """
+    lineas = [f"{'estrategia':<14} {'partidas':>10} {'victorias':>10} {'fallos promedio':>18}"]
+    for nombre, resultado in sorted(p_resultados.items(), key=lambda item: -item[1].tasa_victorias()):
+        fallos = f"{resultado.promedio_fallos():.2f} / {JuegoAhorcado.MAX_INTENTOS}"
+        lineas.append(f"{nombre:<14} {resultado.partidas:>10} {resultado.tasa_victorias():>10.2%} {fallos:>18}")
+    return lineas
+
+
+def main():
+    """
+    Ejecuta un torneo desde la línea de comandos.
+    Uso: python -m src.Torneo [--diccionario palabras.txt] [--estrategias frecuencia aleatoria] [--trabajadores 8]
+    """
+    analizador = argparse.ArgumentParser(description="Torneo de estrategias sobre todo el diccionario")
+    analizador.add_argument("--diccionario", help="Lista de palabras (texto plano o .gz)")
+    analizador.add_argument("--estrategias", nargs="+", choices=sorted(ESTRATEGIAS), default=sorted(ESTRATEGIAS))
+    analizador.add_argument("--trabajadores", type=int, default=os.cpu_count())
+    analizador.add_argument("--bloque", type=int, default=2000)
+    analizador.add_argument("--semilla", type=int, default=0)
+    argumentos = analizador.parse_args()
+
+    inicio = time.perf_counter()
+    resultados = jugar_torneo(argumentos.estrategias, argumentos.diccionario, argumentos.trabajadores,
+                              argumentos.bloque, argumentos.semilla)
+    segundos = time.perf_counter() - inicio
+    partidas = sum(resultado.partidas for resultado in resultados.values())
+
+    print("\n".join(tabla_resultados(resultados)))
+    print(f"{partidas} partidas en {segundos:.2f} s con {argumentos.trabajadores} procesos "
+          f"({partidas / segundos:.0f} partidas/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,6 +3,9 @@ __license__ = "GPL"
 __version__ = "1.0.0"
 __email__ = "nicolas.diazacost@campusucc.edu.co"
 
+import sys
+from src.Alfabeto import ALFABETOS
+from src.CacheDiccionario import cargar_diccionario
 from src.JuegoAhorcado import JuegoAhorcado, Estado
 from src.Letra import Letra
 
@@ -110,13 +113,22 @@ def mostrar_estado_juego(juego):
     # Mostramos el dibujo del ahorcado correspondiente
     mostrar_ahorcado(juego.dar_intentos_disponibles())
 
-def main():
+def main(ruta_diccionario=None, alfabeto=None):
     """
     Función principal del juego que maneja toda la interfaz de usuario
     y el bucle principal del juego.
+    :param ruta_diccionario: Archivo de palabras (texto plano o .gz) opcional.
+    Si no se indica, se juega con el diccionario predeterminado.
+    :param alfabeto: Alfabeto con el que se juega; por defecto, el español.
     """
+    # Cargamos el diccionario indicado (usando su versión compilada si existe),
+    # o dejamos que el juego use el predeterminado
+    diccionario = None
+    if ruta_diccionario is not None:
+        diccionario = cargar_diccionario(ruta_diccionario)
+
     # Creamos una instancia del juego
-    juego = JuegoAhorcado()
+    juego = JuegoAhorcado(diccionario, alfabeto=alfabeto)
     
     # Mostramos el mensaje de bienvenida
     print("¡Bienvenido al Juego del Ahorcado!")
@@ -140,10 +152,10 @@ def main():
             # Pedimos al usuario que ingrese una letra
             entrada = input("Ingresa una letra: ").strip().lower()
             
-            # Validamos que la entrada sea válida
-            if len(entrada) != 1 or not entrada.isalpha():
+            # Validamos que la entrada sea una letra del alfabeto del juego
+            if not juego.alfabeto.es_valida(entrada):
                 # Si no es una sola letra del alfabeto, mostramos error
-                print("Por favor, ingresa solo una letra válida.")
+                print(f"Por favor, ingresa solo una letra válida ({juego.alfabeto.teclado()}).")
                 continue  # Volvemos al inicio del bucle
             
             # Creamos un objeto Letra con la entrada del usuario
@@ -199,4 +211,5 @@ def main():
 if __name__ == "__main__":
     # Solo ejecutamos main() si este archivo se ejecuta directamente
     # (no si se importa desde otro archivo)
-    main()
+    # Opcionalmente se puede indicar un archivo de palabras y el alfabeto: python -m src.main palabras.txt en
+    main(sys.argv[1] if len(sys.argv) > 1 else None, ALFABETOS[sys.argv[2]] if len(sys.argv) > 2 else None)
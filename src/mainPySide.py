@@ -6,7 +6,7 @@ __email__ = "nicolas.diazacost@campusucc.edu.co"
 import sys
 from PySide6.QtWidgets import (QApplication, QMainWindow, QWidget, QVBoxLayout, 
                               QHBoxLayout, QGridLayout, QPushButton, QLabel, 
-                              QFrame, QSpacerItem, QSizePolicy, QScrollArea)
+                              QFrame, QSpacerItem, QSizePolicy, QScrollArea, QComboBox)
 from PySide6.QtCore import Qt, QTimer, QPropertyAnimation, QEasingCurve, Signal
 from PySide6.QtGui import QFont, QPainter, QPen, QColor, QPixmap, QFontMetrics
 import random
@@ -14,9 +14,13 @@ from enum import Enum
 from typing import List
 
 # Importar las clases del juego
-from src.JuegoAhorcado import JuegoAhorcado, Estado
+from src.JuegoAhorcado import JuegoAhorcado, Estado, vencer_turnos
 from src.Letra import Letra
 from src.Palabra import Palabra
+from src.Alfabeto import ALFABETOS
+from src.CacheDiccionario import cargar_diccionario
+from src.Dificultad import BANDAS, cargar_tabla
+from src.RuedaTemporizadores import RuedaTemporizadores
 
 class HangmanDrawing(QWidget):
     """Widget personalizado para dibujar el ahorcado - Responsive"""
@@ -169,10 +173,17 @@ class LetterButton(QPushButton):
         """)
 
 class HangmanGUI(QMainWindow):
-    def __init__(self):
+    def __init__(self, diccionario=None, dificultades=None, alfabeto=None, limite_jugada=None):
         super().__init__()
-        self.juego = JuegoAhorcado()
+        # Con límite por jugada, un QTimer avanza la rueda de temporizadores del juego
+        self.rueda = RuedaTemporizadores(0.1) if limite_jugada is not None else None
+        self.juego = JuegoAhorcado(diccionario, dificultades=dificultades, alfabeto=alfabeto,
+                                   rueda=self.rueda, limite_jugada=limite_jugada)
         self.init_ui()
+        if self.rueda is not None:
+            self.turn_timer = QTimer(self)
+            self.turn_timer.timeout.connect(self.check_turn)
+            self.turn_timer.start(100)
         
     def init_ui(self):
         self.setWindowTitle("Juego del Ahorcado")
@@ -305,14 +316,12 @@ class HangmanGUI(QMainWindow):
         
         # Crear botones de letras con mejor distribución
         self.letter_buttons = {}
-        letters = "ABCDEFGHIJKLMNÑOPQRSTUVWXYZ"
+        # Las teclas salen del alfabeto del juego (por ejemplo A-Z y Ñ en español)
+        letters = self.juego.alfabeto.teclado()
         
         # Distribución en 3 filas más equilibrada
-        rows = [
-            letters[:9],   # A-I (9 letras)
-            letters[9:18], # J-R (9 letras)
-            letters[18:]   # S-Z (8 letras)
-        ]
+        per_row = -(-len(letters) // 3)
+        rows = [letters[i:i + per_row] for i in range(0, len(letters), per_row)]
         
         for row_letters in rows:
             row_layout = QHBoxLayout()
@@ -328,6 +337,16 @@ class HangmanGUI(QMainWindow):
         
         right_layout.addWidget(keyboard_frame)
         
+        # Selector de dificultad, solo si el diccionario tiene sus palabras puntuadas
+        self.difficulty_combo = None
+        if self.juego.dificultades is not None:
+            self.difficulty_combo = QComboBox()
+            self.difficulty_combo.addItem("Cualquiera", None)
+            for banda in BANDAS:
+                self.difficulty_combo.addItem(banda.capitalize(), banda)
+            self.difficulty_combo.setFont(QFont("Arial", 11))
+            right_layout.addWidget(self.difficulty_combo)
+        
         # Botón de nuevo juego
         self.new_game_btn = QPushButton("Nuevo Juego")
         self.new_game_btn.setFont(QFont("Arial", 12, QFont.Bold))
@@ -380,7 +399,12 @@ class HangmanGUI(QMainWindow):
     
     def new_game(self):
         """Inicia un nuevo juego"""
-        self.juego.iniciar_juego()
+        banda = self.difficulty_combo.currentData() if self.difficulty_combo is not None else None
+        self.juego.iniciar_juego(banda)
+        if banda is not None:
+            self.hint_label.setText(f"Pista: Dificultad {self.difficulty_combo.currentText().lower()}")
+        else:
+            self.hint_label.setText("Pista: Términos de Programación")
         
         # Habilitar todos los botones y restaurar colores
         for btn in self.letter_buttons.values():
@@ -404,12 +428,17 @@ class HangmanGUI(QMainWindow):
         
         self.update_display()
     
+    def check_turn(self):
+        """Cobra como fallo la jugada si se acabó su tiempo"""
+        if vencer_turnos(self.rueda):
+            self.update_display()
+
     def letter_clicked(self, letter):
         """Maneja el clic en una letra"""
         if self.juego.dar_estado() != Estado.JUGANDO:
             return
         
-        letra = Letra(letter.lower())
+        letra = Letra(letter)
         resultado = self.juego.jugar_letra(letra)
         
         # Deshabilitar el botón y cambiar su color
@@ -593,7 +622,16 @@ def main():
     font = QFont("Arial", 10)
     app.setFont(font)
     
-    window = HangmanGUI()
+    # Si se indica un archivo de palabras se carga desde su caché compilada
+    diccionario = cargar_diccionario(sys.argv[1]) if len(sys.argv) > 1 else None
+    # Y si ya se calcularon sus puntajes (python -m src.Dificultad), se puede escoger la dificultad
+    dificultades = cargar_tabla(sys.argv[1], diccionario) if diccionario is not None else None
+    # Opcionalmente, el alfabeto con el que se juega: python -m src.mainPySide palabras.txt en
+    alfabeto = ALFABETOS[sys.argv[2]] if len(sys.argv) > 2 else None
+    # Y los segundos que hay para cada jugada: python -m src.mainPySide palabras.txt es 15
+    limite_jugada = float(sys.argv[3]) if len(sys.argv) > 3 else None
+    
+    window = HangmanGUI(diccionario, dificultades, alfabeto, limite_jugada)
     window.show()
     
     sys.exit(app.exec())
@@ -0,0 +1,65 @@
+import pytest
+from src.Alfabeto import Alfabeto, ESPANOL, INGLES, MAX_SIMBOLOS
+from src.Diccionario import Diccionario
+from src.JuegoAhorcado import JuegoAhorcado, Estado
+from src.Letra import Letra
+from src.Palabra import Palabra
+from src.Plegado import PLEGADO_TILDES
+
+RUSO = Alfabeto("ruso", "абвгдеёжзийклмнопрстуфхцчшщъыьэюя")
+
+def test_codigos_densos():
+    assert [ESPANOL.codigo(simbolo) for simbolo in "abcñz"] == [0, 1, 2, 14, 26]
+    assert ESPANOL.codigo("Ñ") == 14 and ESPANOL.codigo("Á") == 0, "Mayúsculas y tildes deben plegarse"
+    assert INGLES.codigo("ñ") is None
+    assert len(RUSO) == 33 and RUSO.codigo("Я") == 32
+    assert ESPANOL.teclado() == "ABCDEFGHIJKLMNÑOPQRSTUVWXYZ"
+
+def test_validador():
+    assert ESPANOL.es_valida("ñ") and ESPANOL.es_valida("É")
+    assert not INGLES.es_valida("ñ")
+    assert not ESPANOL.es_valida("ab") and not ESPANOL.es_valida("1") and not ESPANOL.es_valida("")
+
+def test_alfabetos_invalidos():
+    with pytest.raises(ValueError):
+        Alfabeto("repetido", "abca")
+    with pytest.raises(ValueError):
+        Alfabeto("enorme", "".join(chr(0x4E00 + numero) for numero in range(MAX_SIMBOLOS + 1)))
+
+def test_tildes_en_espanol():
+    juego = JuegoAhorcado(Diccionario(["canción"]))
+    juego.iniciar_con_posicion(0)
+    assert juego.jugar_letra(Letra("O")), "La o debe destapar la ó"
+    assert juego.dar_ocurrencias() == list("_____ó_"), "Se muestra la letra tal como está escrita"
+    assert juego.letra_utilizada(Letra("ó"))
+    for simbolo in "cain":
+        juego.jugar_letra(Letra(simbolo))
+    assert juego.dar_estado() == Estado.GANADOR
+
+def test_letras_fuera_del_alfabeto():
+    juego = JuegoAhorcado(Diccionario(["niño"]), alfabeto=INGLES)
+    juego.iniciar_con_posicion(0)
+    # La ñ no es del alfabeto inglés: se ve desde el principio y no se puede jugar
+    assert juego.dar_ocurrencias() == list("__ñ_")
+    assert not juego.jugar_letra(Letra("ñ"))
+    assert juego.dar_intentos_disponibles() == JuegoAhorcado.MAX_INTENTOS, "Una letra inválida no cuesta intentos"
+    assert not Palabra("niño", INGLES).esta_completa([Letra("n"), Letra("i")])
+    assert Palabra("niño", INGLES).esta_completa([Letra("n"), Letra("i"), Letra("o")])
+
+def test_estado_en_una_palabra_de_maquina():
+    # Con un alfabeto de 40 letras las jugadas siguen cabiendo en 64 bits
+    alfabeto = Alfabeto("propio", RUSO.simbolos + "ǆǉǌǳșțæ")
+    assert len(alfabeto) == 40
+    juego = JuegoAhorcado(Diccionario(["съешьǆ"]), alfabeto=alfabeto)
+    juego.iniciar_con_posicion(0)
+    for simbolo in "СЪЕШЬǅ":
+        juego.jugar_letra(Letra(simbolo))
+    assert juego.dar_estado() == Estado.GANADOR
+    assert juego.mascara_jugadas < 1 << 64
+
+def test_letras_creadas_antes_de_consultar():
+    griego = Alfabeto("griego", "αβγδεζηθικλμνξοπρστυφχψω", PLEGADO_TILDES)
+    # Dos letras nuevas creadas antes de que el alfabeto consulte cualquiera de las dos
+    alfa_con_tilde, epsilon_con_tilde = Letra("ά"), Letra("έ")
+    assert griego.bit_de(epsilon_con_tilde) == 1 << griego.codigo("ε")
+    assert griego.bit_de(alfa_con_tilde) == 1 << griego.codigo("α"), "La letra creada antes no debe quedar fuera"
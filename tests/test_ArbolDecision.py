@@ -0,0 +1,94 @@
+import random
+import pytest
+
+pytest.importorskip("numpy")
+
+from src.Alfabeto import INGLES
+from src.ArbolDecision import ArbolDecision, abrir, calcular_decisiones, construir, escribir_arbol, \
+    huella_alfabeto, huella_diccionario, ruta_arbol
+from src.Diccionario import Diccionario
+from src.JuegoAhorcado import JuegoAhorcado, Estado
+from src.RuedaTemporizadores import RuedaTemporizadores
+from src.Solucionador import Solucionador
+
+@pytest.fixture
+def lista(tmp_path):
+    generador = random.Random(5)
+    palabras = {"".join(generador.choice("abcdeilmnorstu") for _ in range(generador.randint(4, 7))) for _ in range(300)}
+    ruta = tmp_path / "palabras.txt"
+    ruta.write_text("\n".join(sorted(palabras)) + "\n", encoding="utf-8")
+    return str(ruta)
+
+def test_arbol_coincide_con_solucionador(lista):
+    arbol = ArbolDecision(construir(lista))
+    diccionario = Diccionario.desde_archivo(lista)
+    solucionador = Solucionador(diccionario)
+    juego = JuegoAhorcado(diccionario)
+    for posicion in range(len(diccionario)):
+        juego.iniciar_con_posicion(posicion)
+        while juego.dar_estado() == Estado.JUGANDO:
+            letra = arbol.sugerir(juego)
+            assert letra == solucionador.sugerir(juego), "El árbol debe sugerir lo mismo que el solucionador"
+            juego.jugar_letra(letra)
+    arbol.cerrar()
+
+def test_ultimo_intento_por_turnos_vencidos(lista):
+    # Los turnos vencidos dejan un solo intento sin jugar letras: el árbol debe seguir al solucionador
+    arbol = ArbolDecision(construir(lista))
+    diccionario = Diccionario.desde_archivo(lista)
+    solucionador = Solucionador(diccionario)
+    juego = JuegoAhorcado(diccionario, rueda=RuedaTemporizadores(1.0, lambda: 0.0), limite_jugada=10)
+    distintas = 0
+    for posicion in range(len(diccionario)):
+        juego.iniciar_con_posicion(posicion)
+        juego.jugar_letra(arbol.sugerir(juego))
+        while juego.dar_intentos_disponibles() > 1:
+            juego.vencer_turno()
+        if juego.dar_estado() != Estado.JUGANDO:
+            continue
+        letra = arbol.sugerir(juego)
+        assert letra is not None and letra == solucionador.sugerir(juego), "El último intento también está en el árbol"
+        jugadas = [jugada.dar_letra() for jugada in juego.dar_jugadas()]
+        distintas += letra.dar_letra() != arbol.mejor_letra(juego.dar_ocurrencias(), jugadas)
+    assert distintas > 0, "Con un solo intento el solucionador cambia de letra en algunos estados"
+    arbol.cerrar()
+
+def test_alfabeto_del_arbol(lista):
+    arbol = abrir(lista)
+    diccionario = Diccionario.desde_archivo(lista)
+    juego = JuegoAhorcado(diccionario, alfabeto=INGLES)
+    juego.iniciar_con_posicion(0)
+    with pytest.raises(ValueError):
+        arbol.sugerir(juego)
+    arbol.cerrar()
+    with pytest.raises(ValueError):
+        ArbolDecision(ruta_arbol(lista), diccionario, INGLES)
+    # Al abrirlo con otro alfabeto se reconstruye para él
+    arbol = abrir(lista, INGLES)
+    assert arbol.huella_alfabeto == huella_alfabeto(INGLES) and arbol.sugerir(juego) is not None
+    arbol.cerrar()
+
+def test_estado_desconocido(tmp_path):
+    ruta = str(tmp_path / "vacio.arbol")
+    escribir_arbol(ruta, {}, bytes(32))
+    arbol = ArbolDecision(ruta)
+    assert arbol.mejor_letra(list("____"), "ae") is None, "Un estado que no está en el árbol no tiene sugerencia"
+    arbol.cerrar()
+
+def test_arbol_obsoleto(lista):
+    construir(lista)
+    with open(lista, "a", encoding="utf-8") as archivo:
+        archivo.write("grafo\n")
+    diccionario = Diccionario.desde_archivo(lista)
+    with pytest.raises(ValueError):
+        ArbolDecision(ruta_arbol(lista), diccionario)
+    # Al abrirlo por la lista se reconstruye con el diccionario nuevo
+    arbol = abrir(lista)
+    assert arbol.huella == huella_diccionario(diccionario)
+    arbol.cerrar()
+
+def test_archivo_invalido(tmp_path):
+    ruta = tmp_path / "roto.arbol"
+    ruta.write_bytes(b"no es un arbol" * 10)
+    with pytest.raises(ValueError):
+        ArbolDecision(str(ruta))
@@ -0,0 +1,106 @@
+import os
+import random
+import pytest
+from src.Bitacora import Bitacora, CIERRE, ENCABEZADO, REGISTRO, RESUMEN, compactar, leer_registros, leer_semilla, repetir
+from src.Diccionario import Diccionario
+from src.JuegoAhorcado import JuegoAhorcado, Estado
+from src.Letra import Letra
+
+DICCIONARIO = Diccionario(["pera", "canción", "kiwi", "mango", "murciélago", "ñandú"])
+LETRAS = "abcdefghijklmnñopqrstuvwxyz"
+
+def fabrica(p_sesion):
+    return JuegoAhorcado(DICCIONARIO, semilla=p_sesion)
+
+def jugar_al_azar(p_ruta, p_sesiones=60, p_semilla=4):
+    # Juega varias partidas por sesión con letras al azar y cierra algunas sesiones
+    generador = random.Random(p_semilla)
+    bitacora = Bitacora(p_ruta, p_sincronizar=False, p_max_pendientes=64)
+    juegos = {}
+    for sesion in range(1, p_sesiones + 1):
+        juego = juegos[sesion] = JuegoAhorcado(DICCIONARIO, semilla=sesion, bitacora=bitacora, sesion=sesion)
+        for _ in range(generador.randint(1, 3)):
+            juego.iniciar_juego()
+            for _ in range(generador.randint(0, 12)):
+                juego.jugar_letra(Letra(generador.choice(LETRAS)))
+    for sesion in range(5, p_sesiones + 1, 7):
+        bitacora.registrar_cierre(sesion)
+        del juegos[sesion]
+    bitacora.cerrar()
+    return juegos
+
+def mismo_estado(p_juego, p_otro):
+    return (p_juego.dar_posicion_actual() == p_otro.dar_posicion_actual()
+            and p_juego.mascara_jugadas == p_otro.mascara_jugadas
+            and p_juego.dar_ocurrencias() == p_otro.dar_ocurrencias()
+            and p_juego.dar_intentos_disponibles() == p_otro.dar_intentos_disponibles()
+            and p_juego.dar_estado() == p_otro.dar_estado()
+            and p_juego.partidas == p_otro.partidas)
+
+def test_repetir_reconstruye_los_juegos(tmp_path):
+    ruta = str(tmp_path / "bitacora.bin")
+    juegos = jugar_al_azar(ruta)
+    estado = repetir(ruta)
+    assert list(estado.sesiones) == sorted(juegos), "Las sesiones cerradas no deben aparecer"
+    for sesion, juego in juegos.items():
+        assert mismo_estado(estado.reconstruir(sesion, fabrica), juego), f"La sesión {sesion} no coincide"
+    assert estado.reconstruir(5, fabrica) is None
+
+def test_grupos_y_registro_incompleto(tmp_path):
+    ruta = str(tmp_path / "bitacora.bin")
+    bitacora = Bitacora(ruta, p_sincronizar=False)
+    juego = JuegoAhorcado(DICCIONARIO, bitacora=bitacora, sesion=3)
+    juego.iniciar_con_posicion(2)
+    juego.jugar_letra(Letra("k"))
+    assert os.path.getsize(ruta) == ENCABEZADO.size, "Los registros esperan a confirmar()"
+    bitacora.confirmar()
+    assert os.path.getsize(ruta) == ENCABEZADO.size + 2 * REGISTRO.size and bitacora.confirmaciones == 1
+    bitacora.cerrar()
+    # Una escritura interrumpida deja medio registro al final: se ignora al leer y se corta al reabrir
+    with open(ruta, "ab") as archivo:
+        archivo.write(b"\x01" * 7)
+    assert len(leer_registros(ruta)) == 2
+    Bitacora(ruta).cerrar()
+    assert os.path.getsize(ruta) == ENCABEZADO.size + 2 * REGISTRO.size
+
+def test_restaurar_no_registra(tmp_path):
+    bitacora = Bitacora(str(tmp_path / "bitacora.bin"), p_sincronizar=False)
+    juego = JuegoAhorcado(DICCIONARIO, bitacora=bitacora, sesion=1)
+    juego.restaurar_partida(0, 0, 6, Estado.JUGANDO)
+    assert bitacora.registros == 0
+    bitacora.cerrar()
+
+def test_compactar(tmp_path):
+    ruta = str(tmp_path / "bitacora.bin")
+    juegos = jugar_al_azar(ruta, 200)
+    antes = leer_registros(ruta)
+    cantidad = compactar(ruta)
+    despues = leer_registros(ruta)
+    assert cantidad == len(despues) < len(antes)
+    assert CIERRE not in despues["tipo"] and RESUMEN in despues["tipo"]
+    estado = repetir(ruta)
+    for sesion, juego in juegos.items():
+        assert mismo_estado(estado.reconstruir(sesion, fabrica), juego), f"La sesión {sesion} no coincide"
+    assert compactar(ruta) == cantidad, "Compactar dos veces no debe cambiar nada"
+
+def test_archivo_invalido(tmp_path):
+    ruta = tmp_path / "otra.bin"
+    ruta.write_bytes(b"no es una bitacora")
+    with pytest.raises(ValueError):
+        Bitacora(str(ruta))
+    with pytest.raises(ValueError):
+        repetir(str(ruta))
+
+def test_bitacora_vacia(tmp_path):
+    ruta = str(tmp_path / "bitacora.bin")
+    Bitacora(ruta).cerrar()
+    assert len(repetir(ruta)) == 0 and compactar(ruta) == 0
+
+def test_semilla_en_el_encabezado(tmp_path):
+    ruta = str(tmp_path / "bitacora.bin")
+    Bitacora(ruta, p_semilla=2 ** 64 - 5).cerrar()
+    bitacora = Bitacora(ruta, p_semilla=3)
+    assert bitacora.semilla == 2 ** 64 - 5, "Una bitácora existente conserva su semilla"
+    bitacora.cerrar()
+    compactar(ruta)
+    assert leer_semilla(ruta) == 2 ** 64 - 5, "Compactar no debe perder la semilla"
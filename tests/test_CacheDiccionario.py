@@ -0,0 +1,67 @@
+import os
+import pytest
+from src.CacheDiccionario import CLAVE, cargar_diccionario, ruta_cache, leer_clave
+from src.Diccionario import Diccionario
+from src.Ingesta import ingerir
+from src.JuegoAhorcado import JuegoAhorcado, Estado
+from src.Letra import Letra
+
+@pytest.fixture
+def lista(tmp_path):
+    ruta = tmp_path / "palabras.txt"
+    ruta.write_text("pila\nCola\npila\narbol\n", encoding="utf-8")
+    return str(ruta)
+
+def _textos(diccionario):
+    return [diccionario.dar_texto(i) for i in range(len(diccionario))]
+
+def test_construye_cache(lista):
+    diccionario = cargar_diccionario(lista)
+    # Las palabras se normalizan y las repetidas se descartan
+    assert _textos(diccionario) == ["pila", "cola", "arbol"]
+    assert os.path.exists(ruta_cache(lista)), "Debe crearse el diccionario compilado"
+
+def test_reutiliza_cache(lista):
+    cargar_diccionario(lista)
+    clave = leer_clave(ruta_cache(lista))
+    # Si solo cambia la fecha pero no el contenido, la caché se conserva
+    os.utime(lista, ns=(1, 1))
+    assert _textos(cargar_diccionario(lista)) == ["pila", "cola", "arbol"]
+    nueva = leer_clave(ruta_cache(lista))
+    assert nueva[2] == clave[2] and nueva[1] == 1, "Solo debe actualizarse la fecha de la clave"
+
+def test_reconstruye_cache_obsoleta(lista):
+    cargar_diccionario(lista)
+    with open(lista, "a", encoding="utf-8") as archivo:
+        archivo.write("grafo\n")
+    assert _textos(cargar_diccionario(lista)) == ["pila", "cola", "arbol", "grafo"]
+    assert not [nombre for nombre in os.listdir(os.path.dirname(ruta_cache(lista))) if nombre.endswith(".tmp")], \
+        "No deben quedar archivos temporales"
+
+def test_cache_danada_con_clave_valida(lista):
+    cargar_diccionario(lista)
+    # Se conserva la clave pero se pierde el corpus, y se cambia la fecha para pasar por el hash
+    with open(ruta_cache(lista), "r+b") as archivo:
+        archivo.truncate(CLAVE.size + 4)
+    os.utime(lista, ns=(1, 1))
+    assert _textos(cargar_diccionario(lista)) == ["pila", "cola", "arbol"]
+    assert _textos(cargar_diccionario(lista)) == ["pila", "cola", "arbol"], "La caché debe quedar reconstruida"
+
+def test_mismas_posiciones_con_y_sin_cache(lista):
+    assert _textos(Diccionario.desde_archivo(lista)) == _textos(cargar_diccionario(lista))
+
+def test_carga_la_salida_de_la_ingesta(tmp_path):
+    origen = tmp_path / "volcado.txt"
+    origen.write_text("El gato y el PERRO juegan; el gato gana.\n", encoding="utf-8")
+    destino = tmp_path / "palabras.corpus"
+    ingerir(str(origen), str(destino))
+    assert [nombre.name for nombre in tmp_path.iterdir() if nombre.suffix == ".tmp"] == [], \
+        "La ingesta no debe dejar temporales"
+    diccionario = cargar_diccionario(str(destino))
+    assert _textos(diccionario) == ["gana", "gato", "juegan", "perro"]
+    assert not os.path.exists(os.path.dirname(ruta_cache(str(destino)))), "Un corpus no necesita caché"
+    juego = JuegoAhorcado(diccionario)
+    juego.iniciar_con_posicion(1)
+    for simbolo in "GATO":
+        juego.jugar_letra(Letra(simbolo))
+    assert juego.dar_estado() == Estado.GANADOR
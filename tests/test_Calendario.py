@@ -0,0 +1,30 @@
+from src.Calendario import generar_calendario, repartir, sortear_posicion
+from src.Diccionario import Diccionario
+from src.JuegoAhorcado import JuegoAhorcado
+
+def test_juegos_reproducibles():
+    uno = JuegoAhorcado(semilla=123)
+    otro = JuegoAhorcado(semilla=123)
+    for _ in range(20):
+        uno.iniciar_juego()
+        otro.iniciar_juego()
+        assert uno.dar_posicion_actual() == otro.dar_posicion_actual(), \
+            "Con la misma semilla deben salir las mismas palabras"
+
+def test_sorteo_en_rango():
+    posiciones = {sortear_posicion(9, partida, 12) for partida in range(2000)}
+    assert posiciones == set(range(12)), "Deben poder salir todas las posiciones y ninguna fuera de rango"
+
+def test_calendario_repartido():
+    diccionario = Diccionario(["palabra"] * 1000)
+    semillas, posiciones = generar_calendario(1000, 5, len(diccionario))
+
+    # Repartir el calendario entre trabajadores da exactamente los mismos pares
+    partes = [generar_calendario(len(rango), 5, len(diccionario), rango.start) for rango in repartir(1000, 3)]
+    assert [s for parte in partes for s in parte[0]] == list(semillas), "Las semillas no deben depender del reparto"
+    assert [p for parte in partes for p in parte[1]] == list(posiciones), "Las posiciones no deben depender del reparto"
+
+    # Cada par corresponde a la primera partida de un juego con esa semilla
+    juego = JuegoAhorcado(diccionario, semilla=semillas[17])
+    juego.iniciar_juego()
+    assert juego.dar_posicion_actual() == posiciones[17], "El juego debe escoger la palabra del calendario"
@@ -0,0 +1,37 @@
+import pytest
+from src.Corpus import Corpus
+from src.Diccionario import Diccionario
+from src.JuegoAhorcado import JuegoAhorcado
+
+@pytest.fixture
+def corpus():
+    return Corpus.desde_palabras(["pila", "canción", "ñandú", "cola"])
+
+def test_corpus_en_memoria(corpus):
+    assert len(corpus) == 4, "El corpus debe tener cuatro palabras"
+    assert corpus.dar_texto(1) == "canción", "Las palabras con tildes deben conservarse"
+    assert corpus.dar_texto(2) == "ñandú", "Las palabras con eñe deben conservarse"
+    with pytest.raises(IndexError):
+        corpus.dar_texto(4)
+
+def test_guardar_y_cargar(corpus, tmp_path):
+    ruta = str(tmp_path / "palabras.corpus")
+    corpus.guardar(ruta)
+    cargado = Corpus.cargar(ruta)
+    assert [cargado.dar_texto(i) for i in range(len(cargado))] == ["pila", "canción", "ñandú", "cola"]
+    cargado.cerrar()
+
+def test_archivo_invalido(tmp_path):
+    ruta = tmp_path / "otro.corpus"
+    ruta.write_bytes(b"esto no es un corpus")
+    with pytest.raises(ValueError):
+        Corpus.cargar(str(ruta))
+
+def test_juego_sobre_corpus(corpus, tmp_path):
+    ruta = str(tmp_path / "palabras.corpus")
+    corpus.guardar(ruta)
+    juego = JuegoAhorcado(Diccionario.desde_archivo(ruta))
+    assert juego.TOTAL_PALABRAS == 4, "El total de palabras debe salir del corpus"
+    assert [letra.dar_letra() for letra in juego.dar_palabra(3).dar_letras()] == list("cola")
+    juego.iniciar_juego()
+    assert juego.dar_palabra_actual() is not None, "No se ha escogido una palabra del corpus"
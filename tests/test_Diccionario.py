@@ -0,0 +1,46 @@
+import gzip
+import pytest
+from src.Diccionario import Diccionario, PALABRAS_PREDETERMINADAS
+from src.JuegoAhorcado import JuegoAhorcado, Estado
+
+@pytest.fixture
+def archivo_palabras(tmp_path):
+    ruta = tmp_path / "palabras.txt"
+    ruta.write_text("Pila\ncola\n\n  arbol  \nno valida\n123\ngrafo\n", encoding="utf-8")
+    return ruta
+
+def test_diccionario_predeterminado():
+    diccionario = Diccionario()
+    assert len(diccionario) == len(PALABRAS_PREDETERMINADAS), "Deben cargarse las palabras predeterminadas"
+    assert diccionario.dar_texto(0) == "algoritmo", "La primera palabra es incorrecta"
+
+def test_cargar_texto_plano(archivo_palabras):
+    diccionario = Diccionario.desde_archivo(str(archivo_palabras))
+    # Las líneas vacías o que no son palabras se descartan y el resto se normaliza
+    assert [diccionario.dar_texto(i) for i in range(len(diccionario))] == ["pila", "cola", "arbol", "grafo"]
+    assert diccionario[2].esta_completa(diccionario[2].dar_letras()), "La palabra debe construirse al pedirla"
+
+def test_cargar_gzip(tmp_path):
+    ruta = tmp_path / "palabras.txt.gz"
+    with gzip.open(ruta, "wt", encoding="utf-8") as archivo:
+        archivo.write("nodo\nhoja\n")
+    diccionario = Diccionario.desde_archivo(str(ruta))
+    assert len(diccionario) == 2, "Deben cargarse las dos palabras del archivo comprimido"
+
+def test_sin_repetidas():
+    diccionario = Diccionario(["gato", "Gato", "perro", "gato"])
+    assert len(diccionario) == 2, "Las palabras repetidas deben guardarse una sola vez"
+    assert [diccionario.dar_texto(posicion) for posicion in range(2)] == ["gato", "perro"]
+
+def test_diccionario_vacio(tmp_path):
+    ruta = tmp_path / "vacio.txt"
+    ruta.write_text("\n123\n", encoding="utf-8")
+    with pytest.raises(ValueError):
+        Diccionario.desde_archivo(str(ruta))
+
+def test_juego_con_diccionario(archivo_palabras):
+    juego = JuegoAhorcado(Diccionario.desde_archivo(str(archivo_palabras)))
+    assert juego.TOTAL_PALABRAS == 4, "El total de palabras debe salir del diccionario cargado"
+    assert juego.dar_palabra(4) is None, "La posición 4 está fuera del diccionario"
+    juego.iniciar_juego()
+    assert juego.dar_estado() == Estado.JUGANDO, "El estado del juego es incorrecto"
@@ -0,0 +1,76 @@
+import os
+import random
+import pytest
+from src.CacheDiccionario import cargar_diccionario
+from src.Dificultad import actualizar, calcular_puntajes, cargar_tabla, escribir_tabla, ordenar_por_puntaje, \
+    ruta_dificultad
+from src.JuegoAhorcado import JuegoAhorcado
+from src.Diccionario import Diccionario
+
+@pytest.fixture
+def lista(tmp_path):
+    generador = random.Random(9)
+    palabras = {"".join(generador.choice("abcdefghijklmnopqrstuvwxyz") for _ in range(generador.randint(3, 9)))
+                for _ in range(500)}
+    ruta = tmp_path / "palabras.txt"
+    ruta.write_text("\n".join(sorted(palabras)) + "\n", encoding="utf-8")
+    return str(ruta)
+
+def test_puntajes_de_frecuencia():
+    # Con las letras en orden de frecuencia "osea" no falla nunca y "kiwi" falla muchas veces
+    puntajes = calcular_puntajes(Diccionario(["osea", "kiwi"]), 0, 2)
+    assert puntajes[0] == 0
+    assert puntajes[1] >= 6, "Una palabra perdida debe puntuar al menos todos los intentos"
+
+def test_orden_por_puntaje():
+    orden, inicios = ordenar_por_puntaje(bytes([3, 0, 3, 1]))
+    assert list(orden) == [1, 3, 0, 2], "El orden debe ser estable dentro de cada puntaje"
+    assert (inicios[3], inicios[4]) == (2, 4)
+
+def test_tabla_alineada_con_el_diccionario(lista):
+    tabla = actualizar(lista, p_trabajadores=1, p_bloque=100)
+    diccionario = cargar_diccionario(lista)
+    assert len(tabla) == len(diccionario)
+    assert bytes(tabla.puntajes) == calcular_puntajes(diccionario, 0, len(diccionario))
+    for banda in ("facil", "media", "dificil"):
+        inicio, fin = tabla.dar_rango(banda)
+        puntajes = [tabla.dar_puntaje(tabla.dar_posicion(numero)) for numero in range(inicio, fin)]
+        assert all(banda != "facil" or puntaje <= 1 for puntaje in puntajes)
+        assert all(banda != "dificil" or puntaje >= 4 for puntaje in puntajes)
+    tabla.cerrar()
+
+def test_actualizacion_incremental(lista):
+    tabla = actualizar(lista, p_trabajadores=1)
+    cantidad = len(tabla)
+    # Se marcan los puntajes guardados para comprobar que no se vuelven a calcular
+    escribir_tabla(ruta_dificultad(lista), bytes([200]) * cantidad, tabla.estrategia, tabla.semilla, tabla.huella)
+    tabla.cerrar()
+    with open(lista, "a", encoding="utf-8") as archivo:
+        archivo.write("zzyzx\nosea\n")
+    diccionario = cargar_diccionario(lista)
+    assert cargar_tabla(lista, diccionario) is None, "La tabla vieja no corresponde al diccionario nuevo"
+
+    tabla = actualizar(lista, p_trabajadores=1)
+    assert len(tabla) == len(diccionario) == cantidad + 2
+    assert bytes(tabla.puntajes[:cantidad]) == bytes([200]) * cantidad, "Solo deben puntuarse las palabras nuevas"
+    assert bytes(tabla.puntajes[cantidad:]) == calcular_puntajes(diccionario, cantidad, cantidad + 2)
+    tabla.cerrar()
+    assert not [nombre for nombre in os.listdir(os.path.dirname(ruta_dificultad(lista))) if nombre.endswith(".tmp")]
+
+def test_actualizacion_en_paralelo(lista):
+    tabla = actualizar(lista, p_trabajadores=2, p_bloque=100)
+    diccionario = cargar_diccionario(lista)
+    assert bytes(tabla.puntajes) == calcular_puntajes(diccionario, 0, len(diccionario)), \
+        "El resultado no debe depender de cuántos procesos se usen"
+    tabla.cerrar()
+
+def test_iniciar_juego_por_dificultad(lista):
+    diccionario = cargar_diccionario(lista)
+    tabla = actualizar(lista, p_trabajadores=1)
+    juego = JuegoAhorcado(diccionario, semilla=4, dificultades=tabla)
+    for _ in range(50):
+        juego.iniciar_juego("facil")
+        assert tabla.dar_puntaje(juego.dar_posicion_actual()) <= 1
+    with pytest.raises(ValueError):
+        JuegoAhorcado(diccionario).iniciar_juego("facil")
+    tabla.cerrar()
@@ -0,0 +1,57 @@
+import random
+import pytest
+from src.Diccionario import Diccionario
+from src.IndicePatrones import IndicePatrones
+from src.JuegoAhorcado import JuegoAhorcado
+from src.Letra import Letra
+
+@pytest.fixture
+def diccionario():
+    generador = random.Random(5)
+    return Diccionario(["".join(generador.choice("abcdelo") for _ in range(generador.randint(3, 6)))
+                        for _ in range(400)])
+
+def _compatibles(diccionario, patron, jugadas):
+    # Búsqueda lineal de referencia
+    resultado = []
+    for posicion in range(len(diccionario)):
+        texto = diccionario.dar_texto(posicion)
+        esperado = [c if c in jugadas else "_" for c in texto]
+        if esperado == list(patron):
+            resultado.append(posicion)
+    return resultado
+
+def test_patron_del_ejemplo():
+    indice = IndicePatrones(Diccionario(["algoritmo", "alboroto", "algoritmos", "olvidarlo"]))
+    assert indice.candidatas(list("_l_o_i_mo"), "loimxz") == [0], "Solo 'algoritmo' cumple el patrón"
+    assert indice.candidatas(list("_________"), "z") == [0, 3], "Sin letras reveladas caben las de longitud 9"
+    assert indice.candidatas(list("_______"), "") == [], "No hay palabras de longitud 7"
+
+def test_coincide_con_busqueda_lineal(diccionario):
+    indice = IndicePatrones(diccionario)
+    generador = random.Random(9)
+    for _ in range(100):
+        texto = diccionario.dar_texto(generador.randrange(len(diccionario)))
+        jugadas = set(generador.sample("abcdelox", generador.randint(0, 5)))
+        patron = [c if c in jugadas else "_" for c in texto]
+        assert indice.candidatas(patron, jugadas) == _compatibles(diccionario, patron, jugadas)
+
+def test_patron_con_tildes():
+    indice = IndicePatrones(Diccionario(["lingüística", "lingotes", "canción", "cancion"]))
+    juego = JuegoAhorcado(indice.diccionario)
+    juego.iniciar_con_posicion(0)
+    juego.jugar_letra(Letra("i"))
+    juego.jugar_letra(Letra("u"))
+    assert juego.dar_ocurrencias() == list("_i__üí__i__")
+    assert indice.candidatas_de_juego(juego) == [0], "La 'í' y la 'ü' se comparan plegadas, como en el juego"
+    assert indice.candidatas(list("_a___ó_"), "aó") == [2, 3], "La 'ó' y la 'o' son la misma letra"
+
+def test_candidatas_de_juego(diccionario):
+    indice = IndicePatrones(diccionario)
+    juego = JuegoAhorcado(diccionario)
+    juego.iniciar_con_posicion(17)
+    for caracter in "eoz":
+        juego.jugar_letra(Letra(caracter))
+    candidatas = indice.candidatas_de_juego(juego)
+    assert 17 in candidatas, "La palabra del juego siempre es candidata"
+    assert candidatas == _compatibles(diccionario, juego.dar_ocurrencias(), set("eoz"))
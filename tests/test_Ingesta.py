@@ -0,0 +1,57 @@
+import gzip
+import pytest
+from src.Diccionario import Diccionario
+from src.Ingesta import OpcionesIngesta, ingerir, normalizar_token, sin_repetir_externo
+from src.JuegoAhorcado import JuegoAhorcado, Estado
+from src.Letra import Letra
+
+def test_normalizar_token():
+    opciones = OpcionesIngesta()
+    assert normalizar_token("Canción", opciones) == "cancion"
+    assert normalizar_token("PIÑATA", opciones) == "piñata", "La ñ no debe perder la virgulilla"
+    # La ñ escrita como n + virgulilla combinante se compone en un solo carácter
+    assert normalizar_token("nin\u0303o", opciones) == "niño"
+    assert normalizar_token("pingüino", opciones) == "pinguino"
+    assert normalizar_token("la", opciones) is None, "Las palabras muy cortas se descartan"
+    assert normalizar_token("straße", opciones) is None, "Las letras fuera del alfabeto se descartan"
+    con_tildes = OpcionesIngesta("abcdefghijklmnñopqrstuvwxyzáéíóúü", p_quitar_tildes=False)
+    assert normalizar_token("Canción", con_tildes) == "canción"
+
+def test_sin_repetir_con_memoria_acotada(tmp_path):
+    palabras = ["pera", "uva", "pera", "kiwi", "uva", "mango", "kiwi", "lima"] * 3
+    # Con solo dos palabras en memoria se vuelcan varios tramos a disco
+    assert list(sin_repetir_externo(palabras, str(tmp_path), 2)) == ["kiwi", "lima", "mango", "pera", "uva"]
+    assert list(tmp_path.iterdir()) == [], "Los tramos temporales deben borrarse"
+
+@pytest.mark.parametrize("trabajadores", [1, 2])
+def test_ingesta_de_volcado(tmp_path, trabajadores):
+    origen = tmp_path / "volcado.txt.gz"
+    with gzip.open(origen, "wt", encoding="utf-8") as archivo:
+        for numero in range(3000):
+            archivo.write(f"{numero}: El ÁRBOL del niño tenía una PIÑA, ¿verdad? árbol_{numero} palabra{numero % 7}\n")
+    destino = tmp_path / "salida.corpus"
+    progreso = ingerir(str(origen), str(destino), p_trabajadores=trabajadores, p_bloque=500, p_max_en_memoria=3)
+    assert progreso.lineas == 3000
+    assert progreso.escritas == 8
+
+    diccionario = Diccionario.desde_archivo(str(destino))
+    textos = [diccionario.dar_texto(posicion) for posicion in range(len(diccionario))]
+    assert textos == ["arbol", "del", "niño", "palabra", "piña", "tenia", "una", "verdad"]
+
+    # El corpus se juega directamente
+    juego = JuegoAhorcado(diccionario)
+    juego.iniciar_con_posicion(textos.index("piña"))
+    for simbolo in "PIÑA":
+        juego.jugar_letra(Letra(simbolo))
+    assert juego.dar_estado() == Estado.GANADOR
+
+def test_ingesta_fallida_no_deja_corpus(tmp_path):
+    destino = tmp_path / "salida.corpus"
+    def fallar(p_progreso):
+        raise RuntimeError("interrumpida")
+    origen = tmp_path / "volcado.txt"
+    origen.write_text("casa perro gato\n", encoding="utf-8")
+    with pytest.raises(RuntimeError):
+        ingerir(str(origen), str(destino), p_informe=fallar)
+    assert sorted(nombre.name for nombre in tmp_path.iterdir()) == ["volcado.txt"], \
+        "Una ingesta interrumpida no deja un corpus a medias ni temporales"
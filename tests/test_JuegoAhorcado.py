@@ -1,7 +1,9 @@
+import tracemalloc
 import pytest
 from src.JuegoAhorcado import JuegoAhorcado, Estado
 from src.Letra import Letra
 from src.Palabra import Palabra
+from src.Diccionario import Diccionario
 
 @pytest.fixture
 def juego():
@@ -51,4 +53,66 @@ def test_jugar_letra_en_juego_iniciado(juego):
             f"El número de intentos debe ser {intentos_esperados}"
         if intentos_esperados == 0:
             assert juego.dar_estado() == Estado.AHORCADO, "El estado del juego debe ser AHORCADO"
-        assert not actual.esta_letra(letra_intento), "La letra no está en la palabra"
\ No newline at end of file
+        assert not actual.esta_letra(letra_intento), "La letra no está en la palabra"
+
+def test_letra_utilizada(juego):
+    juego.iniciar_juego()
+    juego.jugar_letra(Letra('e'))
+    juego.jugar_letra(Letra('X'))
+
+    assert juego.letra_utilizada(Letra('E')), "La letra 'e' ya fue utilizada"
+    assert juego.letra_utilizada(Letra('x')), "La letra 'x' ya fue utilizada"
+    assert not juego.letra_utilizada(Letra('q')), "La letra 'q' no ha sido utilizada"
+    assert not juego.jugar_letra(Letra('e')), "No se puede jugar dos veces la misma letra"
+    assert [letra.dar_letra() for letra in juego.dar_jugadas()] == ['e', 'x'], \
+        "Las jugadas deben conservar el orden en que se hicieron"
+
+def test_ocurrencias_incrementales(juego):
+    palabra = Palabra("recorrido")
+    juego.iniciar_con_palabra(palabra)
+    assert juego.dar_ocurrencias() == ["_"] * 9, "Al iniciar no debe haber letras visibles"
+
+    for caracter in "roecid":
+        assert juego.dar_estado() == Estado.JUGANDO, "El juego no debe haber terminado"
+        juego.jugar_letra(Letra(caracter))
+        assert juego.dar_ocurrencias() == palabra.dar_ocurrencias(juego.dar_jugadas()), \
+            "El patrón incremental debe coincidir con el calculado por la palabra"
+
+    assert juego.dar_estado() == Estado.GANADOR, "El estado del juego debe ser GANADOR"
+    assert juego.dar_intentos_disponibles() == JuegoAhorcado.MAX_INTENTOS, \
+        "No se debe haber perdido ningún intento"
+
+def test_ocurrencias_son_una_copia(juego):
+    juego.iniciar_con_palabra(Palabra("ciclo"))
+    juego.dar_ocurrencias()[0] = "c"
+    assert juego.dar_ocurrencias() == ["_"] * 5, "Modificar el patrón entregado no debe cambiar el juego"
+    juego.jugar_letra(Letra("c"))
+    assert juego.dar_ocurrencias() == ["c", "_", "c", "_", "_"]
+
+def test_diccionario_compartido(juego):
+    otro = JuegoAhorcado()
+    assert juego.diccionario is otro.diccionario, "Los juegos deben compartir el diccionario predeterminado"
+    juego.iniciar_juego()
+    posicion = juego.dar_posicion_actual()
+    assert juego.dar_palabra_actual().dar_letras() == juego.dar_palabra(posicion).dar_letras(), \
+        "La palabra actual debe corresponder a la posición guardada"
+
+def _memoria_por_sesion(diccionario, sesiones=2000):
+    tracemalloc.start()
+    antes = tracemalloc.get_traced_memory()[0]
+    juegos = [JuegoAhorcado(diccionario) for _ in range(sesiones)]
+    for juego in juegos:
+        juego.iniciar_juego()
+    despues = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return (despues - antes) / len(juegos)
+
+def test_memoria_por_sesion_constante():
+    pequeno = Diccionario(["palabra"] * 10)
+    grande = Diccionario(["palabra"] * 200000)
+    memoria_pequeno = _memoria_por_sesion(pequeno)
+    memoria_grande = _memoria_por_sesion(grande)
+    # Cada sesión solo guarda su estado, sin importar el tamaño del diccionario
+    assert memoria_grande < 4096, f"Cada sesión ocupa demasiado: {memoria_grande:.0f} bytes"
+    assert abs(memoria_grande - memoria_pequeno) < 256, \
+        "La memoria por sesión no debe depender del tamaño del diccionario"
@@ -0,0 +1,127 @@
+import asyncio
+import random
+import threading
+from src.Diccionario import Diccionario
+from src.JuegoAhorcado import JuegoAhorcado, Estado, vencer_turnos
+from src.JuegoCompartido import JuegoCompartido
+from src.Letra import Letra
+from src.RuedaTemporizadores import RuedaTemporizadores
+
+LETRAS = "abcdefghijklmnñopqrstuvwxyz"
+
+def compartido(p_palabra, p_intentos=JuegoAhorcado.MAX_INTENTOS):
+    juego = JuegoAhorcado(Diccionario([p_palabra]))
+    juego.MAX_INTENTOS = p_intentos
+    partida = JuegoCompartido(juego)
+    partida.iniciar_juego()
+    return partida
+
+def test_letra_repetida_no_cuenta_dos_veces():
+    partida = compartido("gato")
+    primera = partida.jugar("ana", Letra("z"))
+    segunda = partida.jugar("beto", Letra("Z"))
+    assert primera.nueva and not segunda.nueva and not segunda.acierto
+    assert partida.vista.intentos == 5 and partida.fallos == {"ana": 1}
+    assert partida.jugar("beto", Letra("a")).acierto and partida.jugar("ana", Letra("a")).acierto
+    assert partida.puntajes == {"beto": 1} and partida.dar_ocurrencias() == "_a__"
+
+def test_puntos_por_posiciones():
+    partida = compartido("banana")
+    partida.jugar(1, Letra("a"))
+    partida.jugar(2, Letra("n"))
+    partida.jugar(2, Letra("b"))
+    assert partida.puntajes == {1: 3, 2: 3}
+    assert partida.dar_estado() == Estado.GANADOR
+    assert not partida.jugar(3, Letra("x")).nueva, "Con la partida terminada no se juega"
+
+def test_reinicio_una_sola_vez():
+    partida = compartido("oso")
+    version = partida.vista.version
+    partida.iniciar_juego(p_version=version)
+    partida.iniciar_juego(p_version=version)
+    assert partida.vista.version == version + 1
+
+def test_cientos_de_hilos():
+    # Todos los jugadores juegan letras al azar a la vez; al final cada letra se aplicó una sola vez
+    palabra = "murciélagos"
+    partida = compartido(palabra, p_intentos=len(LETRAS) + 1)
+    inicio = threading.Barrier(300)
+    resultados = {}
+    def jugador(p_numero):
+        generador = random.Random(p_numero)
+        propios = []
+        inicio.wait()
+        for _ in range(40):
+            propios.append(partida.jugar(p_numero, Letra(generador.choice(LETRAS))))
+        resultados[p_numero] = propios
+    hilos = [threading.Thread(target=jugador, args=(numero,)) for numero in range(300)]
+    for hilo in hilos:
+        hilo.start()
+    for hilo in hilos:
+        hilo.join()
+
+    vista = partida.vista
+    nuevas = [resultado for propios in resultados.values() for resultado in propios if resultado.nueva]
+    assert len(nuevas) == len(vista.jugadas) == len(set(vista.jugadas)), "Cada letra se aplica una sola vez"
+    assert vista.intentos == len(LETRAS) + 1 - sum(partida.fallos.values())
+    assert sum(partida.puntajes.values()) == sum(caracter != "_" for caracter in vista.ocurrencias)
+    for propios in resultados.values():
+        versiones = [resultado.vista.version for resultado in propios]
+        assert versiones == sorted(versiones), "Un jugador nunca ve la partida retroceder"
+        for resultado in propios:
+            # Cada vista es coherente: muestra exactamente las letras acertadas hasta ese momento
+            aciertos = resultado.vista.mascara_aciertos
+            esperado = "".join(caracter if partida.juego.alfabeto.bit_de(Letra(caracter)) & aciertos else "_"
+                               for caracter in palabra)
+            assert resultado.vista.ocurrencias == esperado
+
+def test_tareas_de_asyncio_y_esperas():
+    partida = compartido("pingüino", p_intentos=len(LETRAS) + 1)
+    async def correr():
+        cambios = []
+        async def observador():
+            vista = partida.vista
+            while vista.estado == Estado.JUGANDO:
+                vista = await partida.esperar_cambio_async(vista.version)
+                cambios.append(vista.version)
+        async def jugador(p_numero):
+            for letra in random.Random(p_numero).sample(LETRAS, len(LETRAS)):
+                partida.jugar(p_numero, Letra(letra))
+                await asyncio.sleep(0)
+        tarea = asyncio.create_task(observador())
+        await asyncio.gather(*(jugador(numero) for numero in range(200)))
+        await asyncio.wait_for(tarea, 5)
+        return cambios
+    cambios = asyncio.run(correr())
+    assert partida.dar_estado() == Estado.GANADOR
+    assert cambios == sorted(cambios) and cambios[-1] == partida.vista.version
+
+def test_espera_entre_hilos():
+    partida = compartido("gato")
+    version = partida.vista.version
+    hilo = threading.Timer(0.05, partida.jugar, args=("ana", Letra("g")))
+    hilo.start()
+    vista = partida.esperar_cambio(version, 5)
+    hilo.join()
+    assert vista.version > version and vista.ocurrencias == "g___"
+
+def test_vencimiento_pasa_por_la_partida_compartida():
+    reloj = [0.0]
+    rueda = RuedaTemporizadores(p_tick=0.5, p_reloj=lambda: reloj[0])
+    partida = JuegoCompartido(JuegoAhorcado(Diccionario(["gato"]), rueda=rueda, limite_jugada=5.0))
+    partida.iniciar_juego()
+    version = partida.vista.version
+    vistas = []
+    espera = threading.Thread(target=lambda: vistas.append(partida.esperar_cambio(version, 5.0)))
+    espera.start()
+    reloj[0] = 6.0
+    assert vencer_turnos(rueda) == [partida], "El vencimiento lo cobra la partida compartida"
+    espera.join()
+    assert vistas[0].version == version + 1 and vistas[0].intentos == JuegoAhorcado.MAX_INTENTOS - 1, \
+        "Quien espera debe ver el fallo por tiempo"
+    # Si alguien juega entre el vencimiento y la toma del candado, el turno renovado no se cobra
+    reloj[0] = 12.0
+    vencidos = rueda.avanzar()
+    partida.jugar("ana", Letra("g"))
+    assert not vencidos[0].dato.vencer_turno()
+    assert partida.vista.intentos == JuegoAhorcado.MAX_INTENTOS - 1
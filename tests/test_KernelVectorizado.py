@@ -0,0 +1,70 @@
+import random
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from src.Diccionario import Diccionario
+from src.JuegoAhorcado import JuegoAhorcado, Estado
+from src.KernelVectorizado import LoteJuegos
+from src.Letra import Letra
+from src.Palabra import Palabra
+
+LETRAS = "abcdefghijklmnñopqrstuvwxyz"
+
+def _comparar(lote, juegos):
+    for partida, juego in enumerate(juegos):
+        assert lote.dar_estado(partida) == juego.dar_estado(), "El estado no coincide"
+        assert lote.dar_intentos_disponibles(partida) == juego.dar_intentos_disponibles(), \
+            "Los intentos no coinciden"
+        assert lote.dar_ocurrencias(partida) == juego.dar_ocurrencias(), "El patrón no coincide"
+
+def test_paridad_misma_letra():
+    diccionario = Diccionario.predeterminado()
+    posiciones = list(range(len(diccionario)))
+    lote = LoteJuegos.desde_diccionario(diccionario, posiciones)
+    juegos = []
+    for posicion in posiciones:
+        juego = JuegoAhorcado(diccionario)
+        juego.iniciar_con_posicion(posicion)
+        juegos.append(juego)
+
+    for caracter in "eaosrnidlctumpbgvyq":
+        resultados = lote.jugar(caracter)
+        esperados = [juego.jugar_letra(Letra(caracter)) for juego in juegos]
+        assert resultados.tolist() == esperados, f"El resultado de jugar '{caracter}' no coincide"
+        _comparar(lote, juegos)
+
+def test_paridad_letras_aleatorias():
+    generador = random.Random(11)
+    # Con tildes, diéresis y caracteres que no son del alfabeto, que se ven desde el principio
+    palabras = ["".join(generador.choice("abcdeñáéóüÁ-'") for _ in range(generador.randint(1, 9))) for _ in range(300)]
+    lote = LoteJuegos(palabras)
+    juegos = []
+    for palabra in palabras:
+        juego = JuegoAhorcado()
+        juego.iniciar_con_palabra(Palabra(palabra))
+        juegos.append(juego)
+
+    for _ in range(15):
+        # Cada partida recibe su propia letra, con repetidas y mayúsculas incluidas
+        letras = [generador.choice(LETRAS + "ABCáé1") for _ in palabras]
+        resultados = lote.jugar(letras)
+        esperados = [juego.jugar_letra(Letra(letra)) for juego, letra in zip(juegos, letras)]
+        assert resultados.tolist() == esperados, "Los resultados por partida no coinciden"
+        _comparar(lote, juegos)
+
+def test_posiciones_reveladas():
+    lote = LoteJuegos(["ciclo", "ola"])
+    lote.jugar("c")
+    lote.jugar(["o", "a"])
+    assert lote.dar_reveladas().tolist() == [[True, False, True, False, True], [False, False, True, False, False]]
+
+def test_tildes_como_en_el_juego():
+    juego = JuegoAhorcado(Diccionario(["canción"]))
+    juego.iniciar_con_posicion(0)
+    lote = LoteJuegos(["canción"])
+    for caracter in "caino":
+        assert lote.jugar(caracter).tolist() == [juego.jugar_letra(Letra(caracter))], f"'{caracter}' no coincide"
+    assert juego.dar_estado() == Estado.GANADOR
+    _comparar(lote, [juego])
+    assert lote.dar_ocurrencias(0) == list("canción"), "La ó se muestra con su tilde"
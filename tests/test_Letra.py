@@ -50,3 +50,12 @@ def test_es_igual5(letra_p):
 def test_es_igual6(letra_p):
     assert not letra_p.es_igual(Letra('x')), "Las letras no deben ser iguales"
     assert not letra_p.es_igual(Letra('X')), "Las letras no deben ser iguales"
+
+# Test 7: Las letras se comparten y se pueden usar en conjuntos y diccionarios
+def test_letras_compartidas(letra_p):
+    assert Letra('p') is letra_p, "Debe existir una única instancia por símbolo"
+    assert letra_p == Letra('P') and hash(letra_p) == hash(Letra('p')), \
+        "La igualdad y el hash deben ser coherentes con es_igual"
+    assert len({Letra('a'), Letra('A'), Letra('b')}) == 2, "El conjunto debe tener dos letras"
+    with pytest.raises(AttributeError):
+        letra_p.letra = 'x'
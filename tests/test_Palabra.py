@@ -29,4 +29,20 @@ def test_palabra(escenario_palabra):
     # Probar si la palabra está completa con las jugadas realizadas
     assert palabra.esta_completa(jugadas), "La palabra ya está completa"
 
-    
\ No newline at end of file
+def test_mascaras_palabra():
+    palabra = Palabra("Arreglo")
+
+    # Las consultas no distinguen mayúsculas de minúsculas
+    assert palabra.esta_letra(Letra('a')), "La letra 'a' sí está en la palabra"
+    assert palabra.esta_letra(Letra('R')), "La letra 'R' sí está en la palabra"
+    assert not palabra.esta_letra(Letra('z')), "La letra 'z' no está en la palabra"
+
+    # La 'r' aparece en las posiciones 1 y 2
+    assert palabra.dar_posiciones(Letra('r')) == 0b110, "Las posiciones de la 'r' son incorrectas"
+
+    jugadas = [Letra('r'), Letra('o')]
+    assert palabra.dar_ocurrencias(jugadas) == ['_', 'r', 'r', '_', '_', '_', 'o']
+    assert not palabra.esta_completa(jugadas), "La palabra aún no está completa"
+
+    jugadas += [Letra('A'), Letra('e'), Letra('g'), Letra('l')]
+    assert palabra.esta_completa(jugadas), "La palabra ya está completa"
@@ -0,0 +1,27 @@
+from src.Letra import Letra
+from src.Plegado import LETRAS_PRIORITARIAS, PLEGADO_MAYUSCULAS, PLEGADO_TILDES, TablaPlegado, quitar_tildes
+
+def test_plegado_de_mayusculas():
+    assert PLEGADO_MAYUSCULAS.son_iguales("A", "a")
+    assert PLEGADO_MAYUSCULAS.son_iguales("Ñ", "ñ")
+    assert PLEGADO_MAYUSCULAS.son_iguales("Ω", "ω"), "Las letras fuera del latín también se pliegan"
+    assert not PLEGADO_MAYUSCULAS.son_iguales("á", "a"), "Sin plegar tildes, á y a son distintas"
+    assert PLEGADO_MAYUSCULAS.dar_simbolo(PLEGADO_MAYUSCULAS.dar_id("É")) == "é"
+
+def test_plegado_de_tildes():
+    assert PLEGADO_TILDES.son_iguales("Á", "a")
+    assert PLEGADO_TILDES.son_iguales("ü", "U")
+    assert not PLEGADO_TILDES.son_iguales("ñ", "n"), "La ñ es una letra distinta de la n"
+    assert quitar_tildes("pingüino cañón") == "pinguino cañon"
+
+def test_identificadores_densos():
+    tabla = TablaPlegado()
+    # Las letras del español ocupan los primeros identificadores, en orden
+    assert [tabla.dar_id(simbolo) for simbolo in LETRAS_PRIORITARIAS] == list(range(len(LETRAS_PRIORITARIAS)))
+    # Un carácter que no es letra recibe un identificador nuevo la primera vez y lo conserva
+    assert tabla.dar_id("7") == tabla.dar_id("7") >= len(LETRAS_PRIORITARIAS)
+
+def test_letras_usan_el_plegado():
+    assert Letra("Ñ") is Letra("ñ")
+    assert Letra("a").indice == PLEGADO_MAYUSCULAS.dar_id("A")
+    assert Letra("Z").bit < 1 << 64, "Las letras del español deben caber en una palabra de máquina"
@@ -0,0 +1,139 @@
+import random
+import sys
+import threading
+import pytest
+from src.Bitacora import Bitacora, repetir
+from src.Diccionario import Diccionario
+from src.JuegoAhorcado import JuegoAhorcado, Estado, vencer_turnos
+from src.Letra import Letra
+from src.RuedaTemporizadores import RuedaTemporizadores
+
+class RelojFalso:
+    def __init__(self):
+        self.ahora = 1000.0
+    def __call__(self):
+        return self.ahora
+
+def test_vence_en_su_tick():
+    reloj = RelojFalso()
+    rueda = RuedaTemporizadores(0.5, reloj)
+    temporizador = rueda.programar(2.0, "a")
+    reloj.ahora += 1.9
+    assert rueda.avanzar() == [] and temporizador.esta_activo()
+    reloj.ahora += 0.1
+    assert rueda.avanzar() == [temporizador] and not temporizador.esta_activo()
+    assert len(rueda) == 0
+
+def test_cancelar_y_reprogramar():
+    reloj = RelojFalso()
+    rueda = RuedaTemporizadores(1.0, reloj)
+    primero = rueda.programar(5)
+    segundo = rueda.programar(5)
+    assert rueda.cancelar(primero) and not rueda.cancelar(primero)
+    assert rueda.reprogramar(segundo, 10) is segundo and len(rueda) == 1
+    reloj.ahora += 9
+    assert rueda.avanzar() == []
+    reloj.ahora += 1
+    assert rueda.avanzar() == [segundo]
+
+def test_coincide_con_una_referencia():
+    # Vencimientos de todos los niveles, cancelaciones y saltos de reloj contra una lista ordenada simple
+    generador = random.Random(8)
+    reloj = RelojFalso()
+    rueda = RuedaTemporizadores(1.0, reloj)
+    pendientes = {}
+    for _ in range(600):
+        for _ in range(generador.randint(0, 4)):
+            espera = generador.choice([generador.randint(0, 300), generador.randint(0, 70000),
+                                       generador.randint(0, 20000000)])
+            temporizador = rueda.programar(espera)
+            pendientes[temporizador] = temporizador.vencimiento
+        if pendientes and generador.random() < 0.3:
+            temporizador = generador.choice(list(pendientes))
+            rueda.cancelar(temporizador)
+            del pendientes[temporizador]
+        reloj.ahora += generador.choice([1, 3, 255, 256, 1000, 65536])
+        vencidos = rueda.avanzar()
+        esperados = sorted((vencimiento, id(t)) for t, vencimiento in pendientes.items() if vencimiento <= rueda.actual)
+        assert sorted((t.vencimiento, id(t)) for t in vencidos) == esperados
+        assert [t.vencimiento for t in vencidos] == sorted(t.vencimiento for t in vencidos), "En orden de vencimiento"
+        for temporizador in vencidos:
+            del pendientes[temporizador]
+    assert len(rueda) == len(pendientes)
+
+def test_cien_mil_vencimientos_en_lote():
+    reloj = RelojFalso()
+    rueda = RuedaTemporizadores(0.01, reloj)
+    temporizadores = [rueda.programar(1 + numero % 500 / 100) for numero in range(100000)]
+    for temporizador in temporizadores[::-2]:
+        rueda.cancelar(temporizador)
+    reloj.ahora += 6
+    assert len(rueda.avanzar()) == 50000 and len(rueda) == 0
+
+def test_cancelar_desde_otro_hilo_mientras_avanza():
+    # Un hilo cancela y reprograma vencimientos de la ranura que el otro está recorriendo
+    reloj = RelojFalso()
+    rueda = RuedaTemporizadores(1.0, reloj)
+    temporizadores = [rueda.programar(1) for _ in range(200000)]
+    inicio = threading.Barrier(2)
+    errores = []
+    def cancelar():
+        inicio.wait()
+        try:
+            for temporizador in temporizadores[::-2]:
+                rueda.reprogramar(temporizador, 5)
+                rueda.cancelar(temporizador)
+        except Exception as error:
+            errores.append(error)
+    hilo = threading.Thread(target=cancelar)
+    intervalo = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        hilo.start()
+        inicio.wait()
+        vencidos = []
+        for _ in range(3):
+            reloj.ahora += 1
+            vencidos.extend(rueda.avanzar())
+        hilo.join()
+    finally:
+        sys.setswitchinterval(intervalo)
+    assert errores == [], "Cancelar desde otro hilo no debe fallar"
+    assert len(set(vencidos)) == len(vencidos) and not any(t.esta_activo() for t in vencidos)
+    assert set(temporizadores[-2::-2]) <= set(vencidos), "Los que nadie tocó vencen"
+    assert len(rueda) == 0
+
+def test_turno_vencido_es_un_fallo(tmp_path):
+    reloj = RelojFalso()
+    rueda = RuedaTemporizadores(0.1, reloj)
+    bitacora = Bitacora(str(tmp_path / "bitacora.bin"), p_sincronizar=False)
+    juego = JuegoAhorcado(Diccionario(["gato"]), rueda=rueda, limite_jugada=10, bitacora=bitacora, sesion=1)
+    juego.iniciar_juego()
+    reloj.ahora += 9
+    juego.jugar_letra(Letra("g"))
+    reloj.ahora += 9
+    assert vencer_turnos(rueda) == [], "Cada jugada reinicia el tiempo del turno"
+    reloj.ahora += 1
+    assert vencer_turnos(rueda) == [juego] and juego.dar_intentos_disponibles() == 5
+    for _ in range(5):
+        # El turno siguiente empieza cuando se cobra el vencido
+        reloj.ahora += 10
+        vencer_turnos(rueda)
+    assert juego.dar_estado() == Estado.AHORCADO and juego.dar_intentos_disponibles() == 0
+    assert len(rueda) == 0, "Un juego terminado no tiene turno pendiente"
+    bitacora.cerrar()
+    estado = repetir(bitacora.ruta)
+    assert int(estado.intentos[0]) == 0 and int(estado.estados[0]) == Estado.AHORCADO.value
+
+def test_ganar_cancela_el_turno():
+    reloj = RelojFalso()
+    rueda = RuedaTemporizadores(0.1, reloj)
+    juego = JuegoAhorcado(Diccionario(["oso"]), rueda=rueda, limite_jugada=5)
+    juego.iniciar_juego()
+    juego.jugar_letra(Letra("o"))
+    juego.jugar_letra(Letra("s"))
+    assert juego.dar_estado() == Estado.GANADOR and len(rueda) == 0
+
+def test_limite_sin_rueda():
+    with pytest.raises(ValueError):
+        JuegoAhorcado(limite_jugada=5)
@@ -0,0 +1,35 @@
+import pytest
+from src.Selector import SelectorSinRepeticion
+from src.JuegoAhorcado import JuegoAhorcado
+
+@pytest.mark.parametrize("total", [1, 2, 7, 12, 1000, 4097])
+def test_permutacion_sin_repeticiones(total):
+    selector = SelectorSinRepeticion(total, 42)
+    posiciones = [selector.siguiente() for _ in range(total)]
+    assert sorted(posiciones) == list(range(total)), "Cada posición debe salir exactamente una vez"
+
+def test_orden_reproducible():
+    uno = SelectorSinRepeticion(500, 7)
+    otro = SelectorSinRepeticion(500, 7)
+    distinto = SelectorSinRepeticion(500, 8)
+    orden = [uno.siguiente() for _ in range(500)]
+    assert orden == [otro.siguiente() for _ in range(500)], "La misma semilla debe dar el mismo orden"
+    assert orden != [distinto.siguiente() for _ in range(500)], "Semillas distintas deben dar órdenes distintos"
+
+def test_nueva_vuelta_y_retomar():
+    selector = SelectorSinRepeticion(50, 3)
+    primera = [selector.siguiente() for _ in range(50)]
+    segunda = [selector.siguiente() for _ in range(50)]
+    assert sorted(segunda) == list(range(50)), "La segunda vuelta también debe cubrir todo el diccionario"
+    assert primera != segunda, "Cada vuelta debe tener un orden distinto"
+    # Con la semilla y el contador basta para retomar el orden en otro proceso
+    retomado = SelectorSinRepeticion(50, 3, 60)
+    assert retomado.siguiente() == segunda[10], "El selector retomado debe continuar el mismo orden"
+
+def test_selector_en_juego():
+    juego = JuegoAhorcado(selector=SelectorSinRepeticion(JuegoAhorcado.TOTAL_PALABRAS, 1))
+    vistas = set()
+    for _ in range(juego.TOTAL_PALABRAS):
+        juego.iniciar_juego()
+        vistas.add(juego.dar_posicion_actual())
+    assert len(vistas) == juego.TOTAL_PALABRAS, "No se debe repetir ninguna palabra"
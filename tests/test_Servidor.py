@@ -0,0 +1,179 @@
+import asyncio
+import json
+import pytest
+from src.Diccionario import Diccionario
+from src.Servidor import ClienteAhorcado, ServidorAhorcado
+
+def _con_servidor(p_prueba, p_palabras=("gato",)):
+    # Levanta el servidor en un puerto libre, corre la prueba con un cliente y lo apaga
+    async def correr():
+        servidor = ServidorAhorcado()
+        servidor.diccionario = Diccionario(list(p_palabras))
+        escucha = await servidor.escuchar("127.0.0.1", 0)
+        cliente = await ClienteAhorcado.conectar("127.0.0.1", escucha.sockets[0].getsockname()[1])
+        try:
+            return await p_prueba(servidor, cliente)
+        finally:
+            await cliente.cerrar()
+            escucha.close()
+            await escucha.wait_closed()
+            servidor.cerrar()
+    return asyncio.run(correr())
+
+def test_partida_completa():
+    async def prueba(servidor, cliente):
+        inicio = await cliente.enviar(cmd="start")
+        assert inicio["ok"] and inicio["ocurrencias"] == "____" and inicio["intentos"] == 6
+        sesion = inicio["sesion"]
+        fallo = await cliente.enviar(cmd="guess", sesion=sesion, letra="z")
+        assert not fallo["acierto"] and fallo["intentos"] == 5
+        respuestas = await cliente.enviar_lote([{"cmd": "guess", "sesion": sesion, "letra": letra} for letra in "GATO"])
+        assert all(respuesta["acierto"] for respuesta in respuestas)
+        assert respuestas[-1]["estado"] == "GANADOR"
+        estado = await cliente.enviar(cmd="state", sesion=sesion)
+        assert estado["jugadas"] == "zgato"
+        revelada = await cliente.enviar(cmd="reveal", sesion=sesion)
+        assert revelada["palabra"] == "gato", "Al terminar la partida se muestra la palabra"
+    _con_servidor(prueba)
+
+def test_no_revela_en_juego():
+    async def prueba(servidor, cliente):
+        sesion = (await cliente.enviar(cmd="start"))["sesion"]
+        await cliente.enviar(cmd="guess", sesion=sesion, letra="a")
+        revelada = await cliente.enviar(cmd="reveal", sesion=sesion)
+        assert revelada == {"ok": True, "ocurrencias": "_a__"}
+    _con_servidor(prueba)
+
+def test_errores_no_cierran_la_conexion():
+    async def prueba(servidor, cliente):
+        sesion = (await cliente.enviar(cmd="start"))["sesion"]
+        cliente.escritor.write(b"esto no es json\n")
+        assert not json.loads(await cliente.lector.readline())["ok"]
+        respuestas = await cliente.enviar_lote([
+            {"cmd": "volar"},
+            {"cmd": "guess", "sesion": 999, "letra": "a"},
+            {"cmd": "guess", "sesion": sesion, "letra": "ab"},
+            {"cmd": "guess", "sesion": sesion, "letra": "7"},
+            {"cmd": "guess", "sesion": sesion, "letra": "g", "id": "x"},
+            {"cmd": "guess", "sesion": sesion, "letra": "G"},
+        ])
+        assert [respuesta["ok"] for respuesta in respuestas] == [False, False, False, False, True, False]
+        assert respuestas[4]["id"] == "x", "La respuesta debe repetir el id del mensaje"
+        assert (await cliente.enviar(cmd="state", sesion=sesion))["intentos"] == 6
+    _con_servidor(prueba)
+
+def test_muchas_sesiones_y_cierre():
+    async def prueba(servidor, cliente):
+        respuestas = await cliente.enviar_lote([{"cmd": "start"}] * 2000)
+        sesiones = {respuesta["sesion"] for respuesta in respuestas}
+        assert len(sesiones) == 2000 and len(servidor.sesiones) == 2000
+        await cliente.enviar_lote([{"cmd": "close", "sesion": sesion} for sesion in sesiones])
+        assert not len(servidor.sesiones)
+    _con_servidor(prueba, ("gato", "perro", "casa"))
+
+def test_sesiones_desalojadas_siguen_jugando():
+    async def prueba(servidor, cliente):
+        servidor.sesiones.max_en_memoria = 10
+        respuestas = await cliente.enviar_lote([{"cmd": "start"}] * 50)
+        sesiones = [respuesta["sesion"] for respuesta in respuestas]
+        await cliente.enviar_lote([{"cmd": "guess", "sesion": sesion, "letra": "a"} for sesion in sesiones])
+        assert servidor.sesiones.en_memoria() == 10 and servidor.sesiones.desalojadas > 0
+        estados = await cliente.enviar_lote([{"cmd": "state", "sesion": sesion} for sesion in sesiones])
+        assert all(estado["ocurrencias"] == "_a__" and estado["jugadas"] == "a" for estado in estados)
+    _con_servidor(prueba)
+
+def test_sesion_debe_ser_entero():
+    async def prueba(servidor, cliente):
+        sesion = (await cliente.enviar(cmd="start"))["sesion"]
+        respuestas = await cliente.enviar_lote([{"cmd": comando, "sesion": valor, "letra": "a"}
+                                                for comando in ("guess", "state", "close")
+                                                for valor in (True, 1.0, [1], {"a": 1}, "1", None, 0, -1)])
+        assert not any(respuesta["ok"] for respuesta in respuestas), "Solo un entero identifica una sesión"
+        assert all(respuesta["error"].startswith("Sesión desconocida") for respuesta in respuestas)
+        estado = await cliente.enviar(cmd="state", sesion=sesion)
+        assert estado["ok"] and estado["jugadas"] == "", "Ninguna jugada debe llegar a la sesión 1"
+    _con_servidor(prueba)
+
+def test_tareas_periodicas_se_cancelan():
+    async def correr():
+        servidor = ServidorAhorcado(p_limite_jugada=1)
+        servidor.diccionario = Diccionario(["gato"])
+        escuchas = [await servidor.escuchar("127.0.0.1", 0) for _ in range(2)]
+        tareas = list(servidor._tareas)
+        assert len(tareas) == 2, "Una segunda escucha no debe duplicar las tareas periódicas"
+        for escucha in escuchas:
+            escucha.close()
+            await escucha.wait_closed()
+        servidor.cerrar()
+        await asyncio.sleep(0)
+        return tareas
+    assert all(tarea.cancelled() for tarea in asyncio.run(correr()))
+
+def test_carga_sin_bloquear(tmp_path):
+    ruta = tmp_path / "palabras.txt"
+    ruta.write_text("gato\nperro\n", encoding="utf-8")
+    async def correr():
+        servidor = ServidorAhorcado(str(ruta))
+        escucha = await servidor.escuchar("127.0.0.1", 0)
+        escucha.close()
+        await escucha.wait_closed()
+        servidor.cerrar()
+        return len(servidor.diccionario)
+    assert asyncio.run(correr()) == 2
+
+def test_recupera_sesiones_de_la_bitacora(tmp_path):
+    ruta = str(tmp_path / "bitacora.bin")
+    async def jugar(p_mensajes):
+        servidor = ServidorAhorcado(p_semilla=11, p_ruta_bitacora=ruta, p_sincronizar=False)
+        escucha = await servidor.escuchar("127.0.0.1", 0)
+        cliente = await ClienteAhorcado.conectar("127.0.0.1", escucha.sockets[0].getsockname()[1])
+        try:
+            return await cliente.enviar_lote(p_mensajes)
+        finally:
+            await cliente.cerrar()
+            escucha.close()
+            await escucha.wait_closed()
+            servidor.cerrar()
+    inicios = asyncio.run(jugar([{"cmd": "start"}] * 3))
+    antes = asyncio.run(jugar([{"cmd": "guess", "sesion": 2, "letra": "a"}, {"cmd": "close", "sesion": 3},
+                               {"cmd": "state", "sesion": 1}, {"cmd": "state", "sesion": 2}]))
+    despues = asyncio.run(jugar([{"cmd": "state", "sesion": 1}, {"cmd": "state", "sesion": 2},
+                                 {"cmd": "state", "sesion": 3}, {"cmd": "start"}]))
+    assert [inicio["sesion"] for inicio in inicios] == [1, 2, 3]
+    assert despues[:2] == antes[2:], "Las sesiones recuperadas deben seguir igual"
+    assert not despues[2]["ok"], "Una sesión cerrada no se recupera"
+    assert despues[3]["sesion"] == 4, "Las sesiones nuevas siguen después de las recuperadas"
+
+def test_semilla_guardada_en_la_bitacora(tmp_path):
+    ruta = str(tmp_path / "bitacora.bin")
+    def arrancar(p_semilla=None):
+        servidor = ServidorAhorcado(p_semilla=p_semilla, p_ruta_bitacora=ruta, p_sincronizar=False)
+        try:
+            asyncio.run(servidor.cargar())
+            return servidor.semilla
+        finally:
+            servidor.cerrar()
+    semilla = arrancar()
+    # Sin --semilla, el servidor reiniciado sigue con la de la bitácora
+    assert arrancar() == semilla, "La semilla maestra debe recuperarse de la bitácora"
+    assert arrancar(semilla) == semilla
+    with pytest.raises(ValueError):
+        arrancar(semilla + 1)
+
+def test_limite_por_jugada():
+    async def correr():
+        servidor = ServidorAhorcado(p_limite_jugada=0.2)
+        servidor.diccionario = Diccionario(["gato"])
+        escucha = await servidor.escuchar("127.0.0.1", 0)
+        cliente = await ClienteAhorcado.conectar("127.0.0.1", escucha.sockets[0].getsockname()[1])
+        try:
+            sesion = (await cliente.enviar(cmd="start"))["sesion"]
+            await asyncio.sleep(0.5)
+            return await cliente.enviar(cmd="state", sesion=sesion)
+        finally:
+            await cliente.cerrar()
+            escucha.close()
+            await escucha.wait_closed()
+            servidor.cerrar()
+    estado = asyncio.run(correr())
+    assert estado["intentos"] < 6, "Los turnos vencidos cuentan como fallos"
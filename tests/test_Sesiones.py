@@ -0,0 +1,91 @@
+import os
+from src.Diccionario import Diccionario
+from src.JuegoAhorcado import JuegoAhorcado, Estado
+from src.Letra import Letra
+from src.Sesiones import AlmacenSesiones, INSTANTANEA, restaurar_instantanea, tomar_instantanea
+
+DICCIONARIO = Diccionario(["pera", "canción", "kiwi", "mango"])
+
+class Reloj:
+    def __init__(self):
+        self.ahora = 0.0
+    def __call__(self):
+        return self.ahora
+
+def fabrica(p_sesion):
+    return JuegoAhorcado(DICCIONARIO, semilla=p_sesion)
+
+def test_instantanea_de_16_bytes():
+    juego = fabrica(1)
+    juego.iniciar_con_posicion(1)
+    for letra in "zaoy":
+        juego.jugar_letra(Letra(letra))
+    datos = tomar_instantanea(juego)
+    assert len(datos) == INSTANTANEA.size == 16
+    copia = fabrica(1)
+    restaurar_instantanea(copia, datos)
+    assert copia.dar_ocurrencias() == juego.dar_ocurrencias() == list("_a___ó_")
+    assert copia.dar_intentos_disponibles() == 4 and copia.dar_estado() == Estado.JUGANDO
+    assert copia.mascara_jugadas == juego.mascara_jugadas
+    assert copia.jugar_letra(Letra("c")) and not copia.jugar_letra(Letra("a")), "La restaurada debe seguir jugando"
+
+def test_instantanea_de_partida_terminada():
+    juego = fabrica(2)
+    juego.iniciar_con_posicion(2)
+    for letra in "kiw":
+        juego.jugar_letra(Letra(letra))
+    copia = fabrica(2)
+    restaurar_instantanea(copia, tomar_instantanea(juego))
+    assert copia.dar_estado() == Estado.GANADOR and copia.dar_ocurrencias() == list("kiwi")
+
+def test_desalojo_lru():
+    almacen = AlmacenSesiones(fabrica, p_max_en_memoria=3)
+    sesiones = []
+    for _ in range(3):
+        sesion, juego = almacen.crear()
+        juego.iniciar_juego()
+        sesiones.append(sesion)
+    almacen.obtener(sesiones[0])
+    nueva, _ = almacen.crear()
+    assert sesiones[1] not in almacen.memoria, "Se debe desalojar la sesión usada hace más tiempo"
+    assert sesiones[0] in almacen.memoria and nueva in almacen.memoria
+    assert len(almacen) == 4 and almacen.en_memoria() == 3
+    almacen.cerrar()
+    assert not os.path.exists(almacen.ruta)
+
+def test_restauracion_transparente(tmp_path):
+    almacen = AlmacenSesiones(fabrica, p_max_en_memoria=1, p_ruta=str(tmp_path / "derrame"))
+    primera, juego = almacen.crear()
+    juego.iniciar_juego()
+    juego.jugar_letra(Letra("z"))
+    patron, posicion, partidas = list(juego.dar_ocurrencias()), juego.dar_posicion_actual(), juego.partidas
+    almacen.crear()
+    assert primera not in almacen.memoria
+    restaurado = almacen.obtener(primera)
+    assert restaurado is not juego and almacen.restauradas == 1
+    assert restaurado.dar_ocurrencias() == patron and restaurado.dar_posicion_actual() == posicion
+    assert restaurado.dar_intentos_disponibles() == 5 and restaurado.partidas == partidas
+    almacen.cerrar()
+
+def test_expiracion_por_inactividad():
+    reloj = Reloj()
+    almacen = AlmacenSesiones(fabrica, p_max_inactividad=10, p_reloj=reloj)
+    viejas = [almacen.crear()[0] for _ in range(5)]
+    reloj.ahora = 8
+    nuevas = [almacen.crear()[0] for _ in range(5)]
+    almacen.obtener(viejas[0])
+    reloj.ahora = 15
+    assert almacen.expirar() == 4
+    assert set(almacen.memoria) == {viejas[0], *nuevas}
+    assert all(almacen.obtener(sesion) is not None for sesion in viejas), "Las expiradas se restauran al pedirlas"
+    almacen.cerrar()
+
+def test_eliminar_y_sesiones_desconocidas():
+    almacen = AlmacenSesiones(fabrica, p_max_en_memoria=1)
+    primera, _ = almacen.crear()
+    segunda, _ = almacen.crear()
+    assert almacen.eliminar(primera) and almacen.eliminar(segunda)
+    assert not almacen.eliminar(primera) and len(almacen) == 0
+    assert almacen.obtener(primera) is None
+    assert almacen.obtener(10 ** 30) is None and almacen.obtener("1") is None and almacen.obtener(0) is None
+    almacen.cerrar()
@@ -0,0 +1,37 @@
+import pytest
+from src.Alfabeto import Alfabeto
+from src.Diccionario import Diccionario
+from src.Simulacion import ESTRATEGIAS, EstrategiaFrecuencia, jugar_partida, simular
+from src.JuegoAhorcado import JuegoAhorcado, Estado
+from src.Letra import Letra
+
+@pytest.mark.parametrize("nombre", sorted(ESTRATEGIAS))
+def test_simulacion_completa(nombre):
+    resultado = simular(ESTRATEGIAS[nombre](1), 300, semilla=4)
+    assert resultado.partidas == 300, "Deben jugarse todas las partidas"
+    assert sum(resultado.jugadas.values()) == 300, "Cada partida debe aparecer en el histograma"
+    assert 0 <= resultado.ganadas <= 300, "Las partidas ganadas deben estar en rango"
+    assert max(resultado.fallos) <= JuegoAhorcado.MAX_INTENTOS, "No se puede fallar más del máximo"
+
+def test_simulacion_reproducible():
+    uno = simular(EstrategiaFrecuencia(), 200, semilla=8)
+    otro = simular(EstrategiaFrecuencia(), 200, semilla=8)
+    assert uno.jugadas == otro.jugadas and uno.ganadas == otro.ganadas, \
+        "Con la misma semilla la simulación debe dar el mismo resultado"
+
+@pytest.mark.parametrize("nombre", sorted(ESTRATEGIAS))
+def test_estrategias_con_otro_alfabeto(nombre):
+    ruso = Alfabeto("ruso", "абвгдеёжзийклмнопрстуфхцчшщъыьэюя")
+    diccionario = Diccionario(["привет", "слово", "игра"])
+    resultado = simular(ESTRATEGIAS[nombre](2, diccionario), 30, diccionario, semilla=3, alfabeto=ruso)
+    assert resultado.partidas == 30, "Las estrategias deben jugar letras del alfabeto del juego"
+
+def test_estrategia_con_letra_invalida():
+    class Terca:
+        def elegir_letra(self, juego):
+            return Letra("e")
+    juego = JuegoAhorcado(Diccionario(["perro"]))
+    juego.iniciar_con_posicion(0)
+    with pytest.raises(ValueError):
+        jugar_partida(juego, Terca())
+    assert juego.dar_estado() == Estado.JUGANDO
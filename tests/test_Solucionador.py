@@ -0,0 +1,58 @@
+import random
+import pytest
+
+pytest.importorskip("numpy")
+
+from src.Diccionario import Diccionario
+from src.JuegoAhorcado import JuegoAhorcado, Estado
+from src.Simulacion import EstrategiaEntropia, EstrategiaFrecuencia, simular
+from src.Solucionador import Solucionador
+
+@pytest.fixture
+def diccionario():
+    generador = random.Random(3)
+    return Diccionario(["".join(generador.choice("abcdefghilmnoprstu") for _ in range(generador.randint(4, 8)))
+                        for _ in range(2000)])
+
+def test_letra_mas_informativa():
+    solucionador = Solucionador(Diccionario(["casa", "cama", "capa", "cara"]))
+    # La 'c' y la 'a' están en todas las palabras: no aportan información y no se escogen
+    assert solucionador.mejor_letra(list("____"), []) in "smpr", "Debe escoger una letra que separe las candidatas"
+    # Con una sola candidata se juega una de sus letras ocultas
+    assert solucionador.mejor_letra(list("ca_a"), "capmr") == "s"
+
+def test_ultimo_intento_prefiere_acertar():
+    solucionador = Solucionador(Diccionario(["sol", "sal", "sur", "mar"]))
+    # La 's' está en tres de las cuatro palabras
+    assert solucionador.mejor_letra(list("___"), [], True) == "s"
+
+def test_tildes_plegadas():
+    diccionario = Diccionario(["lingüística", "lingüistica", "canción"])
+    solucionador = Solucionador(diccionario)
+    juego = JuegoAhorcado(diccionario)
+    for posicion in range(len(diccionario)):
+        juego.iniciar_con_posicion(posicion)
+        jugadas = 0
+        while juego.dar_estado() == Estado.JUGANDO:
+            letra = solucionador.sugerir(juego)
+            assert not juego.letra_utilizada(letra), f"Sugirió '{letra.dar_letra()}', que ya se jugó"
+            juego.jugar_letra(letra)
+            jugadas += 1
+            assert jugadas <= len(juego.alfabeto), "La partida debe terminar"
+        assert juego.dar_estado() == Estado.GANADOR
+    # Jugada la 'i', la 'í' no es una letra nueva
+    assert solucionador.mejor_letra(list("_i___i___i_"), "i") not in "ií"
+
+def test_solucionador_termina_partidas(diccionario):
+    solucionador = Solucionador(diccionario)
+    juego = JuegoAhorcado(diccionario)
+    for posicion in range(0, len(diccionario), 37):
+        juego.iniciar_con_posicion(posicion)
+        while juego.dar_estado() == Estado.JUGANDO:
+            juego.jugar_letra(solucionador.sugerir(juego))
+        assert juego.dar_palabra_actual().esta_completa(juego.dar_jugadas()) == (juego.dar_estado() == Estado.GANADOR)
+
+def test_entropia_supera_frecuencia(diccionario):
+    entropia = simular(EstrategiaEntropia(0, diccionario), 300, diccionario, semilla=1)
+    frecuencia = simular(EstrategiaFrecuencia(0, diccionario), 300, diccionario, semilla=1)
+    assert entropia.tasa_victorias() > frecuencia.tasa_victorias(), "El solucionador debe ganar más partidas"
@@ -0,0 +1,33 @@
+import random
+import pytest
+from src import Torneo
+from src.Simulacion import ResultadoSimulacion
+
+@pytest.fixture
+def lista(tmp_path):
+    generador = random.Random(2)
+    ruta = tmp_path / "palabras.txt"
+    palabras = ["".join(generador.choice("abcdeilmnorst") for _ in range(generador.randint(3, 9))) for _ in range(60)]
+    ruta.write_text("\n".join(palabras), encoding="utf-8")
+    return str(ruta)
+
+def test_torneo_paralelo(lista):
+    resultados = Torneo.jugar_torneo(["frecuencia", "aleatoria"], lista, p_trabajadores=2, p_bloque=7, p_semilla=3)
+
+    # El mismo torneo jugado en este proceso, bloque por bloque, debe dar lo mismo
+    Torneo._iniciar_trabajador(lista)
+    total = len(Torneo._diccionario_trabajador)
+    esperados = {"frecuencia": ResultadoSimulacion(), "aleatoria": ResultadoSimulacion()}
+    for tarea in Torneo.dividir_tareas(["frecuencia", "aleatoria"], total, 7, 3):
+        nombre, parcial = Torneo._jugar_bloque(tarea)
+        esperados[nombre].combinar(parcial)
+
+    for nombre, resultado in resultados.items():
+        assert resultado.partidas == total, "Cada estrategia debe jugar todas las palabras"
+        assert resultado.ganadas == esperados[nombre].ganadas, "Las victorias no dependen del reparto"
+        assert resultado.fallos == esperados[nombre].fallos, "Los fallos no dependen del reparto"
+    assert len(Torneo.tabla_resultados(resultados)) == 3, "La tabla debe tener una línea por estrategia"
+
+def test_estrategia_desconocida():
+    with pytest.raises(ValueError):
+        Torneo.jugar_torneo(["adivina"])